@@ -0,0 +1,47 @@
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.events import broker, format_sse
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+HEARTBEAT_IN_SECOND = 15
+
+
+@router.get(
+    "",
+    summary="以 SSE 即時推送任務狀態與排程 Job 變動",
+)
+async def stream_events(request: Request):
+    queue = broker.subscribe()
+
+    async def event_stream():
+        try:
+            # 斷線後 client 3 秒重連
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), timeout=HEARTBEAT_IN_SECOND
+                    )
+                except asyncio.TimeoutError:
+                    # 定期送出註解行，維持連線並偵測斷線
+                    yield ": keep-alive\n\n"
+                    continue
+
+                # None 代表伺服器關閉
+                if message is None:
+                    break
+
+                yield format_sse(message)
+
+        finally:
+            broker.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.health import health_monitor
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get(
+    "/health",
+    summary="後端健康檢查（DB、排程器、設定監聽、OBS WebSocket）",
+)
+async def get_health():
+    report = await health_monitor.report()
+    status_code = 503 if report["status"] == "down" else 200
+    return JSONResponse(report, status_code=status_code)
@@ -1,18 +1,41 @@
-from typing import List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 
 from app.controllers.dependencies import get_meeting_service
+from app.core.data_version import conditional_get
+from app.core.idempotency import REPLAYED_HEADER, idempotency_cache
+from app.core.responses import PydanticJSONResponse
 from app.models.schemas import (
+    MeetingBulkResponseSchema,
     MeetingCreateSchema,
+    MeetingListAdapter,
+    MeetingPageSchema,
     MeetingQuerySchema,
     MeetingResponseSchema,
+    MeetingSearchQuerySchema,
     MeetingUpdateSchema,
 )
 from app.services.meeting_service import MeetingService
+from shared.config import config
 
 router = APIRouter(prefix="/meeting", tags=["Meetings"])
 
+IdempotencyKeyHeader = Header(
+    None,
+    alias="Idempotency-Key",
+    max_length=128,
+    description="重送時沿用同一個值，伺服器會回傳第一次的結果而不重複執行",
+)
+
+
+def _idempotent_response(
+    meeting: MeetingResponseSchema, replayed: bool, status_code: int
+) -> Response:
+    headers = {REPLAYED_HEADER: "true"} if replayed else None
+    return PydanticJSONResponse(meeting, status_code=status_code, headers=headers)
+
 
 # ----- Create Endpoints -----
 @router.post(
@@ -23,12 +46,69 @@ router = APIRouter(prefix="/meeting", tags=["Meetings"])
 )
 async def create_meeting_endpoint(
     meeting_data: MeetingCreateSchema,
+    idempotency_key: Optional[str] = IdempotencyKeyHeader,
     service: MeetingService = Depends(get_meeting_service),
 ) -> MeetingResponseSchema:
-    return service.create_meeting_and_task(meeting_data)
+    # 逾時重送時帶相同的 Idempotency-Key，直接取回第一次的結果，不會重複建立
+    meeting, replayed = await idempotency_cache.run(
+        idempotency_key,
+        "POST /meeting",
+        meeting_data,
+        lambda: service.create_meeting_and_task(meeting_data),
+    )
+    return _idempotent_response(meeting, replayed, status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/bulk",
+    response_model=MeetingBulkResponseSchema,
+    status_code=status.HTTP_200_OK,
+    summary="批次創建會議，逐筆回報結果",
+)
+async def create_meetings_bulk_endpoint(
+    items: List[dict[str, Any]] = Body(..., min_length=1),
+    service: MeetingService = Depends(get_meeting_service),
+) -> MeetingBulkResponseSchema:
+    # 整批在同一個 transaction 內寫入並佔住 SQLite 寫入鎖，超過上限直接拒絕（可熱重載）
+    max_items = config.MEETING_BULK_MAX_ITEMS
+    if len(items) > max_items:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "too_long",
+                    "loc": ("body",),
+                    "msg": f"一次最多建立 {max_items} 筆會議，收到 {len(items)} 筆，請分批送出。",
+                    "input": None,
+                }
+            ]
+        )
+
+    # 逐筆驗證交給 Service，單筆失敗不會讓整個請求變成 422
+    return await service.create_meetings_bulk(items)
 
 
 # ----- Query Endpoints -----
+@router.get(
+    "/search",
+    response_model=List[MeetingResponseSchema],
+    summary="全文檢索會議（名稱、建立者），依相關度排序",
+)
+async def search_meetings_endpoint(
+    request: Request,
+    params: MeetingSearchQuerySchema = Depends(),
+    service: MeetingService = Depends(get_meeting_service),
+) -> Response:
+    # 必須宣告在 /{meeting_id} 之前，否則 "search" 會被當成 meeting_id 解析
+    etag, not_modified = conditional_get(request)
+    if not_modified:
+        return not_modified
+
+    meetings = await service.search_meetings(params)
+    return PydanticJSONResponse(
+        meetings, adapter=MeetingListAdapter, headers={"ETag": etag}
+    )
+
+
 @router.get(
     "/{meeting_id}",
     response_model=MeetingResponseSchema,
@@ -38,19 +118,27 @@ async def get_meeting_endpoint(
     meeting_id: int, service: MeetingService = Depends(get_meeting_service)
 ) -> MeetingResponseSchema:
     # 若找不到 ID，Service 拋出的 NotFoundError 會自動轉為 404 JSON
-    return service.get_meeting_by_id(meeting_id)
+    return await service.get_meeting_by_id(meeting_id)
 
 
 @router.get(
     "/",
-    response_model=List[MeetingResponseSchema],
-    summary="獲取會議列表（含過濾和分頁）",
+    response_model=MeetingPageSchema,
+    summary="獲取會議列表（含過濾和 keyset 分頁）",
 )
 async def get_meetings(
+    request: Request,
     params: MeetingQuerySchema = Depends(),
     service: MeetingService = Depends(get_meeting_service),
-) -> List[MeetingResponseSchema]:
-    return service.get_meetings(params)
+) -> Response:
+    # 資料未變動時直接回 304，省去查詢與序列化
+    etag, not_modified = conditional_get(request)
+    if not_modified:
+        return not_modified
+
+    # Service 已驗證過，直接序列化回傳，不再經過 response_model 二次驗證
+    page = await service.get_meetings(params)
+    return PydanticJSONResponse(page, headers={"ETag": etag})
 
 
 # ----- Update Endpoints -----
@@ -62,10 +150,16 @@ async def get_meetings(
 async def update_meeting_endpoint(
     meeting_id: int,
     update_data: MeetingUpdateSchema,
+    idempotency_key: Optional[str] = IdempotencyKeyHeader,
     service: MeetingService = Depends(get_meeting_service),
 ) -> MeetingResponseSchema:
-    # 過濾未設定欄位
-    return service.update_meeting(meeting_id, update_data)
+    meeting, replayed = await idempotency_cache.run(
+        idempotency_key,
+        f"PATCH /meeting/{meeting_id}",
+        update_data,
+        lambda: service.update_meeting(meeting_id, update_data),
+    )
+    return _idempotent_response(meeting, replayed, status.HTTP_200_OK)
 
 
 # ----- Delete Endpoints -----
@@ -77,5 +171,5 @@ async def update_meeting_endpoint(
 async def delete_meeting_endpoint(
     meeting_id: int, service: MeetingService = Depends(get_meeting_service)
 ):
-    service.delete_meeting(meeting_id)
+    await service.delete_meeting(meeting_id)
     return None
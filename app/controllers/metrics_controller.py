@@ -0,0 +1,21 @@
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import registry
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus 格式的後端內部指標",
+)
+async def get_metrics():
+    # Gauge callback 會查詢 jobstore（同步 IO），交給 worker thread 執行
+    body = await asyncio.to_thread(registry.render)
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,22 +1,34 @@
+import asyncio
+from datetime import datetime
 from typing import List
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
 from app.controllers.dependencies import get_task_service
-from app.core.database import get_db
+from app.core.data_version import conditional_get
+from app.core.responses import PydanticJSONResponse
 from app.core.scheduler import scheduler
-from app.models import TaskORM
 from app.models.schemas import (
+    TaskExportQuerySchema,
+    TaskListAdapter,
     TaskQuerySchema,
     TaskResponseSchema,
+    TaskStatsQuerySchema,
+    TaskStatsSchema,
     TaskStatusResponseSchema,
     TaskUpdateStatusSchema,
 )
 from app.services.meeting_service import TaskService
+from shared.config import TAIPEI_TZ
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
 
 # ----- Query Endpoints -----
 @router.get(
@@ -25,11 +37,55 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
     summary="獲取任務列表（含過濾和分頁）",
 )
 async def get_tasks_endpoint(
+    request: Request,
     params: TaskQuerySchema = Depends(),
     service: TaskService = Depends(get_task_service),
 ):
-    # 直接回傳結果，錯誤交給全域處理器
-    return service.get_all_tasks(params)
+    etag, not_modified = conditional_get(request)
+    if not_modified:
+        return not_modified
+
+    # 錯誤交給全域處理器；結果已驗證過，直接序列化回傳
+    tasks = await service.get_all_tasks(params)
+    return PydanticJSONResponse(tasks, adapter=TaskListAdapter, headers={"ETag": etag})
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsSchema,
+    summary="任務統計（依狀態、會議類型、日、週分組）",
+)
+async def get_task_stats_endpoint(
+    request: Request,
+    params: TaskStatsQuerySchema = Depends(),
+    service: TaskService = Depends(get_task_service),
+):
+    # 必須宣告在 /{task_id} 之前，否則 "stats" 會被當成 task_id 解析
+    etag, not_modified = conditional_get(request)
+    if not_modified:
+        return not_modified
+
+    stats = await service.get_task_stats(params)
+    return PydanticJSONResponse(stats, headers={"ETag": etag})
+
+
+@router.get(
+    "/export",
+    summary="串流匯出任務歷史（CSV / NDJSON）",
+    response_class=StreamingResponse,
+)
+async def export_tasks_endpoint(
+    params: TaskExportQuerySchema = Depends(),
+    service: TaskService = Depends(get_task_service),
+):
+    media_type = EXPORT_MEDIA_TYPES[params.format]
+    filename = f"tasks_{datetime.now(TAIPEI_TZ):%Y%m%d_%H%M%S}.{params.format}"
+
+    return StreamingResponse(
+        service.export_tasks(params),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -40,7 +96,7 @@ async def get_tasks_endpoint(
 async def get_task_endpoint(
     task_id: int, service: TaskService = Depends(get_task_service)
 ):
-    return service.get_task_by_id(task_id)
+    return await service.get_task_by_id(task_id)
 
 
 # ----- Update Endpoints -----
@@ -54,7 +110,7 @@ async def update_task_status_endpoint(
     update_data: TaskUpdateStatusSchema,
     service: TaskService = Depends(get_task_service),
 ):
-    return service.update_task_status(task_id, update_data.status)
+    return await service.update_task_status(task_id, update_data.status)
 
 
 # ----- Delete Endpoints -----
@@ -66,36 +122,14 @@ async def update_task_status_endpoint(
 async def delete_task_endpoint(
     task_id: int, service: TaskService = Depends(get_task_service)
 ):
-    service.delete_task(task_id)
+    await service.delete_task(task_id)
     return None
 
 
 @router.get("/scheduler/jobs")
-async def list_jobs(db: Session = Depends(get_db)):
+async def list_jobs(service: TaskService = Depends(get_task_service)):
     # 這裡是在後端進程執行，所以能抓到真正的 jobs
-    jobs = scheduler.get_jobs()
-    result = []
-
-    for job in jobs:
-        task_id = int(job.id.split("_")[-1])
-        task = (
-            db.query(TaskORM)
-            .options(joinedload(TaskORM.meeting))
-            .filter(TaskORM.id == task_id)
-            .first()
-        )
-
-        result.append(
-            {
-                "id": job.id,
-                "name": task.meeting.meeting_name if task else "未知會議",
-                "next_run_time": job.next_run_time.strftime("%Y-%m-%d %H:%M")
-                if job.next_run_time
-                else "已暫停",
-            }
-        )
-
-    return result
+    return await service.get_scheduler_jobs()
 
 
 @router.delete(
@@ -104,5 +138,5 @@ async def list_jobs(db: Session = Depends(get_db)):
     summary="根據 job_id 刪除排程任務",
 )
 async def delete_scheduler_job(job_id: str):
-    scheduler.remove_job(job_id)
+    await asyncio.to_thread(scheduler.remove_job, job_id)
     return None
@@ -0,0 +1,128 @@
+"""
+會議 / 任務快照的行程內 read-through 快取
+
+get_meeting_by_id、get_task_by_id，以及 recorder 的 start / end / 每次 monitor 檢查，
+都以相同條件重新查詢同一筆會議與任務。快照是凍結（不可修改）的 response schema，
+可以安全地在 API 請求與排程器 thread 之間共用：
+- LRU + TTL：容量與保存時間由 SNAPSHOT_CACHE_SIZE / SNAPSHOT_CACHE_TTL_IN_SECOND 限制
+- 本行程的寫入：由 app.models.snapshots 的 Session 事件在 commit / rollback 後逐筆失效
+- 其他行程的寫入：由 data_version 的背景輪詢 (watch_external_changes) 發現後清空整個快取，
+  查詢本身不碰檔案，命中時只有一次 dict 查找
+- 命中 / 未命中次數輸出到 /metrics（snapshot_cache_requests_total），供調整容量與 TTL
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Iterable, TypeVar
+
+from app.core.metrics import registry
+from shared.config import config
+
+T = TypeVar("T")
+
+snapshot_cache_requests = registry.counter(
+    "snapshot_cache_requests_total",
+    "Snapshot cache lookups by result (hit / miss)",
+    ("cache", "result"),
+)
+
+
+class SnapshotCache(Generic[T]):
+    def __init__(self, name: str):
+        self.name = name
+        self._entries: OrderedDict[int, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        # 每次失效都遞增；查詢期間發生過失效時，查到的結果不寫入快取
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: int) -> T | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        snapshot_cache_requests.inc(self.name, "miss" if entry is None else "hit")
+        return None if entry is None else entry[1]
+
+    def get_or_load(self, key: int, loader: Callable[[], T | None]) -> T | None:
+        snapshot = self.get(key)
+        if snapshot is None:
+            generation = self.generation
+            snapshot = loader()
+            self.put(key, snapshot, generation)
+        return snapshot
+
+    async def aget_or_load(
+        self, key: int, loader: Callable[[], Awaitable[T | None]]
+    ) -> T | None:
+        snapshot = self.get(key)
+        if snapshot is None:
+            generation = self.generation
+            snapshot = await loader()
+            self.put(key, snapshot, generation)
+        return snapshot
+
+    def put(self, key: int, snapshot: T | None, generation: int | None = None):
+        """generation 為查詢前的值，查詢期間有寫入失效時捨棄，避免存入過期的快照"""
+        if snapshot is None:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (
+                time.monotonic() + config.SNAPSHOT_CACHE_TTL_IN_SECOND,
+                snapshot,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > config.SNAPSHOT_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[int]):
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[T], bool]):
+        with self._lock:
+            self._generation += 1
+            stale = [k for k, (_, snap) in self._entries.items() if predicate(snap)]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+meeting_snapshots = SnapshotCache("meeting")
+task_snapshots = SnapshotCache("task")
+
+
+def clear_snapshots():
+    """其他行程寫入了會議 DB，本行程的快照全部作廢"""
+    meeting_snapshots.clear()
+    task_snapshots.clear()
+
+
+registry.gauge(
+    "snapshot_cache_entries",
+    "Number of snapshots currently cached",
+    ("cache",),
+    callback=lambda: [
+        ((cache.name,), len(cache)) for cache in (meeting_snapshots, task_snapshots)
+    ],
+)
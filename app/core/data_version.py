@@ -0,0 +1,189 @@
+import asyncio
+import atexit
+import itertools
+import logging
+import os
+import threading
+import time
+
+from fastapi import Request, Response, status
+from sqlalchemy import make_url
+
+from shared.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersion:
+    """
+    全域資料版本號：會議或任務資料 commit 後遞增。
+    列表端點以版本號作為 ETag，資料未變動時 GUI 輪詢只會拿到 304。
+
+    多個 API worker（以及 leader 內的 recorder）各自寫入同一個 DB，
+    因此版本號寫在 DB 旁的標記檔，所有行程讀到的都是同一個值；
+    in-memory DB 沒有檔案可放時才退回行程內計數。
+
+    commit 會在 event loop 上觸發 bump，檔案 IO 不在呼叫端進行：
+    - bump 只更新記憶體中的版本號，標記檔由背景 thread 寫入，連續的 bump 合併為一次寫入
+    - 讀取時先比對標記檔的 inode 與 mtime，未變動就沿用上次讀到的內容，只花一次 stat
+    """
+
+    def __init__(self, marker_path: str | None = None):
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._marker_path = marker_path
+        # 每次啟動都不同，避免重啟後版本號歸零與 client 手上的舊 ETag 撞號
+        self._token = f"{time.time_ns():x}-{os.getpid()}-0"
+        # 已寫入標記檔的版本號，與 _token 不同表示還有待寫入的 bump
+        self._written = self._token
+        # 最後看到的外部版本號，以及發現其他行程寫入的次數
+        self._seen: str | None = None
+        self._external_changes = 0
+        # ((st_ino, st_mtime_ns, st_size), 內容)：標記檔未變動時不重新讀取
+        self._marker_cache: tuple[tuple[int, int, int], str] | None = None
+
+        self._flush_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._writer: threading.Thread | None = None
+
+    @property
+    def value(self) -> str:
+        token = self._read_marker()
+        with self._lock:
+            self._observe(token)
+            # 本行程的 bump 尚未寫入標記檔時，以記憶體中的版本號為準
+            return self._token if self._token != self._written else token
+
+    def external_changes(self) -> int:
+        """
+        重新讀取版本號，回傳目前為止偵測到的外部寫入次數。
+        只比對 value 是否為本行程產生並不可靠：外部寫入後緊接著本行程的寫入，
+        版本號又會變回本行程的，因此改由計數判斷兩次檢查之間是否有外部變動。
+        """
+        self.value
+        return self._external_changes
+
+    def bump(self) -> str:
+        # time_ns + pid + 行程內序號，不同行程的寫入不會產生相同的版本號
+        token = f"{time.time_ns():x}-{os.getpid()}-{next(self._counter)}"
+        with self._lock:
+            self._token = token
+            if self._marker_path is None:
+                self._written = token
+                return token
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="data-version-writer", daemon=True
+                )
+                self._writer.start()
+                atexit.register(self.flush)
+
+        self._pending.set()
+        return token
+
+    def flush(self):
+        """把最新的版本號寫入標記檔（背景 thread 與行程結束時呼叫）"""
+        with self._flush_lock:
+            token = self._token
+            if token == self._written:
+                return
+
+            # 覆寫前先確認上次之後是否有其他行程寫入過
+            marker = self._read_marker()
+            with self._lock:
+                self._observe(marker)
+            self._write_marker(token)
+
+            with self._lock:
+                self._written = token
+
+    def is_local(self, token: str) -> bool:
+        """版本號是否由本行程產生（本行程的變動已透過 broker 推送過事件）"""
+        return token.split("-")[1:2] == [str(os.getpid())]
+
+    def etag(self) -> str:
+        return f'W/"{self.value}"'
+
+    def _observe(self, token: str):
+        if token != self._seen and not self.is_local(token):
+            self._external_changes += 1
+            self._seen = token
+
+    def _write_pending(self):
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            self.flush()
+
+    def _read_marker(self) -> str:
+        if self._marker_path is None:
+            return self._token
+        try:
+            stat = os.stat(self._marker_path)
+        except FileNotFoundError:
+            return self._token
+
+        # 標記檔以 os.replace 整個換掉，inode、mtime 或大小任一變動即表示內容變了
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._marker_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(self._marker_path, encoding="ascii") as f:
+                token = f.read().strip() or self._token
+        except FileNotFoundError:
+            return self._token
+        self._marker_cache = (key, token)
+        return token
+
+    def _write_marker(self, token: str):
+        tmp_path = f"{self._marker_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="ascii") as f:
+                f.write(token)
+            os.replace(tmp_path, self._marker_path)
+        except OSError as e:
+            logger.warning(f"Failed to write data version marker: {e}")
+
+
+def _marker_path_for(db_url: str) -> str | None:
+    database = make_url(db_url).database
+    if not database or database == ":memory:":
+        return None
+    return f"{database}.version"
+
+
+data_version = DataVersion(_marker_path_for(config.MEETING_DB_URL))
+
+
+def conditional_get(request: Request) -> tuple[str, Response | None]:
+    """
+    取得目前的 ETag；若 client 的 If-None-Match 相符，另外回傳 304 Response。
+    必須在查詢資料「之前」呼叫，確保 ETag 不會比回傳的資料新。
+    """
+    etag = data_version.etag()
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return etag, Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    return etag, None
+
+
+async def watch_external_changes(on_change, interval: float = 1.0):
+    """
+    其他行程（其他 worker、leader 中的 recorder）的寫入不會經過本行程的 broker，
+    定期檢查版本號，發現外部變動時呼叫 on_change（例如推送 resync 給 SSE client）。
+    """
+    last = data_version.external_changes()
+    while True:
+        await asyncio.sleep(interval)
+        current = data_version.external_changes()
+        if current != last:
+            last = current
+            on_change()
@@ -1,10 +1,27 @@
 import logging
-from datetime import datetime
-from typing import Generator
+import os
+import sys
+import time
+from datetime import date, datetime
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import DateTime, TypeDecorator, create_engine, func
+import greenlet
+from sqlalchemy import (
+    DateTime,
+    Engine,
+    String,
+    TypeDecorator,
+    create_engine,
+    event,
+    func,
+    make_url,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 
+from app.core.data_version import data_version
+from app.core.metrics import db_query_duration
+from app.core.timing import request_timing
 from shared.config import TAIPEI_TZ, config
 
 
@@ -26,6 +43,24 @@ class TZDateTime(TypeDecorator):
             value = value.replace(tzinfo=TAIPEI_TZ)
         return value
 
+
+class DateList(TypeDecorator):
+    """日期清單，以排序後的 ISO 日期逗號分隔存放（例：2026-10-20,2026-11-03）"""
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if not value:
+            return None
+        return ",".join(day.isoformat() for day in sorted(set(value)))
+
+    def process_result_value(self, value, dialect) -> list[date]:
+        if not value:
+            return []
+        return [date.fromisoformat(day) for day in value.split(",")]
+
+
 db_logger = logging.getLogger(__name__)
 
 
@@ -36,23 +71,93 @@ class Base(DeclarativeBase):
     )
 
 
+# ----- SQLite Storage Profile -----
+# 排程器 thread、monitor 與 API 請求會同時寫入，預設的 rollback journal 且不等待鎖定，
+# 在錄影開始 / 結束的尖峰容易出現 "database is locked"。
+# 每條新連線建立時套用下列 PRAGMA（讀取當下的 config，reload 後新連線即生效）。
+
+
+def _sqlite_pragmas() -> dict[str, str | int]:
+    # busy_timeout 必須最先設定，切換 journal_mode 時才會等待其他連線釋放鎖定
+    return {
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_IN_MS,
+        "journal_mode": config.SQLITE_JOURNAL_MODE,
+        "synchronous": config.SQLITE_SYNCHRONOUS,
+        "cache_size": -config.SQLITE_CACHE_SIZE_IN_KB,  # 負值代表 KiB
+        "mmap_size": config.SQLITE_MMAP_SIZE_IN_MB * 1024 * 1024,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in _sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+    finally:
+        cursor.close()
+
+
+def _is_sqlite_url(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _pool_options(url: str) -> dict:
+    """in-memory SQLite 使用單一連線的 pool，不接受連線池大小設定"""
+    database = make_url(url).database
+    if _is_sqlite_url(url) and (not database or database == ":memory:"):
+        return {}
+    return {
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT_IN_SECOND,
+    }
+
+
 def create_db_resources(url: str, db_name: str):
     # db_logger.debug(f"Initializing {db_name} DB engine.")
 
-    def is_sqlite_url(url: str) -> bool:
-        return url.lower().startswith("sqlite")
-
     engine = create_engine(
-        url, connect_args={"check_same_thread": False} if is_sqlite_url(url) else {}
+        url,
+        connect_args={"check_same_thread": False} if _is_sqlite_url(url) else {},
+        **_pool_options(url),
     )
+    if _is_sqlite_url(url):
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
 
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     # db_logger.debug(f"{db_name} Engine initialized.")
     return engine, SessionLocal
 
 
+def to_async_url(url: str) -> str:
+    """將同步連線字串轉為 async driver，例：sqlite:/// -> sqlite+aiosqlite:///"""
+    sa_url = make_url(url)
+    if sa_url.drivername == "sqlite":
+        sa_url = sa_url.set(drivername="sqlite+aiosqlite")
+    return sa_url.render_as_string(hide_password=False)
+
+
+def create_async_db_resources(url: str, db_name: str):
+    """
+    API 請求使用的 async engine，避免 SQLAlchemy 查詢阻塞 uvicorn 的 event loop。
+    expire_on_commit=False：commit 後仍可直接讀取 ORM 屬性，不會觸發隱式 IO。
+    """
+    engine = create_async_engine(to_async_url(url), **_pool_options(url))
+    if _is_sqlite_url(url):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+    AsyncSessionLocal = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+    return engine, AsyncSessionLocal
+
+
 database_engine, SessionLocal = create_db_resources(config.MEETING_DB_URL, "Meeting")
 
+async_database_engine, AsyncSessionLocal = create_async_db_resources(
+    config.MEETING_DB_URL, "Meeting"
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -69,9 +174,120 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+
+        except Exception:
+            await db.rollback()
+            db_logger.error("Meeting DB Transaction Error", exc_info=True)
+            raise
+
+
+# ----- Data Version Tracking -----
+# 掛在 Session 類別上，API 的 AsyncSession 與 recorder 的同步 Session 都會觸發。
+# 只有真的 flush 過資料的 transaction，commit 後才遞增版本號。
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_data_changed(session: Session, flush_context):
+    session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_version(session: Session):
+    if session.info.pop("data_changed", False):
+        data_version.bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_data_changed(session: Session):
+    session.info.pop("data_changed", None)
+
+
+# ----- Query Metrics -----
+# 掛在 Engine 類別上，涵蓋會議 DB（同步 / async）與排程器 jobstore 的所有語句。
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _observe_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    database = os.path.basename(conn.engine.url.database or "") or "memory"
+    db_query_duration.observe(elapsed, database, operation)
+
+    timing = request_timing.get()
+    if timing is not None:
+        timing.add_query(database, elapsed)
+
+    if elapsed * 1000 >= config.SLOW_QUERY_THRESHOLD_IN_MS:
+        _log_slow_query(database, elapsed, statement, parameters, executemany)
+
+
+# 只在慢查詢時才走訪 stack，正常查詢沒有額外成本
+_CALLER_MODULE_PREFIXES = ("app.services", "app.recorder", "app.controllers")
+_MAX_PARAMS_LENGTH = 500
+
+
+def _log_slow_query(database, elapsed, statement, parameters, executemany):
+    if executemany and parameters:
+        params_text = f"{len(parameters)} rows, first={parameters[0]!r}"
+    else:
+        params_text = repr(parameters)
+    if len(params_text) > _MAX_PARAMS_LENGTH:
+        params_text = params_text[:_MAX_PARAMS_LENGTH] + "..."
+
+    db_logger.warning(
+        f"Slow query {elapsed * 1000:.1f}ms on {database} from {_find_caller()}\n"
+        f"{' '.join(statement.split())}\nparams: {params_text}"
+    )
+
+
+def _iter_caller_frames():
+    frame = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+    # async engine 的語句在 greenlet 中執行，Service 的 frame 在暫停中的父 greenlet 上
+    parent = greenlet.getcurrent().parent
+    frame = getattr(parent, "gr_frame", None)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def _find_caller() -> str:
+    for frame in _iter_caller_frames():
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_CALLER_MODULE_PREFIXES):
+            name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
+            return f"{module}.{name}:{frame.f_lineno}"
+    return "unknown"
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
 def initialize_db_schema():
     # db_logger.info("Initializing database schemas...")
 
     Base.metadata.create_all(bind=database_engine)
 
+    # create_all 不會變更既有的資料表，索引等結構變更交由版本化 migration 補上
+    from app.core.migrations import run_migrations
+
+    run_migrations(database_engine)
+
     # db_logger.info("Database schemas created successfully.")
@@ -0,0 +1,106 @@
+"""
+即時事件推送
+
+- EventBroker: 行程內的 pub/sub，將事件分送給每個 /events 串流連線
+- publish() 可在任何線程呼叫（scheduler 執行緒、recorder、API），
+  實際投遞一律交回 uvicorn 的 event loop 執行
+
+事件類型：
+- task_created / task_status / task_deleted: 任務狀態變動
+- job_added / job_modified / job_removed / all_jobs_removed: 排程器 Job 變動
+- resync: client 消化太慢導致事件被丟棄，需重新整理
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class EventBroker:
+    def __init__(self, queue_size: int = 256):
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """lifespan 啟動時綁定 uvicorn 的 event loop"""
+        self._loop = loop
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        with self._lock:
+            self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: dict[str, Any]):
+        """發布事件，沒有任何訂閱者時直接略過"""
+        loop = self._loop
+        if not self._subscribers or loop is None or loop.is_closed():
+            return
+
+        message = {"id": next(self._sequence), "event": event, "data": data}
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            self._dispatch(message)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, message)
+
+    def close(self):
+        """通知所有串流結束，避免關閉伺服器時連線卡住"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for queue in subscribers:
+            self._force_put(queue, None)
+
+    def _dispatch(self, message: dict):
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for queue in subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # client 跟不上：清空積壓事件，改送 resync 要求整頁重新載入
+                logger.warning("Event queue full, asking subscriber to resync.")
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"id": message["id"], "event": "resync", "data": {}})
+
+    @staticmethod
+    def _force_put(queue: asyncio.Queue, item):
+        """放入 item，佇列已滿時丟棄最舊的事件"""
+        while True:
+            try:
+                queue.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                queue.get_nowait()
+
+
+def format_sse(message: dict) -> str:
+    data = json.dumps(message["data"], ensure_ascii=False, default=str)
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {data}\n\n"
+
+
+broker = EventBroker()
@@ -27,6 +27,16 @@ class ActionError(BaseError):
 
 
 class TaskOverlapError(BaseError):
+    def __init__(self, detail: str, conflicts: list[str] | None = None):
+        super().__init__(detail)
+        self.conflicts = conflicts or [detail]
+
+
+class InvalidQueryError(BaseError):
+    pass
+
+
+class IdempotencyKeyError(BaseError):
     pass
 
 def register_exception_handlers(app: FastAPI):
@@ -44,10 +54,28 @@ def register_exception_handlers(app: FastAPI):
             status_code=400, content={"error": "排程失敗", "detail": exc.detail}
         )
 
+    @app.exception_handler(InvalidQueryError)
+    async def invalid_query_handler(request: Request, exc: InvalidQueryError):
+        return JSONResponse(
+            status_code=400, content={"error": "查詢參數錯誤", "detail": exc.detail}
+        )
+
+    @app.exception_handler(IdempotencyKeyError)
+    async def idempotency_key_handler(request: Request, exc: IdempotencyKeyError):
+        return JSONResponse(
+            status_code=422,
+            content={"error": "Idempotency-Key 使用錯誤", "detail": exc.detail},
+        )
+
     @app.exception_handler(TaskOverlapError)
     async def task_overlap_handler(request: Request, exc: TaskOverlapError):
         return JSONResponse(
-            status_code=409, content={"error": "任務時間重疊", "detail": exc.detail}
+            status_code=409,
+            content={
+                "error": "任務時間重疊",
+                "detail": exc.detail,
+                "conflicts": exc.conflicts,
+            },
         )
 
     @app.exception_handler(Exception)
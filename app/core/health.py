@@ -0,0 +1,118 @@
+"""
+/health 子系統檢查
+
+每項檢查的結果快取 HEALTH_CHECK_TTL_IN_SECOND 秒：快取有效時直接回傳，
+過期時才在 worker thread 重新執行（同一項檢查同時只會執行一次）。
+critical 的檢查失敗時整體狀態為 down (HTTP 503)，其餘失敗僅標記為 degraded。
+"""
+
+import asyncio
+import logging
+import socket
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import text
+
+from app.core.database import database_engine
+from app.core.scheduler import scheduler, scheduler_leader
+from shared.config import TAIPEI_TZ, config
+
+logger = logging.getLogger(__name__)
+
+# 檢查函式回傳 (是否正常, 說明)，拋出例外視為失敗
+CheckFunc = Callable[[], tuple[bool, str]]
+
+
+@dataclass
+class HealthCheck:
+    name: str
+    func: CheckFunc
+    critical: bool = True
+    ok: bool = False
+    detail: str = "尚未檢查"
+    checked_at: datetime | None = None
+    expires_at: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def to_dict(self) -> dict:
+        return {
+            "ok": self.ok,
+            "critical": self.critical,
+            "detail": self.detail,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+        }
+
+
+class HealthMonitor:
+    def __init__(self):
+        self._checks: dict[str, HealthCheck] = {}
+
+    def register(self, name: str, func: CheckFunc, critical: bool = True):
+        self._checks[name] = HealthCheck(name=name, func=func, critical=critical)
+
+    async def report(self) -> dict:
+        await asyncio.gather(*(self._refresh(check) for check in self._checks.values()))
+
+        checks = {name: check.to_dict() for name, check in self._checks.items()}
+        if any(not c.ok and c.critical for c in self._checks.values()):
+            status = "down"
+        elif any(not c.ok for c in self._checks.values()):
+            status = "degraded"
+        else:
+            status = "ok"
+
+        return {"status": status, "checks": checks}
+
+    async def _refresh(self, check: HealthCheck):
+        if time.monotonic() < check.expires_at:
+            return
+
+        async with check.lock:
+            # 等待 lock 期間可能已被其他請求更新
+            if time.monotonic() < check.expires_at:
+                return
+
+            try:
+                check.ok, check.detail = await asyncio.to_thread(check.func)
+            except Exception as e:
+                check.ok, check.detail = False, str(e) or e.__class__.__name__
+                logger.warning(f"Health check '{check.name}' failed: {check.detail}")
+
+            check.checked_at = datetime.now(TAIPEI_TZ)
+            check.expires_at = time.monotonic() + config.HEALTH_CHECK_TTL_IN_SECOND
+
+
+# ----- Checks -----
+
+
+def check_database() -> tuple[bool, str]:
+    with database_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    return True, "可連線"
+
+
+def check_scheduler() -> tuple[bool, str]:
+    if not scheduler.running:
+        return False, "未運行"
+    if scheduler_leader.is_leader:
+        return True, "運行中 (leader)"
+    return True, "待命中 (由其他 worker 執行 Job)"
+
+
+def check_obs_websocket() -> tuple[bool, str]:
+    """只確認 OBS WebSocket 連接埠可連線，OBS 只在錄影期間啟動，因此非 critical"""
+    port = config.OBS_WEBSOCKET_PORT
+    try:
+        with socket.create_connection(("localhost", port), timeout=0.5):
+            return True, f"localhost:{port} 可連線"
+    except OSError:
+        return False, f"localhost:{port} 無法連線"
+
+
+health_monitor = HealthMonitor()
+health_monitor.register("database", check_database)
+health_monitor.register("scheduler", check_scheduler)
+health_monitor.register("obs_websocket", check_obs_websocket, critical=False)
@@ -0,0 +1,109 @@
+"""
+Idempotency-Key 支援
+
+GUI 在請求逾時後重送時，伺服器可能早已 commit 完成。帶相同 Idempotency-Key 的重送：
+- 原請求已完成：直接回傳當時的結果，不再執行一次
+- 原請求仍在處理：等待它完成後回傳同一份結果
+- 原請求失敗：不快取，重送會重新執行
+同一個 key 搭配不同的請求內容時回傳 422，避免誤用。
+
+快取只存在於目前行程，容量與保存時間分別由
+IDEMPOTENCY_CACHE_SIZE 與 IDEMPOTENCY_TTL_IN_SECOND 限制。
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+from app.core.exceptions import IdempotencyKeyError
+from shared.config import config
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    future: asyncio.Future
+    expires_at: float = float("inf")  # 完成前不會過期
+
+
+class IdempotencyCache:
+    def __init__(self):
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    async def run(
+        self,
+        key: str | None,
+        scope: str,
+        payload: BaseModel,
+        func: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """
+        執行 func 或回傳先前的結果。回傳 (結果, 是否為重送)。
+        只在 event loop 中呼叫，不需要額外的 lock。
+        """
+        if not key:
+            return await func(), False
+
+        self._evict()
+        cache_key = f"{scope}:{key}"
+        fingerprint = self._fingerprint(payload)
+
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                raise IdempotencyKeyError(
+                    detail=f"Idempotency-Key {key} 已被用於不同的請求內容"
+                )
+            self._entries.move_to_end(cache_key)
+            # shield: 重送的連線中斷時不影響原請求
+            return await asyncio.shield(entry.future), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries[cache_key] = _Entry(fingerprint=fingerprint, future=future)
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self._entries.pop(cache_key, None)
+            future.cancel()
+            raise
+        except Exception as e:
+            # 失敗不快取：讓等待中的重送收到同樣的錯誤，之後的重送重新執行
+            self._entries.pop(cache_key, None)
+            future.set_exception(e)
+            future.exception()  # 沒有人等待時避免 "exception was never retrieved"
+            raise
+
+        future.set_result(result)
+        self._entries[cache_key].expires_at = (
+            time.monotonic() + config.IDEMPOTENCY_TTL_IN_SECOND
+        )
+        self._evict()
+        return result, False
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+
+        # 超過容量時從最舊的已完成項目開始移除，處理中的請求保留
+        overflow = len(self._entries) - config.IDEMPOTENCY_CACHE_SIZE
+        for k in [k for k, e in self._entries.items() if e.future.done()][:overflow]:
+            del self._entries[k]
+
+    @staticmethod
+    def _fingerprint(payload: BaseModel) -> str:
+        body = json.dumps(payload.model_dump(mode="json"), sort_keys=True)
+        return hashlib.sha256(body.encode()).hexdigest()
+
+
+idempotency_cache = IdempotencyCache()
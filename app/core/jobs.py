@@ -0,0 +1,54 @@
+"""
+排程 Job 的進入點 (trampoline)
+
+錄影流程依賴 obsws_python、pyautogui、pywinauto、win32 等桌面自動化套件，
+載入成本高且 API 本身完全用不到。Job 一律以本模組的文字參照註冊：
+- APScheduler 在 add_job / 從 jobstore 還原 Job 時只會 import 這個輕量模組
+- 真正的 recorder 模組延遲到 Job 被執行時才 import
+"""
+
+START_RECORDING = "app.core.jobs:start_recording"
+END_RECORDING = "app.core.jobs:end_recording"
+MONITOR_RECORDING = "app.core.jobs:monitor_recording"
+ROLLOVER_RECURRENCES = "app.core.jobs:rollover_recurrences"
+
+ROLLOVER_JOB_ID = "recurrence_rollover"
+
+# jobstore 只儲存 Job 種類，func 參照由此對照表還原（見 app.core.jobstore）
+JOB_KINDS = {
+    "start": START_RECORDING,
+    "end": END_RECORDING,
+    "monitor": MONITOR_RECORDING,
+    "rollover": ROLLOVER_RECURRENCES,
+}
+
+# 舊版直接以 recorder 函式註冊的 Job，啟動時改寫為對應的 trampoline
+LEGACY_FUNC_REFS = {
+    "app.recorder.recorder:start_recording": START_RECORDING,
+    "app.recorder.recorder:end_recording": END_RECORDING,
+    "app.recorder.monitor_service:monitor_recording": MONITOR_RECORDING,
+}
+
+
+def start_recording(task_id: int):
+    from app.recorder.recorder import start_recording as run
+
+    return run(task_id)
+
+
+def end_recording(task_id: int):
+    from app.recorder.recorder import end_recording as run
+
+    return run(task_id)
+
+
+def monitor_recording(task_id: int):
+    from app.recorder.monitor_service import monitor_recording as run
+
+    return run(task_id)
+
+
+def rollover_recurrences():
+    from app.services.task_service import rollover_recurring_meetings as run
+
+    return run()
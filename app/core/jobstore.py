@@ -0,0 +1,427 @@
+"""
+錄影排程專用的 jobstore
+
+APScheduler 內建的 SQLAlchemyJobStore 把整個 Job（func 參照、args、trigger）pickle 成一個 BLOB：
+get_jobs / get_due_jobs 都要逐筆 unpickle，monitor 這類 interval Job 每次觸發也要重寫整個 BLOB。
+本系統的 Job 只有固定幾種（app.core.jobs.JOB_KINDS），func 與 args 都能由種類與 task_id 推回，
+因此每個 Job 只儲存：
+- kind / task_id：Job 種類與任務 ID
+- run_at：下次執行時間（UTC timestamp），due job 查詢是此索引上的範圍掃描；暫停時為 NULL
+- state：trigger 參數與 name、misfire_grace_time 等屬性，以精簡的 JSON 儲存（不 pickle）
+讀取時依種類對照表重建 Job；列表與 metrics 直接查詢欄位，不需重建 Job。
+"""
+
+import json
+import logging
+import pickle
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Iterable, NamedTuple
+
+from apscheduler.job import Job
+from apscheduler.jobstores.base import BaseJobStore, ConflictingIdError, JobLookupError
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.util import datetime_to_utc_timestamp, utc_timestamp_to_datetime
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    Float,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.core.jobs import JOB_KINDS
+
+logger = logging.getLogger(__name__)
+
+KIND_BY_FUNC = {func_ref: kind for kind, func_ref in JOB_KINDS.items()}
+
+
+class JobEntry(NamedTuple):
+    """不重建 Job 的列表資料"""
+
+    id: str
+    kind: str
+    task_id: int | None
+    next_run_time: datetime | None
+    name: str | None
+
+
+# ----- Trigger <-> JSON -----
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _from_iso(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _dump_tz(tz: tzinfo) -> str | dict[str, float]:
+    """
+    有名稱的時區存名稱，還原時交給 APScheduler 的 astimezone；
+    固定時差（例如 timezone(timedelta(hours=8))）存為 {"offset": 秒數}。
+    沒有名稱又有日光節約的時區（例如 ZoneInfo.from_file）無法還原，拋出 ValueError。
+    """
+    key = getattr(tz, "key", None)
+    if key:
+        return key
+
+    offset = tz.utcoffset(None)
+    if offset is None:
+        raise ValueError(f"Trigger timezone {tz!r} has no name and cannot be stored.")
+    if offset == timedelta(0):
+        return "UTC"
+    return {"offset": offset.total_seconds()}
+
+
+def _load_tz(value: str | dict[str, float]) -> str | tzinfo:
+    if isinstance(value, dict):
+        return timezone(timedelta(seconds=value["offset"]))
+    return value
+
+
+def _dump_trigger(trigger: BaseTrigger) -> dict[str, Any]:
+    if isinstance(trigger, DateTrigger):
+        return {"type": "date", "run_date": _iso(trigger.run_date)}
+
+    if isinstance(trigger, IntervalTrigger):
+        return {
+            "type": "interval",
+            "seconds": trigger.interval.total_seconds(),
+            "start_date": _iso(trigger.start_date),
+            "end_date": _iso(trigger.end_date),
+            "timezone": _dump_tz(trigger.timezone),
+            "jitter": trigger.jitter,
+        }
+
+    if isinstance(trigger, CronTrigger):
+        return {
+            "type": "cron",
+            "fields": {f.name: str(f) for f in trigger.fields if not f.is_default},
+            "start_date": _iso(trigger.start_date),
+            "end_date": _iso(trigger.end_date),
+            "timezone": _dump_tz(trigger.timezone),
+            "jitter": trigger.jitter,
+        }
+
+    raise ValueError(f"Unsupported trigger type: {type(trigger).__name__}")
+
+
+def _load_trigger(data: dict[str, Any]) -> BaseTrigger:
+    if data["type"] == "date":
+        run_date = _from_iso(data["run_date"])
+        return DateTrigger(run_date, timezone=run_date.tzinfo)
+
+    if data["type"] == "interval":
+        return IntervalTrigger(
+            seconds=data["seconds"],
+            start_date=_from_iso(data["start_date"]),
+            end_date=_from_iso(data["end_date"]),
+            timezone=_load_tz(data["timezone"]),
+            jitter=data["jitter"],
+        )
+
+    return CronTrigger(
+        **data["fields"],
+        start_date=_from_iso(data["start_date"]),
+        end_date=_from_iso(data["end_date"]),
+        timezone=_load_tz(data["timezone"]),
+        jitter=data["jitter"],
+    )
+
+
+class CompactJobStore(BaseJobStore):
+    """
+    以具型別欄位儲存 Job 的 jobstore，並支援在單一 / 呼叫端的 transaction 內批次寫入。
+    只接受 JOB_KINDS 中的 func、最多一個 args (task_id)、沒有 kwargs 的 Job。
+    owns_engine：engine 專屬於此 jobstore 時為 True，shutdown 才會 dispose；
+    與會議 DB 共用的 engine 由 app.core.database 管理
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        tablename: str = "scheduler_jobs",
+        owns_engine: bool = False,
+    ):
+        super().__init__()
+        self.engine = engine
+        self._owns_engine = owns_engine
+        self.jobs_t = Table(
+            tablename,
+            MetaData(),
+            Column("id", String(191), primary_key=True),
+            Column("kind", String(20), nullable=False),
+            Column("task_id", Integer, nullable=True),
+            Column("run_at", Float(25), nullable=True, index=True),
+            Column("state", Text, nullable=False),
+        )
+
+    def start(self, scheduler, alias):
+        super().start(scheduler, alias)
+        self.jobs_t.create(self.engine, checkfirst=True)
+
+    # ----- Job <-> Row -----
+    def _row_from_state(self, state: dict[str, Any]) -> dict[str, Any]:
+        """由 Job.__getstate__() 格式的 dict 產生資料列，不支援的 Job 拋出 ValueError"""
+        kind = KIND_BY_FUNC.get(state["func"])
+        args = tuple(state["args"])
+        if kind is None or len(args) > 1 or state["kwargs"]:
+            raise ValueError(
+                f"Job '{state['id']}' ({state['func']}) cannot be stored in "
+                + f"{self.__class__.__name__}: only {', '.join(JOB_KINDS)} jobs are supported."
+            )
+
+        return {
+            "id": state["id"],
+            "kind": kind,
+            "task_id": args[0] if args else None,
+            "run_at": datetime_to_utc_timestamp(state["next_run_time"]),
+            "state": json.dumps(
+                {
+                    "trigger": _dump_trigger(state["trigger"]),
+                    "name": state["name"],
+                    "misfire_grace_time": state["misfire_grace_time"],
+                    "coalesce": state["coalesce"],
+                    "max_instances": state["max_instances"],
+                    "executor": state["executor"],
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ),
+        }
+
+    def _job_rows(self, jobs: Iterable[Job]) -> list[dict[str, Any]]:
+        return [self._row_from_state(job.__getstate__()) for job in jobs]
+
+    def _reconstitute_job(self, row) -> Job:
+        data = json.loads(row.state)
+        job = Job.__new__(Job)
+        job.__setstate__(
+            {
+                "version": 1,
+                "id": row.id,
+                "func": JOB_KINDS[row.kind],
+                "trigger": _load_trigger(data["trigger"]),
+                "executor": data["executor"],
+                "args": (row.task_id,) if row.task_id is not None else (),
+                "kwargs": {},
+                "name": data["name"],
+                "misfire_grace_time": data["misfire_grace_time"],
+                "coalesce": data["coalesce"],
+                "max_instances": data["max_instances"],
+                "next_run_time": self._local_time(row.run_at),
+            }
+        )
+        job._scheduler = self._scheduler
+        job._jobstore_alias = self._alias
+        return job
+
+    def _local_time(self, run_at: float | None) -> datetime | None:
+        """與 pickle 保存的 Job 一致，以排程器的時區表示"""
+        next_run_time = utc_timestamp_to_datetime(run_at)
+        if next_run_time is None:
+            return None
+        return next_run_time.astimezone(self._scheduler.timezone)
+
+    def _get_jobs(self, *conditions) -> list[Job]:
+        jobs = []
+        failed_job_ids = set()
+        stmt = select(self.jobs_t).where(*conditions).order_by(self.jobs_t.c.run_at)
+
+        with self.engine.begin() as connection:
+            for row in connection.execute(stmt):
+                try:
+                    jobs.append(self._reconstitute_job(row))
+                except Exception:
+                    self._logger.exception(
+                        f'Unable to restore job "{row.id}" -- removing it'
+                    )
+                    failed_job_ids.add(row.id)
+
+            if failed_job_ids:
+                self.remove_jobs(list(failed_job_ids), connection)
+
+        return jobs
+
+    # ----- BaseJobStore -----
+    def lookup_job(self, job_id: str) -> Job | None:
+        with self.engine.connect() as connection:
+            row = connection.execute(
+                select(self.jobs_t).where(self.jobs_t.c.id == job_id)
+            ).first()
+        return self._reconstitute_job(row) if row else None
+
+    def get_due_jobs(self, now: datetime) -> list[Job]:
+        return self._get_jobs(self.jobs_t.c.run_at <= datetime_to_utc_timestamp(now))
+
+    def get_next_run_time(self) -> datetime | None:
+        with self.engine.connect() as connection:
+            run_at = connection.scalar(select(func.min(self.jobs_t.c.run_at)))
+        return utc_timestamp_to_datetime(run_at)
+
+    def get_all_jobs(self) -> list[Job]:
+        jobs = self._get_jobs()
+        self._fix_paused_jobs_sorting(jobs)
+        return jobs
+
+    def add_job(self, job: Job):
+        self.add_jobs([job])
+
+    def update_job(self, job: Job):
+        row = self._row_from_state(job.__getstate__())
+        with self.engine.begin() as connection:
+            result = connection.execute(
+                self.jobs_t.update()
+                .where(self.jobs_t.c.id == job.id)
+                .values(run_at=row["run_at"], state=row["state"])
+            )
+            if result.rowcount == 0:
+                raise JobLookupError(job.id)
+
+    def remove_job(self, job_id: str):
+        with self.engine.begin() as connection:
+            result = connection.execute(
+                self.jobs_t.delete().where(self.jobs_t.c.id == job_id)
+            )
+            if result.rowcount == 0:
+                raise JobLookupError(job_id)
+
+    def remove_all_jobs(self):
+        with self.engine.begin() as connection:
+            connection.execute(self.jobs_t.delete())
+
+    def shutdown(self):
+        if self._owns_engine:
+            self.engine.dispose()
+
+    # ----- 批次寫入 -----
+    def add_jobs(self, jobs: list[Job], connection: Connection | None = None):
+        """connection 有值時寫入呼叫端的 transaction，由呼叫端負責 commit"""
+        rows = self._job_rows(jobs)
+
+        if connection is None:
+            with self.engine.begin() as connection:
+                self._insert_rows(connection, rows)
+        else:
+            self._insert_rows(connection, rows)
+
+    def _insert_rows(self, connection: Connection, rows: list[dict[str, Any]]):
+        try:
+            connection.execute(self.jobs_t.insert(), rows)
+        except IntegrityError as e:
+            raise ConflictingIdError(", ".join(row["id"] for row in rows)) from e
+
+    def replace_jobs(self, jobs: list[Job], connection: Connection | None = None):
+        """以新的 Job 覆蓋同 id 的 Job（不存在時直接新增），connection 的用法同 add_jobs"""
+        rows = self._job_rows(jobs)
+
+        if connection is None:
+            with self.engine.begin() as connection:
+                self.remove_jobs([row["id"] for row in rows], connection)
+                self._insert_rows(connection, rows)
+        else:
+            self.remove_jobs([row["id"] for row in rows], connection)
+            self._insert_rows(connection, rows)
+
+    def remove_jobs(self, job_ids: list[str], connection: Connection):
+        """在呼叫端的 transaction 內刪除 Job，不存在的 id 直接略過"""
+        connection.execute(self.jobs_t.delete().where(self.jobs_t.c.id.in_(job_ids)))
+
+    # ----- 不重建 Job 的查詢 -----
+    def list_jobs(self) -> list[JobEntry]:
+        """依下次執行時間排序（暫停的排在最後），name 只從 JSON 讀出，不還原 trigger"""
+        stmt = select(self.jobs_t).order_by(
+            self.jobs_t.c.run_at.is_(None), self.jobs_t.c.run_at
+        )
+        with self.engine.connect() as connection:
+            rows = connection.execute(stmt).all()
+
+        return [
+            JobEntry(
+                id=row.id,
+                kind=row.kind,
+                task_id=row.task_id,
+                next_run_time=utc_timestamp_to_datetime(row.run_at),
+                name=json.loads(row.state)["name"],
+            )
+            for row in rows
+        ]
+
+    def count_by_kind(self) -> dict[str, int]:
+        stmt = select(self.jobs_t.c.kind, func.count()).group_by(self.jobs_t.c.kind)
+        with self.engine.connect() as connection:
+            return dict(connection.execute(stmt).all())
+
+    # ----- 舊版 jobstore 轉換 -----
+    def import_pickled_jobs(
+        self,
+        tablename: str = "apscheduler_jobs",
+        func_refs: dict[str, str] | None = None,
+    ) -> int:
+        """
+        將 SQLAlchemyJobStore 資料表中的 Job 搬到本 jobstore（只在升級時執行一次，
+        之後舊資料表為空）。func_refs 用來改寫舊的 func 參照；無法轉換的 Job 保留在舊表並記錄。
+        回傳搬移的 Job 數量。
+        """
+        if not inspect(self.engine).has_table(tablename):
+            return 0
+
+        self.jobs_t.create(self.engine, checkfirst=True)
+        legacy_t = Table(
+            tablename,
+            MetaData(),
+            Column("id", String(191), primary_key=True),
+            Column("next_run_time", Float(25)),
+            Column("job_state", LargeBinary, nullable=False),
+        )
+
+        try:
+            with self.engine.begin() as connection:
+                rows = []
+                for job_id, job_state in connection.execute(
+                    select(legacy_t.c.id, legacy_t.c.job_state)
+                ):
+                    state = pickle.loads(job_state)
+                    state["func"] = (func_refs or {}).get(state["func"], state["func"])
+                    try:
+                        rows.append(self._row_from_state(state))
+                    except ValueError as e:
+                        logger.warning(f"Skipped legacy job {job_id}: {e}")
+
+                if not rows:
+                    return 0
+
+                ids = [row["id"] for row in rows]
+                existing = set(
+                    connection.scalars(
+                        select(self.jobs_t.c.id).where(self.jobs_t.c.id.in_(ids))
+                    )
+                )
+                new_rows = [row for row in rows if row["id"] not in existing]
+                if new_rows:
+                    connection.execute(self.jobs_t.insert(), new_rows)
+                connection.execute(legacy_t.delete().where(legacy_t.c.id.in_(ids)))
+
+        except OperationalError as e:
+            # 多個 worker 同時啟動時，由搶到寫入鎖的 worker 完成搬移
+            logger.warning(f"Legacy job import skipped: {e}")
+            return 0
+
+        return len(new_rows)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} (url={self.engine.url})>"
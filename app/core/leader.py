@@ -0,0 +1,216 @@
+"""
+排程器 leader 選舉（DB lease）
+
+多個 API worker 同時運行時，只有持有 lease 的行程會執行 Job：
+- 所有 worker 都以 paused 狀態啟動排程器，add/remove Job 直接寫入共用的 jobstore
+- 取得 lease 的行程 resume 排程器，並定期 wakeup，讓其他 worker 寫入的 Job 也能被及時處理
+- leader 每 SCHEDULER_LEASE_RENEW_IN_SECOND 秒續約；停止續約超過
+  SCHEDULER_LEASE_TTL_IN_SECOND 秒後，其他 worker 即可接手
+- 無法續約（例如 DB 暫時無法寫入）時，在 lease 到期前主動 pause，避免兩個 leader 同時執行：
+  續約可能卡在 busy_timeout，因此剩餘時間不足以再續約一次（續約間隔 + busy_timeout）就退位；
+  另有不經過 DB 的計時器在 lease 到期前觸發，續約呼叫本身阻塞時也能及時 pause
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from apscheduler.schedulers.base import BaseScheduler
+from sqlalchemy import (
+    Column,
+    Engine,
+    Float,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+
+from shared.config import config
+
+logger = logging.getLogger(__name__)
+
+# 計時器在 lease 到期前多久主動退位（秒），TTL 很短時改用 TTL 的 1/10
+EXPIRY_MARGIN_IN_SECOND = 1.0
+
+_metadata = MetaData()
+
+lease_table = Table(
+    "scheduler_lease",
+    _metadata,
+    Column("name", String(50), primary_key=True),
+    Column("owner", String(200), nullable=False),
+    Column("expires_at", Float, nullable=False),
+)
+
+
+class SchedulerLeader:
+    def __init__(
+        self, scheduler: BaseScheduler, engine: Engine, name: str = "scheduler"
+    ):
+        self.scheduler = scheduler
+        self.engine = engine
+        self.name = name
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._is_leader = False
+        self._lease_deadline = 0.0  # 本地 monotonic 時間，超過即視為失去 lease
+        self._state_lock = threading.Lock()
+        self._expiry_timer: threading.Timer | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def start(self):
+        """排程器須先以 start(paused=True) 啟動；先同步嘗試一次，單一 worker 時立即成為 leader"""
+        lease_table.create(self.engine, checkfirst=True)
+        self._stop_event.clear()
+        self._tick()
+
+        self._thread = threading.Thread(
+            target=self._run, name="scheduler-leader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """停止續約並釋放 lease，讓其他 worker 不必等到過期即可接手"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+
+        with self._state_lock:
+            was_leader = self._is_leader
+            if was_leader:
+                self._demote("shutting down")
+
+        if was_leader:
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(
+                        delete(lease_table).where(
+                            lease_table.c.name == self.name,
+                            lease_table.c.owner == self.owner,
+                        )
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to release scheduler lease: {e}")
+
+    def _run(self):
+        while not self._stop_event.wait(config.SCHEDULER_LEASE_RENEW_IN_SECOND):
+            self._tick()
+
+    @staticmethod
+    def _renewal_window() -> float:
+        """下一次續約最晚多久後才能確認結果：續約間隔 + 等待 DB 鎖的 busy_timeout"""
+        return (
+            config.SCHEDULER_LEASE_RENEW_IN_SECOND
+            + config.SQLITE_BUSY_TIMEOUT_IN_MS / 1000
+        )
+
+    @staticmethod
+    def _expiry_margin() -> float:
+        return min(EXPIRY_MARGIN_IN_SECOND, config.SCHEDULER_LEASE_TTL_IN_SECOND / 10)
+
+    def _tick(self):
+        try:
+            acquired = self._try_acquire()
+        except Exception as e:
+            logger.warning(f"Scheduler lease renewal failed: {e}")
+            # 無法確認 lease：剩餘時間仍足夠下一次續約才維持現狀，否則立即退位
+            remaining = self._lease_deadline - time.monotonic()
+            acquired = self._is_leader and remaining > self._renewal_window()
+
+        with self._state_lock:
+            if acquired and not self._is_leader:
+                self._promote()
+            elif not acquired and self._is_leader:
+                self._demote("lease lost")
+            is_leader = self._is_leader
+
+        if acquired:
+            self._arm_expiry_timer()
+        if is_leader:
+            # 其他 worker 新增的 Job 不會喚醒本行程，定期 wakeup 重新檢查 jobstore
+            self.scheduler.wakeup()
+
+    def _arm_expiry_timer(self):
+        """在 lease 到期前觸發的退位計時器，不依賴（可能阻塞的）續約呼叫"""
+        if self._expiry_timer is not None:
+            self._expiry_timer.cancel()
+
+        fire_at = self._lease_deadline - self._expiry_margin()
+        self._expiry_timer = threading.Timer(
+            max(fire_at - time.monotonic(), 0), self._on_lease_expiring
+        )
+        self._expiry_timer.daemon = True
+        self._expiry_timer.start()
+
+    def _on_lease_expiring(self):
+        with self._state_lock:
+            # 計時器觸發前若已續約，期限已往後延，不做任何事
+            expiring_at = self._lease_deadline - self._expiry_margin()
+            if self._is_leader and time.monotonic() >= expiring_at:
+                self._demote("lease about to expire without renewal")
+
+    def _try_acquire(self) -> bool:
+        ttl = config.SCHEDULER_LEASE_TTL_IN_SECOND
+        requested_at = time.monotonic()
+        now = time.time()
+
+        try:
+            with self.engine.begin() as conn:
+                renewed = conn.execute(
+                    update(lease_table)
+                    .where(
+                        lease_table.c.name == self.name,
+                        or_(
+                            lease_table.c.owner == self.owner,
+                            lease_table.c.expires_at < now,
+                        ),
+                    )
+                    .values(owner=self.owner, expires_at=now + ttl)
+                ).rowcount
+
+                if not renewed:
+                    exists = conn.execute(
+                        select(lease_table.c.owner).where(
+                            lease_table.c.name == self.name
+                        )
+                    ).first()
+                    if exists:
+                        return False
+                    conn.execute(
+                        insert(lease_table).values(
+                            name=self.name, owner=self.owner, expires_at=now + ttl
+                        )
+                    )
+
+        except IntegrityError:
+            # 另一個 worker 同時搶先建立了 lease
+            return False
+
+        self._lease_deadline = requested_at + ttl
+        return True
+
+    def _promote(self):
+        self._is_leader = True
+        self.scheduler.resume()
+        logger.info(f"Acquired scheduler lease as {self.owner}, scheduler resumed.")
+
+    def _demote(self, reason: str):
+        self._is_leader = False
+        self.scheduler.pause()
+        logger.warning(f"Scheduler paused on {self.owner}: {reason}.")
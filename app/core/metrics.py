@@ -0,0 +1,251 @@
+"""
+行程內的輕量 metrics registry，輸出 Prometheus text format (0.0.4)
+
+- Counter / Histogram: 熱路徑上只做一次 dict 查詢與加法（持有 lock 的時間極短）
+- Gauge: 以 callback 在 /metrics 被抓取時才計算，平時零成本
+- MetricsMiddleware: 純 ASGI middleware，依 route 樣板記錄回應延遲
+
+注意：數值只存在於目前行程，多 worker 部署時需分別抓取。
+"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def collect(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.collect(),
+        ]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # labels -> [各 bucket 計數..., +Inf 計數, sum]
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str):
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._values.get(labelvalues)
+            if series is None:
+                series = self._values[labelvalues] = [0] * (len(self._buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def collect(self) -> list[str]:
+        with self._lock:
+            items = [(labels, list(series)) for labels, series in self._values.items()]
+
+        lines = []
+        bounds = (*self._buckets, float("inf"))
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)}"
+                    f" {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    抓取時才呼叫 callback 取值；callback 回傳 [(label_values, value), ...]
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        callback: Callable[[], Iterable[tuple[LabelValues, float]]] | None = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def collect(self) -> list[str]:
+        if self.callback is None:
+            return []
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in self.callback()
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames=(), callback=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        """輸出所有 metric；單一 Gauge callback 失敗不影響其他 metric"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: list[str] = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                logger.warning(f"Failed to collect metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ----- 共用 Metrics -----
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 請求到送出回應標頭的時間（秒）",
+    ("method", "route", "status"),
+)
+
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds",
+    "SQL 語句執行時間（秒），_count 即為查詢次數",
+    ("database", "operation"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+action_total = registry.counter(
+    "recorder_action_total",
+    "recorder action() 執行次數（依操作名稱與結果）",
+    ("action", "outcome"),
+)
+
+
+class MetricsMiddleware:
+    """
+    純 ASGI middleware（不使用 BaseHTTPMiddleware，避免額外的 task 與串流緩衝）。
+    在送出回應標頭時記錄延遲，SSE 與串流匯出不會因連線時間長而扭曲分佈。
+    route 以樣板路徑 (例如 /meeting/{meeting_id}) 作為 label，避免高基數。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        recorded = False
+
+        def record(status_code: int):
+            nonlocal recorded
+            recorded = True
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status_code),
+            )
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and not recorded:
+                record(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not recorded:
+                record(500)
@@ -0,0 +1,160 @@
+"""
+會議 DB 的版本化 schema migration
+
+create_all 只會建立不存在的資料表，無法替既有部署加上索引或其他結構變更。
+啟動時由 initialize_db_schema 在 create_all 之後執行 run_migrations：
+- 已套用的版本記錄在 schema_version 資料表
+- 尚未套用的 migration 依版本號順序執行，每個 migration 一個 transaction
+- 多個 worker 可能同時啟動，migration 內容必須可重複執行（IF NOT EXISTS），
+  版本號寫入衝突時視為其他 worker 已完成
+
+新增 migration：在 MIGRATIONS 尾端加上下一個版本號，不要修改已發布的 migration；
+若同時在 ORM model 宣告了相同結構，名稱必須一致，全新資料庫才不會重複建立。
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+
+schema_version_table = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime, nullable=False, server_default=func.now()),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def _create_meeting_fts(conn: Connection):
+    # app.models 會 import app.core.database，延遲 import 避免循環
+    from app.models.meeting_fts import create_meeting_fts
+
+    create_meeting_fts(conn)
+
+
+def _add_hot_query_indexes(conn: Connection):
+    for ddl in (
+        # TaskService 的重疊檢查：status IN (...) AND start_time < ? AND end_time > ?
+        # 以 covering index 完成，不必回表
+        "CREATE INDEX IF NOT EXISTS ix_tasks_status_start_time_end_time "
+        "ON tasks (status, start_time, end_time)",
+        # get_all_tasks：start_time / end_time 過濾並依 start_time 排序
+        "CREATE INDEX IF NOT EXISTS ix_tasks_start_time_end_time "
+        "ON tasks (start_time, end_time)",
+        # get_meetings：依 start_time 或 meeting_name 的 keyset 分頁（id 即 rowid，已含在索引中）
+        "CREATE INDEX IF NOT EXISTS ix_meetings_start_time ON meetings (start_time)",
+        "CREATE INDEX IF NOT EXISTS ix_meetings_meeting_name ON meetings (meeting_name)",
+        # get_meetings upcoming_only 的兩個 OR 分支，各自以索引範圍查詢
+        "CREATE INDEX IF NOT EXISTS ix_meetings_repeat_end_time "
+        "ON meetings (repeat, end_time)",
+        "CREATE INDEX IF NOT EXISTS ix_meetings_repeat_repeat_end_date "
+        "ON meetings (repeat, repeat_end_date)",
+    ):
+        conn.execute(text(ddl))
+
+
+def _add_column(conn: Connection, table_name: str, column: str, ddl_type: str) -> bool:
+    """欄位已存在時不做任何事，回傳是否新增"""
+    columns = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table_name})"))}
+    if column in columns:
+        return False
+
+    try:
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column} {ddl_type}"))
+    except OperationalError as e:
+        # 另一個 worker 在檢查之後搶先加上了欄位
+        if "duplicate column" not in str(e):
+            raise
+        return False
+    return True
+
+
+def _add_materialized_until(conn: Connection):
+    if not _add_column(conn, "meetings", "materialized_until", "DATETIME"):
+        return
+
+    # 既有的重複會議在建立時已展開到 repeat_end_date，rollover 不需再補
+    conn.execute(
+        text(
+            "UPDATE meetings SET materialized_until = repeat_end_date "
+            "WHERE repeat = 1 AND repeat_end_date IS NOT NULL"
+        )
+    )
+
+
+def _add_repeat_rule(conn: Connection):
+    # 既有會議沒有規則，沿用 repeat_unit 的每 N 天重複
+    _add_column(conn, "meetings", "repeat_rule", "VARCHAR(100)")
+    _add_column(conn, "meetings", "repeat_exdates", "VARCHAR(1000)")
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "meetings_fts", _create_meeting_fts),
+    Migration(2, "hot_query_indexes", _add_hot_query_indexes),
+    Migration(3, "meetings_materialized_until", _add_materialized_until),
+    Migration(4, "meetings_repeat_rule", _add_repeat_rule),
+]
+
+
+def run_migrations(engine: Engine) -> list[int]:
+    """套用所有尚未執行的 migration，回傳本次套用的版本號"""
+    schema_version_table.create(engine, checkfirst=True)
+
+    with engine.connect() as conn:
+        applied = set(conn.scalars(select(schema_version_table.c.version)))
+
+    latest = max((m.version for m in MIGRATIONS), default=0)
+    if applied and max(applied) > latest:
+        logger.warning(
+            f"Database schema version {max(applied)} is newer than this build ({latest})."
+        )
+
+    upgraded: list[int] = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+
+        try:
+            with engine.begin() as conn:
+                migration.upgrade(conn)
+                conn.execute(
+                    insert(schema_version_table).values(
+                        version=migration.version, name=migration.name
+                    )
+                )
+        except IntegrityError:
+            # 另一個 worker 同時完成了同一個 migration
+            logger.info(f"Migration {migration.version} already applied by another worker.")
+            continue
+
+        upgraded.append(migration.version)
+        logger.info(f"Applied migration {migration.version}: {migration.name}")
+
+    return upgraded
@@ -0,0 +1,31 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    直接以 pydantic-core 的序列化器輸出 JSON bytes。
+
+    endpoint 回傳 Response 物件時，FastAPI 不會再依 response_model 驗證一次，
+    也不會經過 jsonable_encoder + json.dumps；Service 已驗證過的資料只序列化一次。
+    CustomBaseModel 的 json_encoders（TAIPEI_TZ 時間格式）同樣會套用。
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter | None = None,
+        **kwargs: Any,
+    ):
+        # render() 會在父類別 __init__ 中被呼叫，adapter 必須先設定
+        self.adapter = adapter
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if self.adapter is not None:
+            return self.adapter.dump_json(content)
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
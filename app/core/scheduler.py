@@ -1,16 +1,188 @@
+import logging
+from datetime import datetime
+
+from apscheduler.events import (
+    EVENT_ALL_JOBS_REMOVED,
+    EVENT_JOB_ADDED,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+    JobEvent,
+    SchedulerEvent,
+)
 from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.job import Job
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_STOPPED
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import create_db_resources, database_engine
+from app.core.events import broker
+from app.core.jobs import LEGACY_FUNC_REFS, ROLLOVER_JOB_ID, ROLLOVER_RECURRENCES
+from app.core.jobstore import CompactJobStore, JobEntry
+from app.core.leader import SchedulerLeader
+from app.core.metrics import registry
+from shared.config import TAIPEI_TZ, config
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingScheduler(BackgroundScheduler):
+    def add_date_jobs(self, job_specs: list[dict], jobstore: str = "default"):
+        """
+        批次新增 date trigger 的 Job，所有 Job 在同一個 jobstore transaction 內寫入。
+        job_specs: [{"func", "args", "id", "name", "run_date"}, ...]
+        任何一個 Job id 衝突時整批都不會寫入。
+        """
+        if not job_specs:
+            return
+
+        store = self._lookup_jobstore(jobstore)
+        if self.state == STATE_STOPPED or not hasattr(store, "add_jobs"):
+            # 尚未啟動時交給 add_job 放入 pending 佇列
+            for spec in job_specs:
+                self.add_job(trigger="date", jobstore=jobstore, **spec)
+            return
+
+        jobs = self._build_date_jobs(job_specs)
+
+        with self._jobstores_lock:
+            store.add_jobs(jobs)
+
+            for job in jobs:
+                job._jobstore_alias = jobstore
+                self._dispatch_event(JobEvent(EVENT_JOB_ADDED, job.id, jobstore))
+
+        logger.info(f"Added {len(jobs)} jobs to job store '{jobstore}' in one batch")
+        self.wakeup()
+
+    def reschedule_date_jobs(self, job_specs: list[dict], jobstore: str = "default"):
+        """
+        批次重新排程 date trigger 的 Job：相當於對每個 Job 呼叫 reschedule_job，
+        但所有 Job 在同一個 jobstore transaction 內覆寫，不需逐一讀出再更新。
+        job_specs 格式同 add_date_jobs。
+        """
+        if not job_specs:
+            return
+
+        store = self._lookup_jobstore(jobstore)
+        if self.state == STATE_STOPPED or not hasattr(store, "replace_jobs"):
+            for spec in job_specs:
+                self.add_job(
+                    trigger="date", jobstore=jobstore, replace_existing=True, **spec
+                )
+            return
+
+        jobs = self._build_date_jobs(job_specs)
+
+        with self._jobstores_lock:
+            store.replace_jobs(jobs)
+
+            for job in jobs:
+                job._jobstore_alias = jobstore
+                self._dispatch_event(JobEvent(EVENT_JOB_MODIFIED, job.id, jobstore))
+
+        logger.info(
+            f"Rescheduled {len(jobs)} jobs in job store '{jobstore}' in one batch"
+        )
+        self.wakeup()
+
+    def add_jobs_in_transaction(
+        self, session: Session, job_specs: list[dict], jobstore: str = "default"
+    ):
+        """
+        jobstore 與會議 DB 共用 engine 時，將 Job 寫入 session 目前的 transaction，
+        與任務資料一起 commit；事件與 wakeup 延後到 commit 之後（見 _announce_committed_jobs）。
+        """
+        if not job_specs:
+            return
 
-from shared.config import config
+        jobs = self._build_date_jobs(job_specs)
+        self._lookup_jobstore(jobstore).add_jobs(jobs, connection=session.connection())
+        session.info.setdefault("scheduler_changes", []).extend(
+            (EVENT_JOB_ADDED, job.id, jobstore) for job in jobs
+        )
 
-JOB_STORES = {"default": SQLAlchemyJobStore(url=config.SCHEDULER_DB_URL)}
+    def reschedule_jobs_in_transaction(
+        self, session: Session, job_specs: list[dict], jobstore: str = "default"
+    ):
+        """與 add_jobs_in_transaction 相同，覆寫隨 session 的 transaction 一起 commit"""
+        if not job_specs:
+            return
+
+        jobs = self._build_date_jobs(job_specs)
+        self._lookup_jobstore(jobstore).replace_jobs(
+            jobs, connection=session.connection()
+        )
+        session.info.setdefault("scheduler_changes", []).extend(
+            (EVENT_JOB_MODIFIED, job.id, jobstore) for job in jobs
+        )
+
+    def remove_jobs_in_transaction(
+        self, session: Session, job_ids: list[str], jobstore: str = "default"
+    ):
+        """與 add_jobs_in_transaction 相同，刪除隨 session 的 transaction 一起 commit"""
+        if not job_ids:
+            return
+
+        self._lookup_jobstore(jobstore).remove_jobs(
+            job_ids, connection=session.connection()
+        )
+        session.info.setdefault("scheduler_changes", []).extend(
+            (EVENT_JOB_REMOVED, job_id, jobstore) for job_id in job_ids
+        )
+
+    def announce_committed(self, changes: list[tuple[int, str, str]]):
+        for code, job_id, jobstore in changes:
+            self._dispatch_event(JobEvent(code, job_id, jobstore))
+        self.wakeup()
+
+    def list_job_entries(self, jobstore: str = "default") -> list[JobEntry]:
+        """列出 Job 的 id / 種類 / task_id / 下次執行時間，不重建 Job 物件"""
+        return self._lookup_jobstore(jobstore).list_jobs()
+
+    def _build_date_jobs(self, job_specs: list[dict]) -> list[Job]:
+        now = datetime.now(self.timezone)
+        jobs = []
+        for spec in job_specs:
+            trigger = self._create_trigger("date", {"run_date": spec["run_date"]})
+            job = Job(
+                self,
+                id=spec["id"],
+                func=spec["func"],
+                args=tuple(spec.get("args", ())),
+                kwargs={},
+                name=spec.get("name"),
+                trigger=trigger,
+                executor="default",
+                next_run_time=trigger.get_next_fire_time(None, now),
+                **self._job_defaults,
+            )
+            jobs.append(job)
+        return jobs
+
+
+# jobstore 放在會議 DB 時共用同一個 engine 與連線池，任務與 Job 可在同一個 transaction commit；
+# 否則使用獨立的排程器 DB（同樣套用 SQLite storage profile 與連線池設定）
+JOBSTORE_IN_MEETING_DB = config.SCHEDULER_JOBSTORE_IN_MEETING_DB
+
+if JOBSTORE_IN_MEETING_DB:
+    scheduler_engine = database_engine
+else:
+    scheduler_engine, _ = create_db_resources(config.SCHEDULER_DB_URL, "Scheduler")
+
+JOB_STORES = {
+    "default": CompactJobStore(
+        engine=scheduler_engine, owns_engine=not JOBSTORE_IN_MEETING_DB
+    )
+}
 
 EXECUTORS = {"default": ThreadPoolExecutor(20)}
 
 
-def get_scheduler() -> BackgroundScheduler:
-    scheduler = BackgroundScheduler(
+def get_scheduler() -> RecordingScheduler:
+    scheduler = RecordingScheduler(
         jobstores=JOB_STORES,
         executors=EXECUTORS,
         job_defaults={
@@ -19,7 +191,168 @@ def get_scheduler() -> BackgroundScheduler:
         },
     )
 
+    scheduler.add_listener(
+        _publish_job_event,
+        EVENT_JOB_ADDED
+        | EVENT_JOB_MODIFIED
+        | EVENT_JOB_REMOVED
+        | EVENT_ALL_JOBS_REMOVED,
+    )
+
     return scheduler
 
 
+def _publish_job_event(event: SchedulerEvent):
+    """將 Job 變動推送給 /events 訂閱者（沒有訂閱者時不做任何查詢）"""
+    if not broker.has_subscribers:
+        return
+
+    if event.code == EVENT_ALL_JOBS_REMOVED:
+        broker.publish("all_jobs_removed", {})
+        return
+
+    if not isinstance(event, JobEvent):
+        return
+
+    if event.code == EVENT_JOB_REMOVED:
+        broker.publish("job_removed", {"id": event.job_id})
+        return
+
+    try:
+        job = scheduler.get_job(event.job_id, event.jobstore)
+    except Exception as e:
+        logger.debug(f"Failed to look up job {event.job_id} for event: {e}")
+        return
+
+    if job is None:
+        return
+
+    broker.publish(
+        "job_added" if event.code == EVENT_JOB_ADDED else "job_modified",
+        {
+            "id": job.id,
+            "name": job.name,
+            "next_run_time": job.next_run_time.strftime("%Y-%m-%d %H:%M")
+            if job.next_run_time
+            else "已暫停",
+        },
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _announce_committed_jobs(session: Session):
+    changes = session.info.pop("scheduler_changes", None)
+    if changes:
+        scheduler.announce_committed(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_scheduler_changes(session: Session):
+    session.info.pop("scheduler_changes", None)
+
+
+def migrate_legacy_jobs():
+    """
+    在排程器啟動前，將舊版 SQLAlchemyJobStore（pickle）中的 Job 搬到 CompactJobStore，
+    直接參照 recorder 函式的舊 Job 同時改為 trampoline
+    """
+    for alias, store in JOB_STORES.items():
+        if not hasattr(store, "import_pickled_jobs"):
+            continue
+        imported = store.import_pickled_jobs(func_refs=LEGACY_FUNC_REFS)
+        if imported:
+            logger.info(f"Imported {imported} legacy jobs into jobstore '{alias}'.")
+
+
+def schedule_recurrence_rollover():
+    """
+    註冊每日延伸重複會議排程範圍的 Job，時間以 TAIPEI_TZ 計算（與所有時段一致，不受主機時區影響）。
+    Job 已存在且 trigger 相同時不做任何事：worker 啟動或重啟不會改寫 Job、也不會立即觸發 rollover。
+    停機期間錯過的執行由 misfire_grace_time=None + coalesce 在 leader 恢復排程後補跑一次。
+    """
+    trigger = CronTrigger(hour=config.RECURRENCE_ROLLOVER_HOUR, timezone=TAIPEI_TZ)
+
+    job = scheduler.get_job(ROLLOVER_JOB_ID)
+    if job is not None and repr(job.trigger) == repr(trigger):
+        return
+
+    scheduler.add_job(
+        ROLLOVER_RECURRENCES,
+        trigger=trigger,
+        id=ROLLOVER_JOB_ID,
+        name="重複會議排程延伸",
+        replace_existing=True,
+        misfire_grace_time=None,
+        coalesce=True,
+    )
+    logger.info(
+        f"Scheduled recurrence rollover daily at {config.RECURRENCE_ROLLOVER_HOUR}:00 ({TAIPEI_TZ})."
+    )
+
+
 scheduler = get_scheduler()
+scheduler_leader = SchedulerLeader(scheduler, JOB_STORES["default"].engine)
+
+
+# ----- Metrics (於 /metrics 抓取時才計算，直接查詢 jobstore 欄位，不重建 Job) -----
+TASK_JOB_KINDS = ("start", "end", "monitor")
+
+
+def _collect_job_counts():
+    counts = dict.fromkeys((*TASK_JOB_KINDS, "other"), 0)
+    for kind, count in JOB_STORES["default"].count_by_kind().items():
+        counts[kind if kind in TASK_JOB_KINDS else "other"] += count
+    return [((kind,), count) for kind, count in counts.items()]
+
+
+def _collect_active_monitors():
+    return [((), JOB_STORES["default"].count_by_kind().get("monitor", 0))]
+
+
+def _collect_next_run_time():
+    next_run_time = JOB_STORES["default"].get_next_run_time()
+    return [((), next_run_time.timestamp())] if next_run_time else []
+
+
+def _collect_executor_threads():
+    executor = EXECUTORS["default"]
+    pool = getattr(executor, "_pool", None)
+    if pool is None:
+        return []
+
+    busy = sum(executor._instances.values())
+    return [(("busy",), busy), (("idle",), max(pool._max_workers - busy, 0))]
+
+
+registry.gauge(
+    "scheduler_running",
+    "排程器是否運行中",
+    callback=lambda: [((), int(scheduler.running))],
+)
+registry.gauge(
+    "scheduler_leader",
+    "本行程是否持有排程器 leader lease（只有 leader 會執行 Job）",
+    callback=lambda: [((), int(scheduler_leader.is_leader))],
+)
+registry.gauge(
+    "scheduler_jobs",
+    "排程器中的 Job 數量（依種類）",
+    ("kind",),
+    callback=_collect_job_counts,
+)
+registry.gauge(
+    "scheduler_next_run_timestamp_seconds",
+    "最近一個 Job 的下次執行時間（Unix timestamp）",
+    callback=_collect_next_run_time,
+)
+registry.gauge(
+    "scheduler_executor_threads",
+    "排程 ThreadPoolExecutor 的執行緒狀態",
+    ("state",),
+    callback=_collect_executor_threads,
+)
+registry.gauge(
+    "recorder_active_monitors",
+    "進行中的錄影監控 Job 數量",
+    callback=_collect_active_monitors,
+)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import sys
 import threading
@@ -7,11 +8,29 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from app.controllers.event_controller import router as event_router
+from app.controllers.health_controller import router as health_router
 from app.controllers.meeting_controller import router as meeting_router
+from app.controllers.metrics_controller import router as metrics_router
 from app.controllers.task_controller import router as task_router
-from app.core.database import database_engine, initialize_db_schema
+from app.core.cache import clear_snapshots
+from app.core.data_version import watch_external_changes
+from app.core.database import (
+    async_database_engine,
+    database_engine,
+    initialize_db_schema,
+)
+from app.core.events import broker
 from app.core.exceptions import register_exception_handlers
-from app.core.scheduler import scheduler
+from app.core.health import health_monitor
+from app.core.metrics import MetricsMiddleware
+from app.core.scheduler import (
+    migrate_legacy_jobs,
+    schedule_recurrence_rollover,
+    scheduler,
+    scheduler_leader,
+)
+from app.core.timing import ServerTimingMiddleware
 from shared.config import ConfigWatcher
 from shared.logger import setup_logger
 
@@ -37,15 +56,35 @@ sys.excepthook = _unhandled_exception_hook
 threading.excepthook = _unhandled_thread_exception
 
 _config_watcher = ConfigWatcher()
+health_monitor.register(
+    "config_watcher",
+    lambda: (True, "監聽中") if _config_watcher.is_alive else (False, "未運行"),
+    critical=False,
+)
+
+
+def _on_external_change():
+    clear_snapshots()
+    broker.publish("resync", {})
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
+        broker.bind_loop(asyncio.get_running_loop())
         initialize_db_schema()
-        scheduler.start()
+        migrate_legacy_jobs()
+        # 所有 worker 皆以 paused 啟動，只有取得 lease 的 leader 會 resume 並執行 Job
+        scheduler.start(paused=True)
+        schedule_recurrence_rollover()
+        scheduler_leader.start()
         _config_watcher.start()
 
+        # 其他 worker 的寫入無法經由本行程的 broker 推送，改以 resync 通知 SSE client
+        external_change_watcher = asyncio.create_task(
+            watch_external_changes(lambda: broker.publish("resync", {}))
+        )
+
         jobs = scheduler.get_jobs()
         if not jobs:
             logger.info("目前排程器中沒有任何待處理任務。")
@@ -58,9 +97,13 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    external_change_watcher.cancel()
+    broker.close()
     _config_watcher.stop()
+    scheduler_leader.stop()
     scheduler.shutdown()
     database_engine.dispose()
+    await async_database_engine.dispose()
     logger.info("Database engine disposed.")
 
 
@@ -84,12 +127,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 register_exception_handlers(app)
 
 
 app.include_router(meeting_router)
 app.include_router(task_router)
+app.include_router(event_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
 
 
 @app.get("/", include_in_schema=False)
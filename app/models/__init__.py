@@ -1,4 +1,5 @@
 from .meeting import MeetingORM
 from .task import TaskORM
+from . import snapshots  # noqa: F401  註冊快照失效事件
 
 __all__ = ["MeetingORM", "TaskORM"]
@@ -28,3 +28,10 @@ class TaskStatus(str, Enum):
     COMPLETED = "completed"
     ERROR = "error"
     FAILED = "failed"
+
+
+@final
+class RepeatFrequency(str, Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
@@ -1,10 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Enum, Integer, String
+from sqlalchemy import Boolean, Enum, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base, TZDateTime
+from app.core.database import Base, DateList, TZDateTime
 
 from .enums import LayoutType, MeetingType
 
@@ -28,10 +28,19 @@ class MeetingORM(Base):
     - room_id: 會議識別 ID
     - meeting_password: 會議密碼
     - repeat_unit/repeat_end_date: 會議重複規則
+    - repeat_rule/repeat_exdates: RRULE 風格的重複規則與排除日期（見 app.models.recurrence）
+    - materialized_until: 重複會議已建立任務的時間範圍終點
     - tasks: 與 Task 的關聯 (One-to-Many)
     """
 
     __tablename__ = "meetings"
+    # 與 migration 2 (hot_query_indexes) 同名，既有資料庫由 migration 補上
+    __table_args__ = (
+        Index("ix_meetings_start_time", "start_time"),
+        Index("ix_meetings_meeting_name", "meeting_name"),
+        Index("ix_meetings_repeat_end_time", "repeat", "end_time"),
+        Index("ix_meetings_repeat_repeat_end_date", "repeat", "repeat_end_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -82,6 +91,19 @@ class MeetingORM(Base):
         TZDateTime, nullable=True, doc="重複結束日期"
     )
 
+    repeat_rule: Mapped[str | None] = mapped_column(
+        String(100), nullable=True, doc="重複規則 (RRULE)，未設定時每 repeat_unit 天重複"
+    )
+
+    repeat_exdates: Mapped[List[date]] = mapped_column(
+        DateList(1000), nullable=True, default=list, doc="不錄製的日期"
+    )
+
+    # 開始時間不晚於此值的重複時段皆已建立任務，每日 rollover 由此往後延伸
+    materialized_until: Mapped[datetime | None] = mapped_column(
+        TZDateTime, nullable=True, doc="已建立任務的時間範圍終點"
+    )
+
     tasks: Mapped[List["TaskORM"]] = relationship(
         back_populates="meeting",
         cascade="all, delete-orphan",
@@ -0,0 +1,80 @@
+"""
+會議全文檢索 (SQLite FTS5)
+
+meetings_fts 是 meetings 的 external content 索引，只保存倒排索引本身，
+欄位內容仍從 meetings 讀取；由 trigger 在 INSERT/UPDATE/DELETE 時同步。
+
+使用 trigram tokenizer：中文會議名稱沒有空白分詞，unicode61 會把整串中文視為
+單一 token，只能從開頭比對；trigram 則支援任意位置的子字串（含前綴）比對，
+且不分大小寫。3 個字以下的關鍵字無法使用索引，改以 LIKE 比對。
+"""
+
+import logging
+
+from sqlalchemy import Connection, column, table, text
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "meetings_fts"
+FTS_COLUMNS = ("meeting_name", "creator_name", "creator_email")
+
+# bm25 欄位權重：會議名稱命中比建立者資訊重要
+FTS_RANK_WEIGHTS = (10.0, 2.0, 1.0)
+
+# 查詢用的輕量 table 結構，rowid 即 meetings.id
+meetings_fts = table(FTS_TABLE, column("rowid"), *(column(c) for c in FTS_COLUMNS))
+
+_columns = ", ".join(FTS_COLUMNS)
+_new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+FTS_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_columns},
+        content='meetings',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON meetings BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON meetings BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns})
+        VALUES ('delete', old.id, {_old_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF {_columns} ON meetings BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns})
+        VALUES ('delete', old.id, {_old_values});
+        INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+)
+
+
+def create_meeting_fts(conn: Connection):
+    """
+    建立 FTS5 索引與同步 trigger（可重複執行）。
+    索引是第一次建立時，以 rebuild 從 meetings 既有資料回填。
+    """
+    if conn.dialect.name != "sqlite":
+        return
+
+    existed = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+
+    for ddl in FTS_DDL:
+        conn.execute(text(ddl))
+
+    if not existed:
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        logger.info(f"Created {FTS_TABLE} and indexed existing meetings.")
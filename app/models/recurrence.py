@@ -0,0 +1,240 @@
+"""
+重複會議的時段計算（RRULE 子集）
+
+規則以 RRULE 風格的字串存放在 meetings.repeat_rule：
+- FREQ=DAILY;INTERVAL=3               每 3 天
+- FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH  每兩週的週一、週四
+- FREQ=MONTHLY;BYDAY=2TU              每月第二個週二（-1TU 為最後一個週二）
+沒有規則的會議沿用 repeat_unit，視為 FREQ=DAILY;INTERVAL=repeat_unit。
+repeat_exdates 中的日期當天不錄製。所有時段都在 start_time 的時刻開始。
+
+時段依序編號，第 0 個為 start_time 當下或之後的第一個：
+- 第 n 個時段與「第一個不早於某時間的編號」都以算術直接計算，
+  不需從 start_time 逐一累加，與會議已經重複了多久無關
+- 排除日期只會讓編號平移：第 i 個排除編號之前有 x_i - i 個要錄製的時段，
+  此數列不遞減，第 n 個要錄製的時段在其上 bisect 一次即可求得（O(log 排除數)）
+- 每月第 5 個週幾並非每月都有，為維持直接計算，序數限制為 1~4 與 -1
+"""
+
+import bisect
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Iterable, List
+
+from .enums import RepeatFrequency
+
+if TYPE_CHECKING:
+    from .meeting import MeetingORM
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MONTHLY_SETPOS = (1, 2, 3, 4, -1)
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    freq: RepeatFrequency
+    interval: int = 1
+    # WEEKLY：要錄製的週幾（0 = 週一）；MONTHLY：只有一個
+    weekdays: tuple[int, ...] = ()
+    # MONTHLY：當月第幾個 weekdays[0]，-1 為最後一個
+    setpos: int = 0
+
+    def __post_init__(self):
+        if self.interval < 1:
+            raise ValueError("重複規則的 INTERVAL 必須為正整數。")
+        if self.freq == RepeatFrequency.WEEKLY and not self.weekdays:
+            raise ValueError("每週重複必須以 BYDAY 指定週幾。")
+        if self.freq == RepeatFrequency.MONTHLY and (
+            len(self.weekdays) != 1 or self.setpos not in MONTHLY_SETPOS
+        ):
+            raise ValueError("每月重複的 BYDAY 必須為單一的 1~4 或 -1 加週幾，例如 2TU。")
+
+    @classmethod
+    def daily(cls, days: int) -> "RecurrenceRule":
+        return cls(RepeatFrequency.DAILY, interval=days)
+
+    @classmethod
+    def parse(cls, text: str) -> "RecurrenceRule":
+        """解析 RRULE 風格的字串，格式錯誤時拋出 ValueError"""
+        parts: dict[str, str] = {}
+        for part in text.strip().upper().removeprefix("RRULE:").split(";"):
+            key, sep, value = part.partition("=")
+            if not sep or not value:
+                raise ValueError(f"無法解析重複規則的片段 '{part}'。")
+            parts[key.strip()] = value.strip()
+
+        unknown = parts.keys() - {"FREQ", "INTERVAL", "BYDAY"}
+        if unknown:
+            raise ValueError(f"不支援的重複規則欄位：{', '.join(sorted(unknown))}。")
+
+        try:
+            freq = RepeatFrequency(parts.get("FREQ", ""))
+        except ValueError:
+            raise ValueError("FREQ 必須為 DAILY、WEEKLY 或 MONTHLY。")
+
+        try:
+            interval = int(parts.get("INTERVAL", "1"))
+        except ValueError:
+            raise ValueError("重複規則的 INTERVAL 必須為正整數。")
+
+        weekdays: set[int] = set()
+        setpos = 0
+        for day in filter(None, parts.get("BYDAY", "").split(",")):
+            prefix, code = day[:-2], day[-2:]
+            if code not in WEEKDAYS:
+                raise ValueError(f"無法辨識的週幾 '{day}'。")
+            if prefix:
+                if freq != RepeatFrequency.MONTHLY:
+                    raise ValueError("只有每月重複可以指定第幾個週幾。")
+                try:
+                    setpos = int(prefix)
+                except ValueError:
+                    raise ValueError(f"無法辨識的週幾 '{day}'。")
+            weekdays.add(WEEKDAYS.index(code))
+
+        if freq == RepeatFrequency.DAILY and weekdays:
+            raise ValueError("每日重複不可指定 BYDAY。")
+
+        return cls(freq, interval, tuple(sorted(weekdays)), setpos)
+
+    def __str__(self) -> str:
+        text = f"FREQ={self.freq.value}"
+        if self.interval != 1:
+            text += f";INTERVAL={self.interval}"
+        if self.freq == RepeatFrequency.WEEKLY:
+            text += ";BYDAY=" + ",".join(WEEKDAYS[d] for d in self.weekdays)
+        elif self.freq == RepeatFrequency.MONTHLY:
+            text += f";BYDAY={self.setpos}{WEEKDAYS[self.weekdays[0]]}"
+        return text
+
+
+def _nth_weekday(month_index: int, weekday: int, setpos: int) -> date:
+    """month_index = year * 12 + (month - 1)"""
+    year, month = divmod(month_index, 12)
+    first = date(year, month + 1, 1)
+    if setpos > 0:
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (setpos - 1))
+
+    next_year, next_month = divmod(month_index + 1, 12)
+    last = date(next_year, next_month + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+class Recurrence:
+    def __init__(
+        self,
+        rule: RecurrenceRule,
+        start: datetime,
+        until: datetime | None = None,
+        exdates: Iterable[date] = (),
+    ):
+        self.rule = rule
+        self.start = start
+        self.until = until
+
+        # WEEKLY：start 所在週的週一，以及該週內早於 start 的週幾個數
+        self._anchor = start.date() - timedelta(days=start.weekday())
+        self._week_skip = bisect.bisect_left(rule.weekdays, start.weekday())
+        # MONTHLY：start 所在的月份，以及當月的時段是否早於 start
+        self._month = start.year * 12 + start.month - 1
+        self._month_skip = 0
+        if rule.freq == RepeatFrequency.MONTHLY:
+            self._month_skip = int(self._on(_nth_weekday(self._month, *self._by_setpos)) < start)
+
+        # 落在時段上的排除日期，轉為排序好的編號
+        excluded = {self._index_on(day) for day in exdates}
+        excluded.discard(None)
+        self._excluded: list[int] = sorted(excluded)
+        self._excluded_set = set(self._excluded)
+        # 每個排除編號之前要錄製的時段數
+        self._kept_before = [x - i for i, x in enumerate(self._excluded)]
+
+    @classmethod
+    def from_meeting(cls, meeting: "MeetingORM") -> "Recurrence":
+        rule = (
+            RecurrenceRule.parse(meeting.repeat_rule)
+            if meeting.repeat_rule
+            else RecurrenceRule.daily(meeting.repeat_unit)
+        )
+        return cls(
+            rule,
+            meeting.start_time,
+            meeting.repeat_end_date,
+            meeting.repeat_exdates or (),
+        )
+
+    @property
+    def _by_setpos(self) -> tuple[int, int]:
+        return self.rule.weekdays[0], self.rule.setpos
+
+    def _on(self, day: date) -> datetime:
+        return datetime.combine(day, self.start.timetz())
+
+    # ----- 不考慮排除日期與結束日期的第 n 個時段 -----
+    def _raw(self, n: int) -> datetime:
+        rule = self.rule
+        if rule.freq == RepeatFrequency.DAILY:
+            return self.start + timedelta(days=n * rule.interval)
+
+        if rule.freq == RepeatFrequency.WEEKLY:
+            week, i = divmod(n + self._week_skip, len(rule.weekdays))
+            return self._on(
+                self._anchor
+                + timedelta(days=week * rule.interval * 7 + rule.weekdays[i])
+            )
+
+        month = self._month + (n + self._month_skip) * rule.interval
+        return self._on(_nth_weekday(month, *self._by_setpos))
+
+    def _estimate(self, moment: datetime) -> int:
+        """不超過實際值太多的編號估計，呼叫端再前後微調（最多一個週期的時段數）"""
+        rule = self.rule
+        if rule.freq == RepeatFrequency.DAILY:
+            return (moment - self.start) // timedelta(days=rule.interval)
+
+        if rule.freq == RepeatFrequency.WEEKLY:
+            weeks = (moment.date() - self._anchor).days // (7 * rule.interval)
+            return weeks * len(rule.weekdays) - self._week_skip
+
+        months = moment.year * 12 + moment.month - 1 - self._month
+        return months // rule.interval - self._month_skip
+
+    def _index_at_or_after(self, moment: datetime) -> int:
+        """第一個開始時間不早於 moment 的編號"""
+        if moment <= self.start:
+            return 0
+
+        n = max(self._estimate(moment), 0)
+        while n > 0 and self._raw(n - 1) >= moment:
+            n -= 1
+        while self._raw(n) < moment:
+            n += 1
+        return n
+
+    def _index_on(self, day: date) -> int | None:
+        n = self._index_at_or_after(self._on(day))
+        return n if self._raw(n).date() == day else None
+
+    # ----- Public API -----
+    def nth_occurrence(self, n: int) -> datetime | None:
+        """第 n 個（從 0 起算）要錄製的時段開始時間，超過結束日期時為 None"""
+        # 排除編號在第 n 個要錄製的時段之前 <=> 它之前要錄製的時段不超過 n 個
+        m = n + bisect.bisect_right(self._kept_before, n)
+
+        occurrence = self._raw(m)
+        if self.until is not None and occurrence > self.until:
+            return None
+        return occurrence
+
+    def occurrences_between(self, start: datetime, end: datetime) -> List[datetime]:
+        """開始時間在 [start, end] 之間、且未被排除的所有時段"""
+        if self.until is not None:
+            end = min(end, self.until)
+
+        occurrences: List[datetime] = []
+        n = self._index_at_or_after(start)
+        while (occurrence := self._raw(n)) <= end:
+            if n not in self._excluded_set:
+                occurrences.append(occurrence)
+            n += 1
+        return occurrences
@@ -1,11 +1,15 @@
-from datetime import datetime
-from typing import Any, Optional, Self
+from datetime import date, datetime
+from typing import Annotated, Any, List, Optional, Self
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    TypeAdapter,
+    ValidationError,
     ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
@@ -13,6 +17,7 @@ from pydantic import (
 from shared.config import TAIPEI_TZ
 
 from .enums import LayoutType, MeetingType, TaskStatus
+from .recurrence import RecurrenceRule
 
 
 class CustomBaseModel(BaseModel):
@@ -46,6 +51,14 @@ class MeetingBase(CustomBaseModel):
     repeat: bool = Field(False, description="是否重複排程")
     repeat_unit: Optional[int] = Field(None, description="重複的天數")
     repeat_end_date: datetime = Field(..., description="重複結束日期")
+    repeat_rule: Optional[str] = Field(
+        None,
+        max_length=100,
+        description="重複規則 (RRULE)，例：FREQ=WEEKLY;BYDAY=MO,WE；未提供時每 repeat_unit 天重複",
+    )
+    repeat_exdates: List[date] = Field(
+        default_factory=list, description="不錄製的日期，可用逗號分隔的字串輸入"
+    )
 
     # --- 格式化驗證器 (Response 也需要的處理) ---
 
@@ -73,6 +86,23 @@ class MeetingBase(CustomBaseModel):
         except (ValueError, TypeError):
             raise ValueError("重複天數必須是有效的數字格式")
 
+    @field_validator("repeat_rule", mode="before")
+    @classmethod
+    def normalize_repeat_rule(cls, v: Any) -> Optional[str]:
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return None
+        # 格式錯誤時 parse 會拋出 ValueError；統一存成正規化的字串
+        return str(RecurrenceRule.parse(v))
+
+    @field_validator("repeat_exdates", mode="before")
+    @classmethod
+    def split_exdates(cls, v: Any) -> Any:
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return [day.strip() for day in v.split(",") if day.strip()]
+        return v
+
     @field_validator("repeat_end_date", mode="after")
     @classmethod
     def force_to_end_of_day(cls, v: Optional[datetime]) -> Optional[datetime]:
@@ -104,8 +134,12 @@ class MeetingCreateSchema(MeetingBase):
     @model_validator(mode="after")
     def validate_repeat_rules(self) -> Self:
         if self.repeat:
-            if self.repeat_unit is None or self.repeat_unit <= 0:
-                raise ValueError("啟用重複排程時，'repeat_days' 必須為正整數。")
+            if self.repeat_rule is None and (
+                self.repeat_unit is None or self.repeat_unit <= 0
+            ):
+                raise ValueError(
+                    "啟用重複排程時，'repeat_days' 必須為正整數，或提供 'repeat_rule'。"
+                )
             if self.repeat_end_date is None:
                 raise ValueError("啟用重複排程時，必須提供 'repeat_end_date'。")
             if self.repeat_end_date <= self.start_time:
@@ -123,8 +157,11 @@ class MeetingCreateSchema(MeetingBase):
 class MeetingResponseSchema(MeetingBase):
     """
     回傳資料時使用的 Schema：只繼承欄位與格式化，不繼承建立時的業務檢查
+    凍結為不可修改，作為快照在請求與排程器 thread 之間共用（見 app.core.cache）
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: int = Field(..., description="會議主鍵 ID")
     created_at: datetime = Field(..., description="會議創建時間")
     updated_at: datetime = Field(..., description="會議最後更新時間")
@@ -149,8 +186,12 @@ class MeetingUpdateSchema(MeetingBase):
     @model_validator(mode="after")
     def validate_repeat_rules(self) -> Self:
         if self.repeat:
-            if self.repeat_unit is None or self.repeat_unit <= 0:
-                raise ValueError("啟用重複排程時，'repeat_days' 必須為正整數。")
+            if self.repeat_rule is None and (
+                self.repeat_unit is None or self.repeat_unit <= 0
+            ):
+                raise ValueError(
+                    "啟用重複排程時，'repeat_days' 必須為正整數，或提供 'repeat_rule'。"
+                )
             if self.repeat_end_date is None:
                 raise ValueError("啟用重複排程時，必須提供 'repeat_end_date'。")
             if self.repeat_end_date <= self.start_time:
@@ -161,9 +202,13 @@ class MeetingUpdateSchema(MeetingBase):
 class MeetingQuerySchema(BaseModel):
     meeting_name_like: Optional[str] = Field(None, description="依據會議名稱模糊搜索。")
     start_time: Optional[datetime] = Field(None, description="過濾起始時間。")
+    upcoming_only: bool = Field(False, description="僅顯示尚未結束的會議。")
 
+    cursor: Optional[str] = Field(
+        None, description="上一頁回傳的 next_cursor，有值時忽略 skip。"
+    )
     skip: int = Field(0, ge=0, description="跳過的記錄數。")
-    limit: int = Field(100, description="每頁的記錄數。")
+    limit: int = Field(100, ge=1, le=200, description="每頁的記錄數。")
 
     sort_by: str = Field(
         "start_time", pattern=r"^(start_time|meeting_name)$", description="排序欄位。"
@@ -171,13 +216,67 @@ class MeetingQuerySchema(BaseModel):
     order: str = Field("asc", pattern=r"^(asc|desc)$", description="排序順序。")
 
 
+class MeetingSearchQuerySchema(BaseModel):
+    q: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="關鍵字，以空白分隔多個詞（需全部符合），比對會議名稱與建立者。",
+    )
+    limit: int = Field(20, ge=1, le=100, description="最多回傳筆數。")
+
+
+class MeetingPageSchema(CustomBaseModel):
+    """
+    會議列表分頁結果：next_cursor 為 None 表示已經是最後一頁
+    """
+
+    items: List[MeetingResponseSchema] = Field(..., description="當頁會議資料")
+    next_cursor: Optional[str] = Field(None, description="下一頁的游標")
+
+
+# 列表回應以單次 TypeAdapter 呼叫從 ORM 物件驗證，序列化時也共用同一個 adapter
+MeetingListAdapter = TypeAdapter(List[MeetingResponseSchema])
+
+
+def _capture_item_error(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """批次驗證時，單筆失敗不中斷整批，改以 ValidationError 物件作為該筆結果"""
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return e
+
+
+# 一次 TypeAdapter 呼叫驗證整批資料，結果為 MeetingCreateSchema 或 ValidationError
+MeetingBulkCreateAdapter = TypeAdapter(
+    List[Annotated[MeetingCreateSchema, WrapValidator(_capture_item_error)]]
+)
+
+
+class MeetingBulkItemSchema(CustomBaseModel):
+    index: int = Field(..., description="對應請求中的第幾筆")
+    success: bool = Field(..., description="是否建立成功")
+    meeting: Optional[MeetingResponseSchema] = Field(None, description="建立的會議")
+    error: Optional[str] = Field(None, description="失敗原因")
+
+
+class MeetingBulkResponseSchema(CustomBaseModel):
+    created: int = Field(..., description="成功建立的筆數")
+    failed: int = Field(..., description="失敗的筆數")
+    results: List[MeetingBulkItemSchema] = Field(..., description="逐筆結果")
+
+
 # ----- Task Schemas -----
 class TaskResponseSchema(CustomBaseModel):
     """
     用於返回 Task 資料的 Schema (只包含執行狀態和結果)。
+    凍結為不可修改，作為快照在請求與排程器 thread 之間共用（見 app.core.cache）
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: int = Field(..., description="排程主鍵 ID")
+    meeting_id: int = Field(..., description="所屬會議 ID")
     created_at: datetime = Field(..., description="排程創建時間")
     updated_at: datetime = Field(..., description="排程最後更新時間")
 
@@ -195,6 +294,9 @@ class TaskResponseSchema(CustomBaseModel):
     creator_email: str = Field(..., description="會議建立者 Email (取自 Meeting)")
 
 
+TaskListAdapter = TypeAdapter(List[TaskResponseSchema])
+
+
 class TaskUpdateStatusSchema(BaseModel):
     status: TaskStatus
 
@@ -222,3 +324,33 @@ class TaskQuerySchema(BaseModel):
     end_time_le: Optional[datetime] = Field(
         None, description="篩選結束時間小於等於此值的記錄"
     )
+
+
+class TaskStatsQuerySchema(BaseModel):
+    start_time_ge: Optional[datetime] = Field(
+        None, description="統計開始時間大於等於此值的任務"
+    )
+    end_time_le: Optional[datetime] = Field(
+        None, description="統計結束時間小於等於此值的任務"
+    )
+
+
+class TaskExportQuerySchema(TaskStatsQuerySchema):
+    format: str = Field("csv", pattern=r"^(csv|ndjson)$", description="匯出格式。")
+
+
+class TaskStatsBucketSchema(CustomBaseModel):
+    key: str = Field(..., description="分組鍵（狀態總計為 all）")
+    total: int = Field(..., description="任務總數")
+    counts: dict[str, int] = Field(..., description="各狀態的任務數")
+    success_rate: Optional[float] = Field(
+        None, description="(completed + error) / 已結束任務，無已結束任務時為 None"
+    )
+    recorded_minutes: int = Field(..., description="completed/error 任務的總錄製分鐘數")
+
+
+class TaskStatsSchema(CustomBaseModel):
+    overall: TaskStatsBucketSchema = Field(..., description="整體統計")
+    by_meeting_type: List[TaskStatsBucketSchema] = Field(..., description="依會議類型")
+    by_day: List[TaskStatsBucketSchema] = Field(..., description="依日期 (YYYY-MM-DD)")
+    by_week: List[TaskStatsBucketSchema] = Field(..., description="依週次 (YYYY-Www)")
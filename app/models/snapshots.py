@@ -0,0 +1,81 @@
+"""
+會議 / 任務快照的載入與失效
+
+快照本身與快取策略見 app.core.cache。這裡負責：
+- 同步（recorder / monitor）讀取快照，未命中時才查詢 DB
+- 掛在 Session 類別上的事件：任何 Session（API、recorder、monitor）flush 過的
+  會議 / 任務，在 commit 或 rollback 後逐筆失效。rollback 也要失效，
+  因為同一個 Session 可能已讀到並快取了未 commit 的資料。
+  會議變更時，一併失效該會議底下的任務快照（任務快照含會議名稱等欄位）。
+"""
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.cache import meeting_snapshots, task_snapshots
+from app.core.database import database_engine
+from app.models.schemas import MeetingResponseSchema, TaskResponseSchema
+
+from .meeting import MeetingORM
+from .task import TaskORM
+
+
+def get_meeting_snapshot(meeting_id: int) -> MeetingResponseSchema | None:
+    def load():
+        with Session(database_engine) as db:
+            meeting = db.get(MeetingORM, meeting_id)
+            return MeetingResponseSchema.model_validate(meeting) if meeting else None
+
+    return meeting_snapshots.get_or_load(meeting_id, load)
+
+
+def get_task_snapshot(task_id: int) -> TaskResponseSchema | None:
+    def load():
+        generation = meeting_snapshots.generation
+        with Session(database_engine) as db:
+            task = db.scalars(
+                select(TaskORM)
+                .options(joinedload(TaskORM.meeting))
+                .where(TaskORM.id == task_id)
+            ).first()
+            if task is None:
+                return None
+
+            # 已一併載入會議，順便放進會議快照，recorder 接著讀會議時不必再查詢
+            meeting_snapshots.put(
+                task.meeting_id,
+                MeetingResponseSchema.model_validate(task.meeting),
+                generation,
+            )
+            return TaskResponseSchema.model_validate(task)
+
+    return task_snapshots.get_or_load(task_id, load)
+
+
+# ----- Invalidation Events -----
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_snapshot_keys(session: Session, flush_context):
+    meeting_ids, task_ids = session.info.setdefault("snapshot_keys", (set(), set()))
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, MeetingORM):
+            meeting_ids.add(obj.id)
+        elif isinstance(obj, TaskORM):
+            task_ids.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_snapshots(session: Session):
+    keys = session.info.pop("snapshot_keys", None)
+    if keys is None:
+        return
+
+    meeting_ids, task_ids = keys
+    if meeting_ids:
+        meeting_snapshots.invalidate(meeting_ids)
+        task_snapshots.invalidate_where(lambda task: task.meeting_id in meeting_ids)
+    if task_ids:
+        task_snapshots.invalidate(task_ids)
@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, event, inspect
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.core.database import Base, TZDateTime
+from app.core.events import broker
 
 from .enums import TaskStatus
 
@@ -24,6 +25,11 @@ class TaskORM(Base):
     """
 
     __tablename__ = "tasks"
+    # 與 migration 2 (hot_query_indexes) 同名，既有資料庫由 migration 補上
+    __table_args__ = (
+        Index("ix_tasks_status_start_time_end_time", "status", "start_time", "end_time"),
+        Index("ix_tasks_start_time_end_time", "start_time", "end_time"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -70,3 +76,48 @@ class TaskORM(Base):
     @property
     def creator_email(self) -> str:
         return self.meeting.creator_email if self.meeting else ""
+
+
+# ----- Task Status Events -----
+# 任何 Session（API、recorder、monitor）commit 任務變動後，推送給 /events 訂閱者。
+
+
+def _task_payload(task: TaskORM) -> dict:
+    return {
+        "task_id": task.id,
+        "meeting_id": task.meeting_id,
+        "status": getattr(task.status, "value", task.status),
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_task_events(session: Session, flush_context):
+    if not broker.has_subscribers:
+        return
+
+    pending: list[tuple[str, dict]] = session.info.setdefault("task_events", [])
+
+    for obj in session.new:
+        if isinstance(obj, TaskORM):
+            pending.append(("task_created", _task_payload(obj)))
+
+    for obj in session.dirty:
+        if not isinstance(obj, TaskORM):
+            continue
+        if inspect(obj).attrs.status.history.has_changes():
+            pending.append(("task_status", _task_payload(obj)))
+
+    for obj in session.deleted:
+        if isinstance(obj, TaskORM):
+            pending.append(("task_deleted", _task_payload(obj)))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_task_events(session: Session):
+    for name, data in session.info.pop("task_events", []):
+        broker.publish(name, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_task_events(session: Session):
+    session.info.pop("task_events", None)
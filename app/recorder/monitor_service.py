@@ -29,11 +29,13 @@ from datetime import datetime
 from typing import Optional
 
 import psutil
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.core.database import database_engine
 from app.models import TaskORM
 from app.models.enums import TaskStatus
+from app.models.schemas import MeetingResponseSchema, TaskResponseSchema
+from app.models.snapshots import get_meeting_snapshot, get_task_snapshot
 from app.recorder.obs_manager import OBSManager
 from app.recorder.utils import action, kill_process
 from app.recorder.webex_manager import WebexManager
@@ -101,9 +103,11 @@ class MonitorService:
             logger.debug(f"無法檢查 OBS 錄影狀態: {e}")
             return False
 
-    def restart_obs(self, task: TaskORM) -> bool:
+    def restart_obs(
+        self, task: TaskResponseSchema, meeting: MeetingResponseSchema
+    ) -> bool:
         """重啟 OBS 並恢復錄影"""
-        meeting_type = task.meeting.meeting_type.upper()
+        meeting_type = meeting.meeting_type.upper()
         scene_name = (
             config.WEBEX_SCENE_NAME
             if meeting_type == "WEBEX"
@@ -131,9 +135,11 @@ class MonitorService:
                 logger.error(f"Task {task.id}: OBS 重啟失敗 - {str(e)}")
                 return False
 
-    def restart_meeting_platform(self, task: TaskORM) -> bool:
+    def restart_meeting_platform(
+        self, task: TaskResponseSchema, meeting: MeetingResponseSchema
+    ) -> bool:
         """重啟會議平台並重新加入"""
-        meeting_type = task.meeting.meeting_type.upper()
+        meeting_type = meeting.meeting_type.upper()
         process_name = PROCESS_MAP.get(meeting_type)
 
         if not process_name:
@@ -154,11 +160,11 @@ class MonitorService:
 
                 # 重新建立管理器並加入會議
                 meeting_info = {
-                    "meeting_name": task.meeting.meeting_name,
-                    "meeting_url": task.meeting.meeting_url,
-                    "meeting_id": task.meeting.room_id,
-                    "password": task.meeting.meeting_password,
-                    "layout": task.meeting.meeting_layout.upper(),
+                    "meeting_name": meeting.meeting_name,
+                    "meeting_url": meeting.meeting_url,
+                    "meeting_id": meeting.room_id,
+                    "password": meeting.meeting_password,
+                    "layout": meeting.meeting_layout.upper(),
                 }
 
                 if meeting_type == "ZOOM":
@@ -196,7 +202,9 @@ class MonitorService:
         logger.critical(message, extra={"send_email": True})
         state.last_alert_time = now
 
-    def handle_obs_crash(self, task: TaskORM) -> bool:
+    def handle_obs_crash(
+        self, task: TaskResponseSchema, meeting: MeetingResponseSchema
+    ) -> bool:
         """處理 OBS 崩潰"""
         state = self.get_state(task.id)
 
@@ -205,7 +213,7 @@ class MonitorService:
             logger.error(f"Task {task.id}: OBS 已重啟過，不再嘗試")
             self.send_alert(
                 task.id,
-                f"Task {task.id} ({task.meeting.meeting_name}): OBS 重啟失敗，任務終止",
+                f"Task {task.id} ({meeting.meeting_name}): OBS 重啟失敗，任務終止",
                 force=True,
             )
             self.mark_task_failed(task)
@@ -214,18 +222,20 @@ class MonitorService:
         logger.warning(f"Task {task.id}: 檢測到 OBS 崩潰，嘗試重啟")
         state.obs_restart_attempted = True
 
-        success = self.restart_obs(task)
+        success = self.restart_obs(task, meeting)
         if not success:
             self.send_alert(
                 task.id,
-                f"Task {task.id} ({task.meeting.meeting_name}): OBS 重啟失敗",
+                f"Task {task.id} ({meeting.meeting_name}): OBS 重啟失敗",
                 force=True,
             )
             self.mark_task_failed(task)
 
         return success
 
-    def handle_meeting_crash(self, task: TaskORM) -> bool:
+    def handle_meeting_crash(
+        self, task: TaskResponseSchema, meeting: MeetingResponseSchema
+    ) -> bool:
         """處理會議平台崩潰"""
         state = self.get_state(task.id)
 
@@ -237,9 +247,9 @@ class MonitorService:
         logger.warning(f"Task {task.id}: 檢測到會議平台崩潰，嘗試重啟")
         state.meeting_restart_attempted = True
 
-        return self.restart_meeting_platform(task)
+        return self.restart_meeting_platform(task, meeting)
 
-    def mark_task_failed(self, task: TaskORM):
+    def mark_task_failed(self, task: TaskResponseSchema):
         """標記任務為失敗"""
         with Session(database_engine) as db:
             task_in_db = (
@@ -258,60 +268,56 @@ monitor_service = MonitorService()
 def monitor_recording(task_id: int):
     logger.debug(f"Task {task_id}: 開始監控檢查")
 
-    with Session(database_engine) as db:
-        task = (
-            db.query(TaskORM)
-            .options(joinedload(TaskORM.meeting))
-            .filter(TaskORM.id == task_id)
-            .first()
+    # 每次檢查都讀取快照，任務狀態或會議資料寫入時快照才會失效重新查詢
+    task = get_task_snapshot(task_id)
+    meeting = get_meeting_snapshot(task.meeting_id) if task else None
+
+    # 1. 檢查任務是否存在
+    if not task or not meeting:
+        logger.error(f"Task {task_id} 不存在，停止監控")
+        monitor_service.cleanup_state(task_id)
+        return
+
+    # 2. 檢查任務狀態（已完成或已失敗則停止監控）
+    if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+        logger.info(
+            f"Task {task_id} 狀態為 {task.status}，停止監控"
         )
+        monitor_service.cleanup_state(task_id)
+        return
 
-        # 1. 檢查任務是否存在
-        if not task:
-            logger.error(f"Task {task_id} 不存在，停止監控")
-            monitor_service.cleanup_state(task_id)
-            return
+    meeting_type = meeting.meeting_type.upper()
+    meeting_process = PROCESS_MAP.get(meeting_type)
+    all_ok = True
 
-        # 2. 檢查任務狀態（已完成或已失敗則停止監控）
-        if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
-            logger.info(
-                f"Task {task_id} 狀態為 {task.status}，停止監控"
-            )
-            monitor_service.cleanup_state(task_id)
+    # 3. 檢查 OBS 進程
+    if not monitor_service.is_process_running("obs64.exe"):
+        logger.warning(f"Task {task_id}: OBS 進程不存在")
+        if not monitor_service.handle_obs_crash(task, meeting):
             return
+        all_ok = False
 
-        meeting_type = task.meeting.meeting_type.upper()
-        meeting_process = PROCESS_MAP.get(meeting_type)
-        all_ok = True
-
-        # 3. 檢查 OBS 進程
-        if not monitor_service.is_process_running("obs64.exe"):
-            logger.warning(f"Task {task_id}: OBS 進程不存在")
-            if not monitor_service.handle_obs_crash(task):
+    # 4. 檢查 OBS 錄影狀態（進程活著但沒在錄，嘗試單獨恢復錄影）
+    if all_ok and not monitor_service.check_obs_recording_status():
+        logger.warning(f"Task {task_id}: OBS 未錄影，嘗試恢復")
+        try:
+            monitor_service.obs_mgr.start_recording()
+            logger.info(f"Task {task_id}: OBS 錄影已恢復")
+        except Exception as e:
+            logger.error(f"Task {task_id}: OBS 恢復錄影失敗 - {e}，嘗試完整重啟")
+            if not monitor_service.handle_obs_crash(task, meeting):
                 return
-            all_ok = False
+        all_ok = False
 
-        # 4. 檢查 OBS 錄影狀態（進程活著但沒在錄，嘗試單獨恢復錄影）
-        if all_ok and not monitor_service.check_obs_recording_status():
-            logger.warning(f"Task {task_id}: OBS 未錄影，嘗試恢復")
-            try:
-                monitor_service.obs_mgr.start_recording()
-                logger.info(f"Task {task_id}: OBS 錄影已恢復")
-            except Exception as e:
-                logger.error(f"Task {task_id}: OBS 恢復錄影失敗 - {e}，嘗試完整重啟")
-                if not monitor_service.handle_obs_crash(task):
-                    return
+    # 5. 檢查會議平台進程
+    if all_ok and meeting_process:
+        if not monitor_service.is_process_running(meeting_process):
+            logger.warning(f"Task {task_id}: {meeting_type} 進程不存在")
+            monitor_service.handle_meeting_crash(task, meeting)
             all_ok = False
 
-        # 5. 檢查會議平台進程
-        if all_ok and meeting_process:
-            if not monitor_service.is_process_running(meeting_process):
-                logger.warning(f"Task {task_id}: {meeting_type} 進程不存在")
-                monitor_service.handle_meeting_crash(task)
-                all_ok = False
-
-        # 6. 記錄監控結果
-        if all_ok:
-            logger.debug(f"Task {task_id}: 監控正常 ✓")
-        else:
-            logger.info(f"Task {task_id}: 監控發現異常並已處理")
+    # 6. 記錄監控結果
+    if all_ok:
+        logger.debug(f"Task {task_id}: 監控正常 ✓")
+    else:
+        logger.info(f"Task {task_id}: 監控發現異常並已處理")
@@ -23,7 +23,7 @@ class OBSManager:
 
     def __init__(self):
         self.obs_path = config.OBS_PATH
-        self.port = 4455
+        self.port = config.OBS_WEBSOCKET_PORT
 
     def launch_obs(self):
         """
@@ -2,18 +2,20 @@ import logging
 import time
 from datetime import datetime, timedelta
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.core.database import database_engine
 from app.core.exceptions import NotFoundError
+from app.core.jobs import MONITOR_RECORDING
 from app.core.scheduler import scheduler
 from app.models import TaskORM
 from app.models.enums import TaskStatus
-from app.recorder.monitor_service import monitor_recording, monitor_service
+from app.models.snapshots import get_meeting_snapshot, get_task_snapshot
+from app.recorder.monitor_service import monitor_service
 from app.recorder.obs_manager import OBSManager
 from app.recorder.webex_manager import WebexManager
 from app.recorder.zoom_manager import ZoomManager
-from shared.config import config
+from shared.config import TAIPEI_TZ, config
 from shared.logger import update_addressee
 
 from .utils import action, current_task_id, kill_process
@@ -45,124 +47,134 @@ Error Aciotn 則只會在log中記錄，錄影會繼續，但輸出的畫面會
 """
 
 
+def _set_task_status(
+    task_id: int,
+    status: TaskStatus,
+    only_from: tuple[TaskStatus, ...] | None = None,
+) -> bool:
+    """
+    以 DB 中最新的狀態為準更新任務（快照可能已過時），commit 後快照自動失效。
+    only_from: 只有目前狀態在其中時才更新。
+    """
+    with Session(database_engine) as db:
+        task = db.get(TaskORM, task_id)
+        if task is None or (only_from and task.status not in only_from):
+            return False
+        task.status = status
+        db.commit()
+        return True
+
+
 def start_recording(task_id: int):
     current_task_id.set(task_id)
-    task = None
-    with Session(database_engine) as db:
-        task = (
-            db.query(TaskORM)
-            .options(joinedload(TaskORM.meeting))
-            .filter(TaskORM.id == task_id)
-            .first()
+    task = get_task_snapshot(task_id)
+    meeting = get_meeting_snapshot(task.meeting_id) if task else None
+
+    if not task or not meeting:
+        logger.critical(
+            f"找不到 Task {task_id}，取消錄影", extra={"send_email": True}
         )
+        raise NotFoundError(f"找不到 Task {task_id}")
 
-        if not task:
-            logger.critical(
-                f"找不到 Task {task_id}，取消錄影", extra={"send_email": True}
-            )
-            raise NotFoundError(f"找不到 Task {task_id}")
+    meeting_name = meeting.meeting_name
+    meeting_type = meeting.meeting_type.upper()
 
-        meeting_name = task.meeting.meeting_name
-        meeting_type = task.meeting.meeting_type.upper()
+    try:
+        logger.debug(
+            f"收到啟動指令，準備執行 Meeting Name: {meeting.meeting_name} Task ID: {task_id}"
+        )
 
-        try:
-            logger.debug(
-                f"收到啟動指令，準備執行 Meeting Name: {task.meeting.meeting_name} Task ID: {task_id}"
-            )
+        update_addressee(meeting.creator_email)
+        # update_addressee(config.ADDRESSEES_EMAIL)
 
-            update_addressee(task.meeting.creator_email)
-            # update_addressee(config.ADDRESSEES_EMAIL)
+        # Critical Action
+        obs_mgr.launch_obs()
+        time.sleep(1)
 
-            # Critical Action
-            obs_mgr.launch_obs()
-            time.sleep(1)
+        # Critical Action
+        obs_mgr.connect()
+        time.sleep(1)
 
-            # Critical Action
-            obs_mgr.connect()
-            time.sleep(1)
+        # get default scene and recording
+        scene_name = _get_scene_name(meeting_type)
 
-            # get default scene and recording
-            scene_name = _get_scene_name(meeting_type)
+        # Critical Action
+        obs_mgr.setup_obs_scene(
+            scene_name=scene_name,
+            audio_source_name=OBS_SOURCE_MAP[meeting_type],
+        )
 
-            # Critical Action
-            obs_mgr.setup_obs_scene(
-                scene_name=scene_name,
-                audio_source_name=OBS_SOURCE_MAP[meeting_type],
-            )
+        # Critical Action
+        logger.debug(f"{config.ENV}")
+        if config.ENV == "prod":
+            obs_mgr.start_recording()
 
-            # Critical Action
-            logger.debug(f"{config.ENV}")
-            if config.ENV == "prod":
-                obs_mgr.start_recording()
-
-            # ----- status update -----
-            task.status = TaskStatus.RECORDING
-            db.commit()
-            logger.info("OBS 正常啟動且錄影中，更新狀態為'recording'")
-            # -------------------------
-
-            # ========== 新增：啟動監控任務 ==========
-            try:
-                monitor_start = datetime.now() + timedelta(minutes=5)
-                scheduler.add_job(
-                    monitor_recording,
-                    args=[task_id],
-                    trigger="interval",
-                    minutes=5,
-                    start_date=monitor_start,
-                    id=f"task_monitor_{task_id}",
-                    max_instances=1,
-                    replace_existing=True,
-                )
-                logger.info(f"Task {task_id}: 監控任務將於 5 分鐘後啟動")
-            except Exception as e:
-                logger.warning(f"Task {task_id}: 監控任務啟動失敗 - {e}")
-            # =======================================
-
-            meeting_info = {
-                "meeting_name": task.meeting.meeting_name,
-                "meeting_url": task.meeting.meeting_url,
-                "meeting_id": task.meeting.room_id,
-                "password": task.meeting.meeting_password,
-                "layout": task.meeting.meeting_layout.upper(),
-            }
-
-            meeting_mgr = None
-            if meeting_type == "ZOOM":
-                meeting_mgr = ZoomManager(**meeting_info)
-
-            elif meeting_type == "WEBEX":
-                meeting_mgr = WebexManager(**meeting_info)
-
-            else:
-                logger.error(
-                    "OBS正常啟動，但Meeting Menager初始化失敗",
-                    extra={"send_email": True},
-                )
-                raise ValueError("Meeting Manager is None")
-
-            # multiple action
-            meeting_mgr.join_meeting_and_change_layout()
+        # ----- status update -----
+        _set_task_status(task_id, TaskStatus.RECORDING)
+        logger.info("OBS 正常啟動且錄影中，更新狀態為'recording'")
+        # -------------------------
 
+        # ========== 新增：啟動監控任務 ==========
+        try:
+            monitor_start = datetime.now(TAIPEI_TZ) + timedelta(minutes=5)
+            scheduler.add_job(
+                MONITOR_RECORDING,
+                args=[task_id],
+                trigger="interval",
+                minutes=5,
+                start_date=monitor_start,
+                timezone=TAIPEI_TZ,
+                id=f"task_monitor_{task_id}",
+                max_instances=1,
+                replace_existing=True,
+            )
+            logger.info(f"Task {task_id}: 監控任務將於 5 分鐘後啟動")
         except Exception as e:
-            db.rollback()
-            logger.critical(
-                f"執行 start_recording 失敗 (Meeting Name: {meeting_name}, Task ID: {task_id}): {str(e)}",
-                extra={
-                    "send_email": True,
-                    "meeting_name": meeting_name,
-                    "meeting_type": meeting_type,
-                },
+            logger.warning(f"Task {task_id}: 監控任務啟動失敗 - {e}")
+        # =======================================
+
+        meeting_info = {
+            "meeting_name": meeting.meeting_name,
+            "meeting_url": meeting.meeting_url,
+            "meeting_id": meeting.room_id,
+            "password": meeting.meeting_password,
+            "layout": meeting.meeting_layout.upper(),
+        }
+
+        meeting_mgr = None
+        if meeting_type == "ZOOM":
+            meeting_mgr = ZoomManager(**meeting_info)
+
+        elif meeting_type == "WEBEX":
+            meeting_mgr = WebexManager(**meeting_info)
+
+        else:
+            logger.error(
+                "OBS正常啟動，但Meeting Menager初始化失敗",
+                extra={"send_email": True},
             )
+            raise ValueError("Meeting Manager is None")
+
+        # multiple action
+        meeting_mgr.join_meeting_and_change_layout()
 
-            task.status = TaskStatus.FAILED
-            logger.info("start_recording失敗，更新狀態為'failed'")
-            db.commit()
+    except Exception as e:
+        logger.critical(
+            f"執行 start_recording 失敗 (Meeting Name: {meeting_name}, Task ID: {task_id}): {str(e)}",
+            extra={
+                "send_email": True,
+                "meeting_name": meeting_name,
+                "meeting_type": meeting_type,
+            },
+        )
 
-        finally:
-            # Error Action
-            if meeting_type == "WEBEX":
-                obs_mgr.setup_obs_window(task.meeting.meeting_name)
+        _set_task_status(task_id, TaskStatus.FAILED)
+        logger.info("start_recording失敗，更新狀態為'failed'")
+
+    finally:
+        # Error Action
+        if meeting_type == "WEBEX":
+            obs_mgr.setup_obs_window(meeting.meeting_name)
 
 
 def end_recording(task_id: int):
@@ -176,59 +188,54 @@ def end_recording(task_id: int):
     monitor_service.cleanup_state(task_id)
     # =======================================
 
-    task = None
-    with Session(database_engine) as db:
-        task = (
-            db.query(TaskORM)
-            .options(joinedload(TaskORM.meeting))
-            .filter(TaskORM.id == task_id)
-            .first()
-        )
-        if not task:
-            logger.error(
-                f"結束錄影時，找不到 Task ID {task_id}",
-            )
-            raise NotFoundError(f"找不到 Task {task_id}")
+    task = get_task_snapshot(task_id)
+    meeting = get_meeting_snapshot(task.meeting_id) if task else None
 
-        meetig_name = task.meeting.meeting_name
+    if not task or not meeting:
+        logger.error(
+            f"結束錄影時，找不到 Task ID {task_id}",
+        )
+        raise NotFoundError(f"找不到 Task {task_id}")
 
-        try:
-            obs_mgr.connect()
-            time.sleep(1)
+    meetig_name = meeting.meeting_name
 
-            obs_mgr.stop_recording()
-            time.sleep(1)
+    try:
+        obs_mgr.connect()
+        time.sleep(1)
 
-            obs_mgr.disconnect()
+        obs_mgr.stop_recording()
+        time.sleep(1)
 
-            obs_mgr.kill_obs_process_by_taskkill()
-            time.sleep(3)
+        obs_mgr.disconnect()
 
-            logger.info(f"OBS 錄影已停止，Meeting Nname: {meetig_name}, Task {task_id}")
+        obs_mgr.kill_obs_process_by_taskkill()
+        time.sleep(3)
 
-            meeting_type = task.meeting.meeting_type.upper()
+        logger.info(f"OBS 錄影已停止，Meeting Nname: {meetig_name}, Task {task_id}")
 
-            kill_meeting_process(meeting_type)
+        meeting_type = meeting.meeting_type.upper()
 
-            # 4. 更新任務狀態為完成
-            if task.status in (TaskStatus.RECORDING, TaskStatus.ERROR):
-                task.status = TaskStatus.COMPLETED
-                logger.info("更新狀態為'completed'")
-                db.commit()
-                logger.info(
-                    f"Meeting: {meetig_name}, Task ID {task_id} 錄影成功並已完整關閉相關程式"
-                )
+        kill_meeting_process(meeting_type)
 
-        except Exception as e:
-            db.rollback()
-            logger.critical(
-                f"執行 end_recording 失敗 (Meeting: {meetig_name}, Task ID: {task_id}): {str(e)}",
-                extra={"send_email": True},
+        # 4. 更新任務狀態為完成
+        if _set_task_status(
+            task_id,
+            TaskStatus.COMPLETED,
+            only_from=(TaskStatus.RECORDING, TaskStatus.ERROR),
+        ):
+            logger.info("更新狀態為'completed'")
+            logger.info(
+                f"Meeting: {meetig_name}, Task ID {task_id} 錄影成功並已完整關閉相關程式"
             )
 
-            task.status = TaskStatus.FAILED
-            logger.info("end_recording失敗，更新狀態為'failed'")
-            db.commit()
+    except Exception as e:
+        logger.critical(
+            f"執行 end_recording 失敗 (Meeting: {meetig_name}, Task ID: {task_id}): {str(e)}",
+            extra={"send_email": True},
+        )
+
+        _set_task_status(task_id, TaskStatus.FAILED)
+        logger.info("end_recording失敗，更新狀態為'failed'")
 
 
 def kill_meeting_process(meeting_type: str | None):
@@ -11,9 +11,12 @@ import win32con
 import win32gui
 
 from app.core.exceptions import ActionError
+from app.core.metrics import action_total
 
 logger = logging.getLogger(__name__)
 
+TASK_SUFFIX_PATTERN = re.compile(r"\s*\(Task \d+\)")
+
 current_task_id: ContextVar[int | None] = ContextVar("current_task_id", default=None)
 
 
@@ -193,11 +196,15 @@ def action(
     setting = setting or {}
     logger = setting.get("logger", logger)
     logger.debug(f"開始執行 [{action_name}] 操作")
+    # 去掉 "(Task 12)" 之類的任務編號，避免 metric label 隨任務數量無限增加
+    metric_name = TASK_SUFFIX_PATTERN.sub("", action_name)
     try:
         yield
         logger.info(f"成功執行 [{action_name}] 操作")
+        action_total.inc(metric_name, "success")
 
     except Exception as e:
+        action_total.inc(metric_name, "failure")
         if is_critical:
             logger.critical(f"重大操作: {action_name} 失敗: {e}", exc_info=True)
             raise ActionError(f"操作 [{action_name}] 失敗, {e}") from e
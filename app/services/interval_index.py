@@ -0,0 +1,58 @@
+"""
+半開區間 [start, end) 的重疊查詢
+
+排程重疊檢查以單一範圍查詢載入時間窗內的所有進行中任務，
+再以本結構檢查每個候選時段，取代每個時段各查詢一次 DB。
+
+- 載入的區間（可能彼此重疊）：依 start 排序，並記錄每個前綴中 end 最大的區間。
+  [s, e) 與某區間重疊 ⇔ 該區間 start < e 且 end > s：
+  bisect 找出 start < e 的前綴，再看前綴中最大的 end 是否 > s，查詢 O(log n)。
+- add() 加入的區間（同批次已接受的時段）：呼叫端保證不與任何已知區間重疊，
+  彼此不相交，依 start 排序時 end 也遞增，只需檢查插入位置前一個區間。
+"""
+
+import bisect
+from datetime import datetime
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime, T]] = ()):
+        items = sorted(intervals, key=lambda item: item[0])
+        self._starts = [start for start, _, _ in items]
+        self._items = items
+
+        # _max_at[i]：items[0..i] 中 end 最大者的位置
+        self._max_at: list[int] = []
+        for i, (_, end, _) in enumerate(items):
+            if not self._max_at or end > items[self._max_at[-1]][1]:
+                self._max_at.append(i)
+            else:
+                self._max_at.append(self._max_at[-1])
+
+        self._added_starts: list[datetime] = []
+        self._added: list[tuple[datetime, datetime, T]] = []
+
+    def find_overlap(self, start: datetime, end: datetime) -> T | None:
+        """回傳任一與 [start, end) 重疊的區間擁有者，沒有則為 None"""
+        k = bisect.bisect_left(self._starts, end)
+        if k:
+            _, max_end, owner = self._items[self._max_at[k - 1]]
+            if max_end > start:
+                return owner
+
+        k = bisect.bisect_left(self._added_starts, end)
+        if k:
+            _, prev_end, owner = self._added[k - 1]
+            if prev_end > start:
+                return owner
+
+        return None
+
+    def add(self, start: datetime, end: datetime, owner: T):
+        """加入已確認不與任何區間重疊的區間"""
+        k = bisect.bisect_left(self._added_starts, start)
+        self._added_starts.insert(k, start)
+        self._added.insert(k, (start, end, owner))
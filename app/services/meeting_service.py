@@ -1,16 +1,33 @@
+import base64
+import json
 import logging
 from datetime import datetime
-from typing import List
-
-from sqlalchemy import case, select
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.exceptions import NotFoundError
-from app.models.meeting import MeetingORM
+from typing import Any, List
+
+from pydantic import ValidationError
+from sqlalchemy import func, literal, literal_column, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.cache import meeting_snapshots
+from app.core.exceptions import InvalidQueryError, NotFoundError, TaskOverlapError
+from app.models import MeetingORM, TaskORM
+from app.models.meeting_fts import (
+    FTS_COLUMNS,
+    FTS_RANK_WEIGHTS,
+    FTS_TABLE,
+    meetings_fts,
+)
 from app.models.schemas import (
+    MeetingBulkCreateAdapter,
+    MeetingBulkItemSchema,
+    MeetingBulkResponseSchema,
     MeetingCreateSchema,
+    MeetingListAdapter,
+    MeetingPageSchema,
     MeetingQuerySchema,
     MeetingResponseSchema,
+    MeetingSearchQuerySchema,
     MeetingUpdateSchema,
 )
 from shared.config import TAIPEI_TZ
@@ -25,13 +42,19 @@ class MeetingService:
     會議服務類別：處理 Meeting 的 CRUD，並協調 Task 的自動生成。
     """
 
-    def __init__(self, db: Session, task_service: TaskService):
+    def __init__(self, db: AsyncSession, task_service: TaskService):
         self.db = db
         self.task_service = task_service
         self.logger = meeting_service_logger
 
+    async def _get_meeting(self, meeting_id: int) -> MeetingORM | None:
+        result = await self.db.execute(
+            select(MeetingORM).where(MeetingORM.id == meeting_id)
+        )
+        return result.scalars().first()
+
     # ----- Create Methods -----
-    def create_meeting_and_task(
+    async def create_meeting_and_task(
         self,
         meeting_data: MeetingCreateSchema,
     ) -> MeetingResponseSchema:
@@ -43,17 +66,25 @@ class MeetingService:
         # write meeting to DB
         try:
             self.db.add(meeting)
-            self.db.flush()
-            tasks = self.task_service.create_task(meeting=meeting)
-            self.db.commit()
+            await self.db.flush()
+            tasks = await self.task_service.create_task(meeting=meeting)
+            scheduled = [(task, meeting.meeting_name) for task in tasks]
+
+            # jobstore 在會議 DB 時，任務與 Job 一起 commit，不會留下沒有 Job 的任務
+            if self.task_service.jobs_in_transaction:
+                await self.task_service.schedule_tasks(scheduled)
+
+            await self.db.commit()
+            # created_at/updated_at 由 SQL 預設值產生，需重新載入
+            await self.db.refresh(meeting)
 
             tasks_id = [task.id for task in tasks]
             self.logger.info(
                 f"Creating Tasks ID: {tasks_id} for Meeting ID {meeting.id})"
             )
 
-            for task in tasks:
-                self.task_service.add_job_to_scheduler(task_id=task.id)
+            if not self.task_service.jobs_in_transaction:
+                await self.task_service.schedule_tasks(scheduled)
 
         except Exception as e:
             self.logger.error(
@@ -63,86 +94,244 @@ class MeetingService:
 
         return MeetingResponseSchema.model_validate(meeting)
 
+    async def create_meetings_bulk(
+        self,
+        items: List[dict[str, Any]],
+    ) -> MeetingBulkResponseSchema:
+        """
+        批次建立會議：
+        1. 單次 TypeAdapter 驗證整批資料
+        2. 單次查詢檢查與 DB 及同批次之間的時間重疊
+        3. 所有會議與任務在同一個 transaction 寫入
+        4. 所有 Job 在同一個 jobstore transaction 寫入
+        驗證或重疊失敗的項目逐筆回報，不影響其他項目。
+        """
+        results: dict[int, MeetingBulkItemSchema] = {}
+        candidates: list[tuple[int, MeetingORM]] = []
+
+        for index, item in enumerate(MeetingBulkCreateAdapter.validate_python(items)):
+            if isinstance(item, ValidationError):
+                error = "; ".join(err["msg"] for err in item.errors())
+                results[index] = MeetingBulkItemSchema(
+                    index=index, success=False, error=error
+                )
+                continue
+            candidates.append((index, MeetingORM(**item.model_dump())))
+
+        plans = await self.task_service.plan_tasks_bulk(
+            [meeting for _, meeting in candidates]
+        )
+
+        accepted: list[tuple[int, MeetingORM, list]] = []
+        for (index, meeting), plan in zip(candidates, plans):
+            if isinstance(plan, TaskOverlapError):
+                results[index] = MeetingBulkItemSchema(
+                    index=index, success=False, error=plan.detail
+                )
+                continue
+            accepted.append((index, meeting, plan))
+
+        if accepted:
+            try:
+                self.db.add_all([meeting for _, meeting, _ in accepted])
+                await self.db.flush()
+
+                scheduled: list[tuple[TaskORM, str]] = []
+                for _, meeting, plan in accepted:
+                    tasks = self.task_service.add_task_rows(meeting, plan)
+                    scheduled.extend((task, meeting.meeting_name) for task in tasks)
+
+                await self.db.flush()
+                if self.task_service.jobs_in_transaction:
+                    await self.task_service.schedule_tasks(scheduled)
+                await self.db.commit()
+
+                # 一次重新載入 created_at/updated_at 等由 SQL 產生的欄位
+                meeting_ids = [meeting.id for _, meeting, _ in accepted]
+                result = await self.db.execute(
+                    select(MeetingORM)
+                    .where(MeetingORM.id.in_(meeting_ids))
+                    .execution_options(populate_existing=True)
+                )
+                result.scalars().all()
+                self.logger.info(
+                    f"Bulk created Meeting IDs {meeting_ids} "
+                    + f"with {len(scheduled)} tasks."
+                )
+
+                if not self.task_service.jobs_in_transaction:
+                    await self.task_service.schedule_tasks(scheduled)
+
+            except Exception as e:
+                self.logger.error(f"Failed to bulk create meetings. Error: {e}")
+                raise
+
+            for index, meeting, _ in accepted:
+                results[index] = MeetingBulkItemSchema(
+                    index=index,
+                    success=True,
+                    meeting=MeetingResponseSchema.model_validate(meeting),
+                )
+
+        ordered = [results[index] for index in sorted(results)]
+        created = sum(1 for result in ordered if result.success)
+        return MeetingBulkResponseSchema(
+            created=created, failed=len(ordered) - created, results=ordered
+        )
+
     # ----- Query Methods -----
-    def get_meeting_by_id(
+    async def get_meeting_by_id(
         self,
         meeting_id: int,
     ) -> MeetingResponseSchema:
         """
-        根據 ID 獲取 Meeting 記錄，包含關聯的 Tasks。
+        根據 ID 獲取 Meeting 記錄，優先使用快照快取（寫入時自動失效）。
         """
-        meeting = (
-            self.db.query(MeetingORM)
-            .options(joinedload(MeetingORM.tasks))
-            .filter(MeetingORM.id == meeting_id)
-            .first()
-        )
 
-        if not meeting:
+        async def load() -> MeetingResponseSchema | None:
+            meeting = await self._get_meeting(meeting_id)
+            return MeetingResponseSchema.model_validate(meeting) if meeting else None
+
+        snapshot = await meeting_snapshots.aget_or_load(meeting_id, load)
+
+        if not snapshot:
             self.logger.warning(f"Meeting ID {meeting_id} not found.")
             raise NotFoundError(detail=f"Meeting ID {meeting_id} not found.")
 
-        return MeetingResponseSchema.model_validate(meeting)
+        return snapshot
 
-    def get_meetings(
+    async def get_meetings(
         self,
         params: MeetingQuerySchema,
-    ) -> List[MeetingResponseSchema]:
+    ) -> MeetingPageSchema:
         """
-        根據查詢參數獲取 Meeting 列表，支持分頁和排序。
+        根據查詢參數獲取 Meeting 列表，過濾與排序皆在 SQL 端完成。
+        分頁使用 keyset (sort_by, id)：帶 cursor 時從上一頁最後一筆之後開始，
+        深層頁面與第一頁成本相同；未帶 cursor 時才使用 skip。
         """
-        now = datetime.now(tz=TAIPEI_TZ)
+        sort_col = getattr(MeetingORM, params.sort_by)
+        is_desc = params.order == "desc"
 
         stmt = select(MeetingORM)
 
-        # 定義「是否尚未結束」的條件
-        is_not_finished = case(
-            ((MeetingORM.repeat.is_(True)) & (MeetingORM.repeat_end_date >= now), 0),
-            ((MeetingORM.repeat.is_(False)) & (MeetingORM.end_time >= now), 0),
-            else_=1,
-        )
-
-        stmt = stmt.order_by(
-            # 第一優先級：未結束(0) 在前，已結束(1) 在後
-            is_not_finished.asc(),
-            # 第二優先級：處理「未結束」群組的正序 (asc)
-            # 當符合未結束條件時，回傳時間值；否則回傳 NULL。
-            # NULL 會被排在最後面，不影響此處的 asc 排序。
-            case(
-                (
-                    (
-                        (MeetingORM.repeat.is_(True))
-                        & (MeetingORM.repeat_end_date >= now)
-                    )
-                    | ((MeetingORM.repeat.is_(False)) & (MeetingORM.end_time >= now)),
-                    MeetingORM.start_time,
+        if params.meeting_name_like:
+            stmt = stmt.where(
+                MeetingORM.meeting_name.contains(
+                    params.meeting_name_like, autoescape=True
                 )
             )
-            .asc()
-            .nullslast(),
-            # 第三優先級：處理「已結束」群組的反序 (desc)
-            # 邏輯同上，但針對已結束的資料回傳時間值，並套用 desc。
-            case(
-                (
-                    ((MeetingORM.repeat.is_(True)) & (MeetingORM.repeat_end_date < now))
-                    | ((MeetingORM.repeat.is_(False)) & (MeetingORM.end_time < now)),
-                    MeetingORM.start_time,
+
+        if params.start_time:
+            stmt = stmt.where(MeetingORM.start_time >= params.start_time)
+
+        if params.upcoming_only:
+            now = datetime.now(tz=TAIPEI_TZ)
+            stmt = stmt.where(
+                or_(
+                    (MeetingORM.repeat.is_(True)) & (MeetingORM.repeat_end_date >= now),
+                    (MeetingORM.repeat.is_(False)) & (MeetingORM.end_time >= now),
                 )
             )
-            .desc()
-            .nullslast(),
+
+        if params.cursor:
+            last_value, last_id = self._decode_cursor(params)
+            keyset = tuple_(sort_col, MeetingORM.id)
+            bound = tuple_(literal(last_value, sort_col.type), literal(last_id))
+            stmt = stmt.where(keyset < bound if is_desc else keyset > bound)
+        elif params.skip:
+            stmt = stmt.offset(params.skip)
+
+        if is_desc:
+            stmt = stmt.order_by(sort_col.desc(), MeetingORM.id.desc())
+        else:
+            stmt = stmt.order_by(sort_col.asc(), MeetingORM.id.asc())
+
+        # 多取一筆判斷是否還有下一頁
+        results = (await self.db.execute(stmt.limit(params.limit + 1))).scalars().all()
+        meetings = results[: params.limit]
+
+        next_cursor = None
+        if len(results) > params.limit:
+            next_cursor = self._encode_cursor(params, meetings[-1])
+
+        return MeetingPageSchema(
+            items=MeetingListAdapter.validate_python(meetings, from_attributes=True),
+            next_cursor=next_cursor,
         )
 
-        results = self.db.execute(stmt).scalars().all()
-        return [MeetingResponseSchema.model_validate(meeting) for meeting in results]
+    async def search_meetings(
+        self,
+        params: MeetingSearchQuerySchema,
+    ) -> List[MeetingResponseSchema]:
+        """
+        以 FTS5 (trigram) 全文檢索會議名稱與建立者，依 bm25 相關度排序。
+        3 個字以上的關鍵字走索引；較短的關鍵字 trigram 無法索引，改以 LIKE 過濾。
+        """
+        terms = params.q.split()
+        indexed = [term for term in terms if len(term) >= 3]
+        short = [term for term in terms if len(term) < 3]
+
+        stmt = select(MeetingORM)
+
+        if indexed:
+            fts = literal_column(FTS_TABLE)
+            # 每個詞以 phrase 引號包住，使用者輸入的 FTS 語法字元不會被解譯
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in indexed)
+            stmt = (
+                stmt.join(meetings_fts, meetings_fts.c.rowid == MeetingORM.id)
+                .where(fts.op("MATCH")(match))
+                .order_by(func.bm25(fts, *FTS_RANK_WEIGHTS), MeetingORM.start_time.desc())
+            )
+        else:
+            stmt = stmt.order_by(MeetingORM.start_time.desc())
+
+        for term in short:
+            stmt = stmt.where(
+                or_(
+                    *(
+                        getattr(MeetingORM, name).contains(term, autoescape=True)
+                        for name in FTS_COLUMNS
+                    )
+                )
+            )
+
+        meetings = (await self.db.execute(stmt.limit(params.limit))).scalars().all()
+        return MeetingListAdapter.validate_python(meetings, from_attributes=True)
+
+    @staticmethod
+    def _encode_cursor(params: MeetingQuerySchema, meeting: MeetingORM) -> str:
+        value = getattr(meeting, params.sort_by)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+
+        payload = [params.sort_by, params.order, value, meeting.id]
+        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    def _decode_cursor(self, params: MeetingQuerySchema) -> tuple[Any, int]:
+        try:
+            raw = base64.urlsafe_b64decode(params.cursor.encode("ascii"))
+            sort_by, order, value, last_id = json.loads(raw)
+            if sort_by == "start_time":
+                value = datetime.fromisoformat(value)
+            last_id = int(last_id)
+
+        except Exception:
+            self.logger.warning(f"Invalid meeting cursor: {params.cursor}")
+            raise InvalidQueryError(detail="cursor 格式錯誤")
+
+        if (sort_by, order) != (params.sort_by, params.order):
+            raise InvalidQueryError(detail="cursor 與目前的排序條件不一致")
+
+        return value, last_id
 
     # ----- Update Methods -----
-    def update_meeting(
+    async def update_meeting(
         self,
         meeting_id: int,
         data: MeetingUpdateSchema,
     ) -> MeetingResponseSchema:
-        meeting = self.db.query(MeetingORM).filter(MeetingORM.id == meeting_id).first()
+        meeting = await self._get_meeting(meeting_id)
 
         if not meeting:
             self.logger.error(f"Cannot update: Meeting ID {meeting_id} not found.")
@@ -156,6 +345,8 @@ class MeetingService:
             "repeat",
             "repeat_unit",
             "repeat_end_date",
+            "repeat_rule",
+            "repeat_exdates",
         ]
         task_change = False
         for key, value in updates_data.items():
@@ -163,42 +354,47 @@ class MeetingService:
                 task_change = True
             setattr(meeting, key, value)
         if task_change:
-            self.task_service.update_task(meeting)
+            await self.task_service.update_task(meeting)
 
         try:
-            self.db.commit()
-            self.db.refresh(meeting)
+            await self.db.commit()
+            await self.db.refresh(meeting)
             self.logger.info(f"會議 {meeting_id} 更新完成")
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"資料庫更新失敗: {str(e)}")
             raise
 
         return MeetingResponseSchema.model_validate(meeting)
 
     # ----- Delete Methods -----
-    def delete_meeting(
+    async def delete_meeting(
         self,
         meeting_id: int,
     ) -> MeetingResponseSchema:
         """
         刪除指定 ID 的 Meeting 記錄及其關聯的 Tasks。
         """
-        meeting = self.db.query(MeetingORM).filter(MeetingORM.id == meeting_id).first()
+        # cascade 刪除需要先載入 tasks，async session 無法 lazy load
+        result = await self.db.execute(
+            select(MeetingORM)
+            .options(selectinload(MeetingORM.tasks))
+            .where(MeetingORM.id == meeting_id)
+        )
+        meeting = result.scalars().first()
 
         if not meeting:
             self.logger.error(f"Cannot delete: Meeting ID {meeting_id} not found.")
             raise NotFoundError(detail=f"Meeting ID {meeting_id} not found.")
 
         try:
-            self.db.delete(meeting)
+            await self.db.delete(meeting)
             self.logger.info(
                 f"Deleted Meeting ID {meeting_id} and its associated tasks."
             )
 
-            for deleted_task_id in [task.id for task in meeting.tasks]:
-                self.task_service.remove_job_from_scheduler(deleted_task_id)
+            await self.task_service.remove_jobs([task.id for task in meeting.tasks])
 
         except Exception as e:
             self.logger.error(f"Failed to delete Meeting ID {meeting_id}. Error: {e}")
@@ -1,16 +1,36 @@
+import asyncio
+import csv
+import io
+import json
 import logging
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import List
+from typing import AsyncIterator, Collection, List
 
+from sqlalchemy import Select, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy.orm.query import Query
+
+from app.core.cache import task_snapshots
+from app.core.database import AsyncSessionLocal, database_engine
 from app.core.exceptions import NotFoundError, SchedulingError, TaskOverlapError
-from app.core.scheduler import scheduler
+from app.core.jobs import END_RECORDING, START_RECORDING
+from app.core.scheduler import JOBSTORE_IN_MEETING_DB, scheduler
 from app.models import MeetingORM, TaskORM
 from app.models.enums import TaskStatus
-from app.models.schemas import TaskQuerySchema, TaskResponseSchema
-from app.recorder.recorder import end_recording, start_recording
-from shared.config import TAIPEI_TZ
+from app.models.recurrence import Recurrence
+from app.models.schemas import (
+    TaskExportQuerySchema,
+    TaskListAdapter,
+    TaskQuerySchema,
+    TaskResponseSchema,
+    TaskStatsBucketSchema,
+    TaskStatsQuerySchema,
+    TaskStatsSchema,
+)
+from shared.config import TAIPEI_TZ, config
+
+from .interval_index import IntervalIndex
 
 task_service_logger = logging.getLogger(__name__)
 
@@ -20,16 +40,25 @@ class TaskService:
     任務服務類別：處理 Task 數據的持久化、排程和查詢。
     """
 
-    def __init__(self, db: Session):
+    # 有實際產出錄影檔的狀態（error 為錄製中途出錯但仍有檔案）
+    RECORDED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.ERROR)
+
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.scheduler = scheduler
         self.logger = task_service_logger
+        # jobstore 與會議 DB 共用 engine 時，Job 的新增 / 刪除寫入同一個 transaction
+        self.jobs_in_transaction = JOBSTORE_IN_MEETING_DB
 
-    def _get_base_query(self) -> Query[TaskORM]:
-        return self.db.query(TaskORM).options(joinedload(TaskORM.meeting))
+    def _get_base_query(self) -> Select[tuple[TaskORM]]:
+        return select(TaskORM).options(joinedload(TaskORM.meeting))
+
+    async def _get_task(self, task_id: int) -> TaskORM | None:
+        result = await self.db.execute(select(TaskORM).where(TaskORM.id == task_id))
+        return result.scalars().first()
 
     # ----- Insert and Schedule Methods -----
-    def create_task(
+    async def create_task(
         self,
         meeting: MeetingORM,
     ) -> List[TaskORM]:
@@ -38,103 +67,473 @@ class TaskService:
         這是 MeetingService 協調 TaskService 的入口點。
         """
 
-        execute_time = self._calculate_execute_time(meeting)
-        created_tasks: list[TaskORM] = []
+        until = self.horizon_end()
+        execute_time = self._calculate_execute_time(meeting, until)
 
-        for start_dt, end_dt in execute_time:
-            overlap = self.db.query(TaskORM).filter(
-                TaskORM.status.in_([TaskStatus.UPCOMING, TaskStatus.RECORDING]),
-                TaskORM.start_time < end_dt,
-                TaskORM.end_time > start_dt,
-            ).first()
+        if execute_time:
+            # 單次範圍查詢載入時間窗內的進行中任務，再於記憶體中檢查所有時段
+            index = await self._load_interval_index(execute_time)
+            conflicts = self._find_conflicts(index, execute_time)
+            if conflicts:
+                raise self._overlap_error(conflicts)
 
-            if overlap:
-                raise TaskOverlapError(
-                    detail=f"任務時間 {start_dt} ~ {end_dt} 與現有任務 (Task {overlap.id}) 重疊"
-                )
+        created_tasks = self.add_task_rows(meeting, execute_time)
+        meeting.materialized_until = until if meeting.repeat else None
+        await self.db.flush()
+        return created_tasks
+
+    async def plan_tasks_bulk(
+        self,
+        meetings: List[MeetingORM],
+    ) -> List[List[tuple[datetime, datetime]] | TaskOverlapError]:
+        """
+        批次建立前的規劃：計算每個會議的執行時間，並同時檢查與 DB 及同批次其他會議的重疊。
+        DB 只查詢一次（整批時間範圍內的進行中任務），不寫入任何資料。
+        回傳與 meetings 一一對應的執行時間，有重疊者為 TaskOverlapError。
+        未重疊的會議會一併記錄已建立任務的時間範圍（materialized_until）。
+        """
+        until = self.horizon_end()
+        planned = [self._calculate_execute_time(meeting, until) for meeting in meetings]
+        all_times = [times for occurrences in planned for times in occurrences]
+        if not all_times:
+            return planned
+
+        index = await self._load_interval_index(all_times)
+
+        results: List[List[tuple[datetime, datetime]] | TaskOverlapError] = []
+        for meeting, occurrences in zip(meetings, planned):
+            conflicts = self._find_conflicts(index, occurrences)
+            if conflicts:
+                results.append(self._overlap_error(conflicts))
+                continue
 
-            task_instance = TaskORM(
+            for start_dt, end_dt in occurrences:
+                index.add(start_dt, end_dt, f"同批次會議「{meeting.meeting_name}」")
+            meeting.materialized_until = until if meeting.repeat else None
+            results.append(occurrences)
+
+        return results
+
+    def add_task_rows(
+        self,
+        meeting: MeetingORM,
+        execute_time: List[tuple[datetime, datetime]],
+    ) -> List[TaskORM]:
+        """將執行時間轉為 UPCOMING 的 TaskORM 並加入 session（不 flush）"""
+        tasks = self._new_task_rows(meeting, execute_time)
+        self.db.add_all(tasks)
+        return tasks
+
+    @staticmethod
+    def _new_task_rows(
+        meeting: MeetingORM,
+        execute_time: List[tuple[datetime, datetime]],
+    ) -> List[TaskORM]:
+        return [
+            TaskORM(
                 meeting_id=meeting.id,
                 status=TaskStatus.UPCOMING,
                 start_time=start_dt,
                 end_time=end_dt,
             )
-            self.db.add(task_instance)
-            created_tasks.append(task_instance)
+            for start_dt, end_dt in execute_time
+        ]
+
+    @staticmethod
+    def _active_intervals_query(
+        window_start: datetime,
+        window_end: datetime,
+    ) -> Select[tuple[datetime, datetime, int]]:
+        return (
+            select(TaskORM.start_time, TaskORM.end_time, TaskORM.id)
+            .where(
+                TaskORM.status.in_([TaskStatus.UPCOMING, TaskStatus.RECORDING]),
+                TaskORM.start_time < window_end,
+                TaskORM.end_time > window_start,
+            )
+            .order_by(TaskORM.start_time)
+        )
 
-        self.db.flush()
-        return created_tasks
+    async def _load_active_intervals(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> List[tuple[datetime, datetime, int]]:
+        result = await self.db.execute(
+            self._active_intervals_query(window_start, window_end)
+        )
+        return list(result.all())
+
+    async def _load_interval_index(
+        self,
+        occurrences: List[tuple[datetime, datetime]],
+        exclude: Collection[int] = (),
+    ) -> IntervalIndex[str]:
+        """exclude：即將被移動或刪除的任務，不參與重疊檢查"""
+        window_start = min(start_dt for start_dt, _ in occurrences)
+        window_end = max(end_dt for _, end_dt in occurrences)
+        return IntervalIndex(
+            (start_dt, end_dt, f"現有任務 (Task {task_id})")
+            for start_dt, end_dt, task_id in await self._load_active_intervals(
+                window_start, window_end
+            )
+            if task_id not in exclude
+        )
+
+    @staticmethod
+    def _find_conflicts(
+        index: IntervalIndex[str],
+        occurrences: List[tuple[datetime, datetime]],
+    ) -> List[str]:
+        """
+        回傳所有重疊時段的說明（而非只有第一個），O((n + m) log n)。
+        同一會議的時段之間也不可重疊（例如重複週期短於會議長度）。
+        """
+        conflicts: List[str] = []
+        prev_end = None
+
+        for start_dt, end_dt in sorted(occurrences):
+            owner = index.find_overlap(start_dt, end_dt)
+            if owner is None and prev_end is not None and prev_end > start_dt:
+                owner = "同一會議的前一個時段"
+            if owner is not None:
+                conflicts.append(f"任務時間 {start_dt} ~ {end_dt} 與{owner}重疊")
+            prev_end = end_dt if prev_end is None else max(prev_end, end_dt)
+
+        return conflicts
+
+    @staticmethod
+    def _overlap_error(conflicts: List[str]) -> TaskOverlapError:
+        detail = "；".join(conflicts[:3])
+        if len(conflicts) > 3:
+            detail += f"…等共 {len(conflicts)} 個時段重疊"
+        return TaskOverlapError(detail=detail, conflicts=conflicts)
 
     # ----- Query Methods -----
-    def get_all_tasks(
+    async def get_all_tasks(
         self,
         params: TaskQuerySchema,
     ) -> List[TaskResponseSchema]:
-        query = self._get_base_query()
+        stmt = self._get_base_query()
 
         # filtering
         if params.status:
-            query = query.filter(TaskORM.status == params.status)
+            stmt = stmt.where(TaskORM.status == params.status)
 
         # 在 get_all_tasks 方法中加入時間過濾
         if params.start_time_ge:
-            query = query.filter(TaskORM.start_time >= params.start_time_ge)
+            stmt = stmt.where(TaskORM.start_time >= params.start_time_ge)
 
         if params.end_time_le:
-            query = query.filter(TaskORM.end_time <= params.end_time_le)
+            stmt = stmt.where(TaskORM.end_time <= params.end_time_le)
 
         # pagination
-        tasks = (
-            query.order_by(TaskORM.start_time.asc())
+        stmt = (
+            stmt.order_by(TaskORM.start_time.asc())
             .offset(params.skip)
             .limit(params.limit)
-            .all()
         )
+        tasks = (await self.db.execute(stmt)).scalars().all()
 
-        return [TaskResponseSchema.model_validate(task) for task in tasks]
+        return TaskListAdapter.validate_python(tasks, from_attributes=True)
 
-    def get_task_by_id(
+    async def get_task_by_id(
         self,
         task_id: int,
     ) -> TaskResponseSchema:
-        task = self._get_base_query().filter(TaskORM.id == task_id).first()
+        async def load() -> TaskResponseSchema | None:
+            result = await self.db.execute(
+                self._get_base_query().where(TaskORM.id == task_id)
+            )
+            task = result.scalars().first()
+            return TaskResponseSchema.model_validate(task) if task else None
 
-        if not task:
+        # 優先使用快照快取，任務或所屬會議寫入時自動失效
+        snapshot = await task_snapshots.aget_or_load(task_id, load)
+
+        if not snapshot:
             self.logger.warning(f"Task ID {task_id} not found.")
             raise NotFoundError(detail=f"Task ID {task_id} not found.")
 
-        return TaskResponseSchema.model_validate(task)
+        return snapshot
+
+    async def get_task_stats(self, params: TaskStatsQuerySchema) -> TaskStatsSchema:
+        """
+        任務統計：單一 GROUP BY (日期, 週次, 會議類型, 狀態) 查詢，
+        再於記憶體中彙總成整體 / 會議類型 / 日 / 週四種分組，不受列表分頁上限影響。
+        錄製分鐘數優先使用 duration_minutes，沒有時以排程起訖時間計算。
+        """
+        day = func.date(TaskORM.start_time).label("day")
+        week = func.strftime("%Y-W%W", TaskORM.start_time).label("week")
+        minutes = func.coalesce(
+            TaskORM.duration_minutes,
+            (func.julianday(TaskORM.end_time) - func.julianday(TaskORM.start_time))
+            * 1440,
+        )
+        recorded = case(
+            (TaskORM.status.in_(self.RECORDED_STATUSES), minutes), else_=0
+        )
+
+        stmt = (
+            select(
+                day,
+                week,
+                MeetingORM.meeting_type,
+                TaskORM.status,
+                func.count(TaskORM.id),
+                func.coalesce(func.sum(recorded), 0),
+            )
+            .join(TaskORM.meeting)
+            .group_by(day, week, MeetingORM.meeting_type, TaskORM.status)
+        )
+
+        if params.start_time_ge:
+            stmt = stmt.where(TaskORM.start_time >= params.start_time_ge)
+
+        if params.end_time_le:
+            stmt = stmt.where(TaskORM.end_time <= params.end_time_le)
+
+        rows = (await self.db.execute(stmt)).all()
+
+        def new_bucket() -> dict:
+            return {"counts": Counter(), "minutes": 0.0}
+
+        overall = new_bucket()
+        groups: dict[str, defaultdict[str, dict]] = {
+            "by_meeting_type": defaultdict(new_bucket),
+            "by_day": defaultdict(new_bucket),
+            "by_week": defaultdict(new_bucket),
+        }
+
+        for day_key, week_key, meeting_type, status, count, total_minutes in rows:
+            keys = {
+                "by_meeting_type": getattr(meeting_type, "value", meeting_type),
+                "by_day": day_key,
+                "by_week": week_key,
+            }
+            for bucket in (overall, *(groups[g][k] for g, k in keys.items())):
+                bucket["counts"][status.value] += count
+                bucket["minutes"] += total_minutes or 0
+
+        return TaskStatsSchema(
+            overall=self._to_stats_bucket("all", overall),
+            **{
+                name: [
+                    self._to_stats_bucket(key, bucket)
+                    for key, bucket in sorted(buckets.items())
+                ]
+                for name, buckets in groups.items()
+            },
+        )
+
+    @staticmethod
+    def _to_stats_bucket(key: str, bucket: dict) -> TaskStatsBucketSchema:
+        counts = {status.value: bucket["counts"][status.value] for status in TaskStatus}
+        succeeded = counts[TaskStatus.COMPLETED.value] + counts[TaskStatus.ERROR.value]
+        finished = succeeded + counts[TaskStatus.FAILED.value]
+
+        return TaskStatsBucketSchema(
+            key=key,
+            total=sum(counts.values()),
+            counts=counts,
+            success_rate=round(succeeded / finished, 4) if finished else None,
+            recorded_minutes=round(bucket["minutes"]),
+        )
+
+    EXPORT_COLUMNS = (
+        "task_id",
+        "meeting_id",
+        "meeting_name",
+        "meeting_type",
+        "creator_name",
+        "creator_email",
+        "status",
+        "start_time",
+        "end_time",
+        "duration_minutes",
+        "save_path",
+    )
+    EXPORT_BATCH_SIZE = 500
+
+    async def export_tasks(self, params: TaskExportQuerySchema) -> AsyncIterator[bytes]:
+        """
+        以 server-side cursor (yield_per) 逐批串流匯出任務與會議資訊，記憶體用量與範圍大小無關。
+
+        StreamingResponse 會在 endpoint 回傳後才開始迭代，此時 request 的 Session
+        可能已被關閉，因此這裡自行開一個唯讀 Session 直到串流結束。
+        """
+        stmt = (
+            select(
+                TaskORM.id,
+                TaskORM.meeting_id,
+                MeetingORM.meeting_name,
+                MeetingORM.meeting_type,
+                MeetingORM.creator_name,
+                MeetingORM.creator_email,
+                TaskORM.status,
+                TaskORM.start_time,
+                TaskORM.end_time,
+                TaskORM.duration_minutes,
+                TaskORM.save_path,
+            )
+            .join(TaskORM.meeting)
+            .order_by(TaskORM.start_time.asc(), TaskORM.id.asc())
+            .execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+        )
+
+        if params.start_time_ge:
+            stmt = stmt.where(TaskORM.start_time >= params.start_time_ge)
+
+        if params.end_time_le:
+            stmt = stmt.where(TaskORM.end_time <= params.end_time_le)
+
+        is_csv = params.format == "csv"
+        if is_csv:
+            # BOM 讓 Excel 正確辨識 UTF-8 中文
+            yield "\ufeff".encode() + self._to_csv([self.EXPORT_COLUMNS])
+
+        exported = 0
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(stmt)
+            async for partition in result.partitions():
+                rows = [[getattr(v, "value", v) for v in row] for row in partition]
+                exported += len(rows)
+
+                if is_csv:
+                    yield self._to_csv(rows)
+                else:
+                    yield "".join(
+                        json.dumps(
+                            dict(zip(self.EXPORT_COLUMNS, row)),
+                            ensure_ascii=False,
+                            default=lambda v: v.isoformat(),
+                        )
+                        + "\n"
+                        for row in rows
+                    ).encode()
+
+        self.logger.info(f"Exported {exported} tasks as {params.format}.")
+
+    @staticmethod
+    def _to_csv(rows) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            [v.isoformat() if isinstance(v, datetime) else v for v in row]
+            for row in rows
+        )
+        return buffer.getvalue().encode()
+
+    async def get_scheduler_jobs(self) -> List[dict]:
+        """
+        列出排程器中的所有 Job 及其會議名稱。
+        直接讀取 jobstore 的 kind / task_id / run_at 欄位，不重建 Job；
+        再以單一 IN 查詢取得會議名稱，避免 N+1。
+        """
+        entries = await asyncio.to_thread(self.scheduler.list_job_entries)
+
+        task_ids = {entry.task_id for entry in entries if entry.task_id is not None}
+        meeting_names: dict[int, str] = {}
+
+        if task_ids:
+            result = await self.db.execute(
+                select(TaskORM.id, MeetingORM.meeting_name)
+                .join(TaskORM.meeting)
+                .where(TaskORM.id.in_(task_ids))
+            )
+            meeting_names = dict(result.all())
+
+        return [
+            {
+                "id": entry.id,
+                "name": meeting_names.get(entry.task_id, "未知會議")
+                if entry.task_id is not None
+                else entry.name,
+                "next_run_time": entry.next_run_time.astimezone(TAIPEI_TZ).strftime(
+                    "%Y-%m-%d %H:%M"
+                )
+                if entry.next_run_time
+                else "已暫停",
+            }
+            for entry in entries
+        ]
 
     # ----- Update Methods -----
-    def update_task(
+    async def update_task(
         self,
         meeting: MeetingORM,
     ):
         """
-        如果meeting中與時間有關的欄位更動，再更新Task資料
+        如果meeting中與時間有關的欄位更動，再更新Task資料。
+        以新舊時段的差集更新，寫入量與實際變動的時段數成正比：
+        - 時段不變的任務保留，Job 不動
+        - 其餘舊任務依時間順序對應到新時段，就地更新時間並重新排程 Job
+        - 多出的新時段新增任務，多出的舊任務刪除
         """
-        tasks = (
-            self.db.query(TaskORM)
-            .filter(
+        result = await self.db.execute(
+            select(TaskORM)
+            .where(
                 TaskORM.meeting_id == meeting.id, TaskORM.status == TaskStatus.UPCOMING
             )
-            .all()
+            .order_by(TaskORM.start_time)
         )
+        tasks = result.scalars().all()
 
-        if not tasks:
+        # 重複會議的下一個時段可能還在排程範圍之外，沒有 UPCOMING 任務仍可更新
+        if not tasks and not meeting.repeat:
             self.logger.error(f"Meeting ID {meeting.id}({meeting.meeting_name}) has no UPCOMING tasks to update.")
             raise NotFoundError(f"會議：{meeting.meeting_name}沒有尚未開使的錄影任務可以更新")
 
-        for task in tasks:
-            self.delete_task(task.id)
-
-        self.db.flush()
-        tasks = self.create_task(meeting)
+        until = self.horizon_end()
+        occurrences = self._calculate_execute_time(meeting, until)
+        wanted = set(occurrences)
 
+        unchanged: dict[tuple[datetime, datetime], TaskORM] = {}
+        stale: List[TaskORM] = []
         for task in tasks:
-            self.add_job_to_scheduler(task_id=task.id)
+            times = (task.start_time, task.end_time)
+            if times in wanted and times not in unchanged:
+                unchanged[times] = task
+            else:
+                stale.append(task)
+
+        fresh = [times for times in occurrences if times not in unchanged]
+        shifted = list(zip(stale, fresh))
+        removed = stale[len(fresh) :]
+        added = fresh[len(stale) :]
+
+        if fresh:
+            # 被移動 / 刪除的舊任務不算重疊；保留的任務仍在檢查範圍內
+            index = await self._load_interval_index(
+                fresh, exclude={task.id for task in stale}
+            )
+            conflicts = self._find_conflicts(index, fresh)
+            if conflicts:
+                raise self._overlap_error(conflicts)
+
+        for task, (start_dt, end_dt) in shifted:
+            task.start_time = start_dt
+            task.end_time = end_dt
+        for task in removed:
+            await self.db.delete(task)
+        created = self.add_task_rows(meeting, added)
+        meeting.materialized_until = until if meeting.repeat else None
+        await self.db.flush()
+
+        if removed:
+            await self.remove_jobs([task.id for task in removed])
+        if shifted:
+            await self.reschedule_tasks(
+                [(task, meeting.meeting_name) for task, _ in shifted]
+            )
+        if created:
+            await self.schedule_tasks([(task, meeting.meeting_name) for task in created])
+
+        self.logger.info(
+            f"Updated tasks of Meeting ID {meeting.id}: kept {len(unchanged)}, "
+            + f"rescheduled {len(shifted)}, added {len(created)}, removed {len(removed)}."
+        )
 
-    def update_task_status(
+    async def update_task_status(
         self,
         task_id: int,
         new_status: TaskStatus,
@@ -142,7 +541,7 @@ class TaskService:
         """
         手動更新指定 Task 的狀態。
         """
-        task = self.db.query(TaskORM).filter(TaskORM.id == task_id).first()
+        task = await self._get_task(task_id)
 
         if not task:
             self.logger.error(f"Cannot update status: Task ID {task_id} not found.")
@@ -158,22 +557,22 @@ class TaskService:
         return {"id": task.id, "status": task.status}
 
     # ----- Delete Methods -----
-    def delete_task(
+    async def delete_task(
         self,
         task_id: int,
     ):
         """
         刪除尚未執行的任務，確保不會更動到以前的任務狀態。
         """
-        task = self.db.query(TaskORM).filter(TaskORM.id == task_id).first()
+        task = await self._get_task(task_id)
 
         if not task:
             self.logger.error(f"Cannot delete: Task ID {task_id} not found.")
             raise NotFoundError(detail=f"Task ID {task_id} not found.")
 
         try:
-            self.db.delete(task)
-            self.remove_job_from_scheduler(task_id=task_id)
+            await self.db.delete(task)
+            await self.remove_jobs([task_id])
             self.logger.info(f"Deleted Task ID {task_id} from database.")
 
         except Exception as e:
@@ -186,12 +585,34 @@ class TaskService:
 
     # -----------------------------------------------------------------------------
 
+    async def remove_jobs(
+        self,
+        task_ids: List[int],
+    ):
+        """
+        移除任務的 Start / End / Monitor Job。
+        jobstore 在會議 DB 時與任務的刪除在同一個 transaction commit，
+        否則於 worker thread 逐一移除。
+        """
+        if self.jobs_in_transaction:
+            job_ids = [
+                f"task_{kind}_{task_id}"
+                for task_id in task_ids
+                for kind in ("start", "end", "monitor")
+            ]
+            await self.db.run_sync(self.scheduler.remove_jobs_in_transaction, job_ids)
+            return
+
+        for task_id in task_ids:
+            await asyncio.to_thread(self.remove_job_from_scheduler, task_id)
+
     def remove_job_from_scheduler(
         self,
         task_id: int,
     ):
         """
         從排程器中移除指定 Task ID 的 Start 和 End Job，並容忍 Job 不存在。
+        Jobstore 為同步 IO，async 呼叫端需透過 asyncio.to_thread 執行。
         """
         start_job_id = f"task_start_{task_id}"
         end_job_id = f"task_end_{task_id}"
@@ -210,32 +631,118 @@ class TaskService:
                     f"Failed to cleanly remove job ID {job_id} from scheduler. Error: {e}"
                 )
 
-    def add_job_to_scheduler(
+    async def add_job_to_scheduler(
         self,
         task_id: int,
     ):
         """
         核心寫入和排程邏輯：將單一 Task 實例寫入 DB 並同步到 Scheduler。
         """
-        task = (
-            self.db.query(TaskORM)
-            .options(joinedload(TaskORM.meeting))
-            .filter(TaskORM.id == task_id)
-            .first()
+        result = await self.db.execute(
+            self._get_base_query().where(TaskORM.id == task_id)
         )
+        task = result.scalars().first()
 
         if not task:
             self.logger.error(f"Cannot schedule: Task ID {task_id} not found.")
             raise NotFoundError(detail=f"Task ID {task_id} not found.")
 
-        meeting_name = task.meeting.meeting_name
-        start_time = task.start_time
-        end_time = task.end_time
+        if self.jobs_in_transaction:
+            await self.schedule_tasks([(task, task.meeting.meeting_name)])
+            return
+
+        await asyncio.to_thread(
+            self._add_jobs,
+            task_id=task_id,
+            meeting_name=task.meeting.meeting_name,
+            start_time=task.start_time,
+            end_time=task.end_time,
+        )
+
+    async def schedule_tasks(
+        self,
+        tasks: List[tuple[TaskORM, str]],
+    ):
+        """
+        批次排程：所有 Task 的 Start/End Job 在同一個 jobstore transaction 內寫入。
+        jobstore 在會議 DB 時直接寫入目前 session 的 transaction，須在 commit 前呼叫。
+        tasks: [(task, meeting_name), ...]
+        """
+        job_specs = self._build_job_specs(tasks)
 
+        try:
+            if self.jobs_in_transaction:
+                await self.db.run_sync(self.scheduler.add_jobs_in_transaction, job_specs)
+            else:
+                await asyncio.to_thread(self.scheduler.add_date_jobs, job_specs)
+            self.logger.info(f"Scheduled {len(tasks)} tasks in one batch.")
+
+        except Exception as e:
+            error_msg = f"Failed to schedule {len(tasks)} tasks in batch. Error: {e}"
+            self.logger.error(error_msg)
+            raise SchedulingError(detail=error_msg)
+
+    async def reschedule_tasks(
+        self,
+        tasks: List[tuple[TaskORM, str]],
+    ):
+        """
+        時間已變更的 Task 批次重新排程 Start/End Job，呼叫時機與 schedule_tasks 相同。
+        tasks: [(task, meeting_name), ...]
+        """
+        job_specs = self._build_job_specs(tasks)
+
+        try:
+            if self.jobs_in_transaction:
+                await self.db.run_sync(
+                    self.scheduler.reschedule_jobs_in_transaction, job_specs
+                )
+            else:
+                await asyncio.to_thread(self.scheduler.reschedule_date_jobs, job_specs)
+            self.logger.info(f"Rescheduled {len(tasks)} tasks in one batch.")
+
+        except Exception as e:
+            error_msg = f"Failed to reschedule {len(tasks)} tasks in batch. Error: {e}"
+            self.logger.error(error_msg)
+            raise SchedulingError(detail=error_msg)
+
+    @staticmethod
+    def _build_job_specs(tasks: List[tuple[TaskORM, str]]) -> List[dict]:
+        """每個 Task 的 Start/End Job，格式見 RecordingScheduler.add_date_jobs"""
+        job_specs = []
+        for task, meeting_name in tasks:
+            job_specs.append(
+                {
+                    "func": START_RECORDING,
+                    "args": [task.id],
+                    "id": f"task_start_{task.id}",
+                    "name": meeting_name,
+                    "run_date": task.start_time,
+                }
+            )
+            job_specs.append(
+                {
+                    "func": END_RECORDING,
+                    "args": [task.id],
+                    "id": f"task_end_{task.id}",
+                    "name": meeting_name,
+                    "run_date": task.end_time,
+                }
+            )
+        return job_specs
+
+    def _add_jobs(
+        self,
+        task_id: int,
+        meeting_name: str,
+        start_time: datetime,
+        end_time: datetime,
+    ):
+        """寫入 Start/End Job（同步 jobstore IO，於 worker thread 執行）"""
         try:
             # 1. Start Job
             self.scheduler.add_job(
-                start_recording,
+                START_RECORDING,
                 name=meeting_name,
                 args=[task_id],
                 trigger="date",
@@ -245,7 +752,7 @@ class TaskService:
 
             # 2. End Job
             self.scheduler.add_job(
-                end_recording,
+                END_RECORDING,
                 name=meeting_name,
                 args=[task_id],
                 trigger="date",
@@ -262,31 +769,118 @@ class TaskService:
             self.logger.error(error_msg)
             raise SchedulingError(detail=error_msg)
 
+    @staticmethod
+    def horizon_end() -> datetime:
+        """重複會議預先建立任務的時間範圍終點（現在 + RECURRENCE_HORIZON_IN_DAY）"""
+        return datetime.now(TAIPEI_TZ) + timedelta(days=config.RECURRENCE_HORIZON_IN_DAY)
+
+    @staticmethod
     def _calculate_execute_time(
-        self,
         meeting: MeetingORM,
+        until: datetime,
+        after: datetime | None = None,
     ) -> List[tuple[datetime, datetime]]:
         """
         計算重複錄製任務的開始和結束時間。 \\
         保留中途更改重複錄製規則的可能性。 \\
-        例：一會議需要重複錄製4次，錄製完前面兩次後，需要更改錄製時間等資訊。
+        例：一會議需要重複錄製4次，錄製完前面兩次後，需要更改錄製時間等資訊。 \\
+        重複會議只展開開始時間不早於現在、晚於 after 且不晚於 until 的時段，
+        until 之後的時段由每日的 rollover_recurring_meetings 補上。
+        時段依 repeat_rule / repeat_exdates 直接計算（見 app.models.recurrence）。
         """
         if not meeting.repeat:
             return [(meeting.start_time, meeting.end_time)]
 
-        all_times: list[tuple[datetime, datetime]] = []
-        curr_start = meeting.start_time
         diff = meeting.end_time - meeting.start_time
-        interval = timedelta(days=meeting.repeat_unit)
-        now_time = datetime.now(TAIPEI_TZ)
-        # self.logger.debug(f"{curr_start.tzinfo}, {meeting.repeat_end_date.tzinfo}")
-        repeat_end_date = meeting.repeat_end_date
-        while curr_start <= repeat_end_date:
-            if curr_start >= now_time:
-                all_times.append((curr_start, curr_start + diff))
-            curr_start += interval
-
-            if meeting.repeat_unit <= 0:
-                break
-
-        return all_times
+        lower = datetime.now(TAIPEI_TZ)
+        if after is not None:
+            lower = max(lower, after)
+
+        return [
+            (start_dt, start_dt + diff)
+            for start_dt in Recurrence.from_meeting(meeting).occurrences_between(
+                lower, until
+            )
+            if after is None or start_dt > after
+        ]
+
+
+def rollover_recurring_meetings() -> int:
+    """
+    每日 rollover（排程器 thread 執行）：把進行中的重複會議延伸到新的時間範圍終點。
+    - 只展開每個會議 materialized_until 之後的時段，已建立的任務不會重建
+    - 單次範圍查詢檢查重疊；與其他任務重疊的時段略過並記錄，不影響其他時段
+    - 任務、materialized_until 與 Job 的寫入順序與 API 建立會議時相同
+    回傳新建立的任務數。
+    """
+    until = TaskService.horizon_end()
+    now_time = datetime.now(TAIPEI_TZ)
+
+    with Session(database_engine) as db:
+        meetings = db.scalars(
+            select(MeetingORM).where(
+                MeetingORM.repeat.is_(True),
+                MeetingORM.repeat_end_date >= now_time,
+                MeetingORM.materialized_until < until,
+            )
+        ).all()
+        if not meetings:
+            return 0
+
+        planned = [
+            (
+                meeting,
+                TaskService._calculate_execute_time(
+                    meeting, until, after=meeting.materialized_until
+                ),
+            )
+            for meeting in meetings
+        ]
+        all_times = [times for _, occurrences in planned for times in occurrences]
+
+        index: IntervalIndex[str] = IntervalIndex()
+        if all_times:
+            window_start = min(start_dt for start_dt, _ in all_times)
+            window_end = max(end_dt for _, end_dt in all_times)
+            index = IntervalIndex(
+                (start_dt, end_dt, f"現有任務 (Task {task_id})")
+                for start_dt, end_dt, task_id in db.execute(
+                    TaskService._active_intervals_query(window_start, window_end)
+                )
+            )
+
+        scheduled: list[tuple[TaskORM, str]] = []
+        for meeting, occurrences in planned:
+            accepted = []
+            for start_dt, end_dt in occurrences:
+                owner = index.find_overlap(start_dt, end_dt)
+                if owner is not None:
+                    task_service_logger.warning(
+                        f"Rollover skipped {start_dt} ~ {end_dt} of Meeting ID {meeting.id}"
+                        + f"({meeting.meeting_name}): overlaps {owner}."
+                    )
+                    continue
+                index.add(start_dt, end_dt, f"會議「{meeting.meeting_name}」")
+                accepted.append((start_dt, end_dt))
+
+            tasks = TaskService._new_task_rows(meeting, accepted)
+            db.add_all(tasks)
+            meeting.materialized_until = until
+            scheduled.extend((task, meeting.meeting_name) for task in tasks)
+
+        db.flush()
+        # commit 後 ORM 物件會過期，Job 內容在 commit 前先組好
+        job_specs = TaskService._build_job_specs(scheduled)
+
+        if JOBSTORE_IN_MEETING_DB:
+            scheduler.add_jobs_in_transaction(db, job_specs)
+            db.commit()
+        else:
+            db.commit()
+            scheduler.add_date_jobs(job_specs)
+
+    task_service_logger.info(
+        f"Rolled over {len(meetings)} recurring meetings to {until:%Y-%m-%d %H:%M}, "
+        + f"created {len(scheduled)} tasks."
+    )
+    return len(scheduled)
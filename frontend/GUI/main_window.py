@@ -14,9 +14,10 @@ from PyQt6.QtWidgets import (
 )
 
 from frontend.GUI.events import BottomBar
-from frontend.services.api_client import ApiClient
+from frontend.services import ApiClient, EventStreamClient
 
 from .pages import MeetingManagerPage, SettingsPage, StatusPage, TaskManagerPage
+from .pages.base_page import BasePage
 
 
 class MainWindow(QMainWindow):
@@ -26,6 +27,7 @@ class MainWindow(QMainWindow):
         self.resize(1500, 870)
 
         self.api_client = ApiClient()
+        self.event_stream = EventStreamClient(self.api_client.base_url, self)
 
         self.msg_queue = deque()
         self.is_displaying = False
@@ -62,6 +64,7 @@ class MainWindow(QMainWindow):
         self._connect_signals()
 
         self._switch_page(0)
+        self.event_stream.start()
 
     def _create_widgets(self):
         """建立所有核心元件：動態生成導航與頁面"""
@@ -122,6 +125,18 @@ class MainWindow(QMainWindow):
     def _connect_signals(self):
         """連接全域信號"""
         BottomBar.update_status.connect(self._enqueue_status)
+        self.event_stream.event_received.connect(self._dispatch_server_event)
+
+    def _dispatch_server_event(self, event: str, data: dict):
+        """將後端推送的事件轉交給每個頁面"""
+        for index in range(self.page_stack.count()):
+            page = self.page_stack.widget(index)
+            if isinstance(page, BasePage):
+                page.handle_server_event(event, data)
+
+    def closeEvent(self, a0):
+        self.event_stream.stop()
+        super().closeEvent(a0)
 
     # ==========================================
     # 狀態列訊息隊列邏輯 (原有邏輯完整保留)
@@ -8,6 +8,11 @@ from frontend.services.api_client import ApiWorker
 
 
 class BasePage(QWidget):
+    def handle_server_event(self, event: str, data: dict):
+        """
+        接收後端 /events 推送的事件，需要即時更新的頁面自行覆寫
+        """
+
     def run_request(
         self,
         api_func,
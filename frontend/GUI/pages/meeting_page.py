@@ -2,7 +2,7 @@ import logging
 from datetime import datetime, timedelta
 
 from pydantic import ValidationError
-from PyQt6.QtCore import QDateTime, Qt, pyqtSignal
+from PyQt6.QtCore import QDateTime, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -13,6 +13,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -24,7 +25,10 @@ from PyQt6.QtWidgets import (
 
 from app.models.schemas import (
     MeetingCreateSchema,
+    MeetingPageSchema,
+    MeetingQuerySchema,
     MeetingResponseSchema,
+    MeetingSearchQuerySchema,
     MeetingUpdateSchema,
 )
 from frontend.services.api_client import ApiClient
@@ -53,6 +57,14 @@ class MeetingManagerPage(BasePage):
         self._worker_ref = None
         self.current_page = 0
         self.page_size = 4
+        # 每一頁的起始游標，第一頁為 None
+        self.page_cursors: list[str | None] = [None]
+        self.next_cursor: str | None = None
+
+        # 輸入停頓後才送出檢索，避免每打一個字就查詢一次
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
 
         self._init_ui()
         self._layout_ui()
@@ -67,6 +79,9 @@ class MeetingManagerPage(BasePage):
         self.refresh_btn = QPushButton("重新載入資料")
         self.add_new_btn = QPushButton("＋建立新會議")
         self.filter_chk = QCheckBox("僅顯示尚未開始的會議")
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("搜尋會議名稱或建立者")
+        self.search_edit.setClearButtonEnabled(True)
         self.view_list = QListWidget()
         self.prev_btn = QPushButton("< 上一頁")
         self.next_btn = QPushButton("下一頁 >")
@@ -84,6 +99,7 @@ class MeetingManagerPage(BasePage):
         header.addWidget(self.filter_chk)
 
         layout.addLayout(header)
+        layout.addWidget(self.search_edit)
         layout.addWidget(self.view_list, stretch=8)
 
         paging = QHBoxLayout()
@@ -104,6 +120,8 @@ class MeetingManagerPage(BasePage):
         self.view_list.itemClicked.connect(self._on_item_selected)
         self.form_widget.save_requested.connect(self._handle_save_request)
         self.refresh_btn.clicked.connect(self._refresh_list)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        self.search_timer.timeout.connect(self._refresh_list)
         self.form_widget.delete_requested.connect(self._handle_delete_request)
 
     def _on_add_new_clicked(self):
@@ -145,57 +163,71 @@ class MeetingManagerPage(BasePage):
             )
 
     def _refresh_list(self, _=None):
-        """獲取所有會議資料"""
+        """回到第一頁並重新獲取會議資料；有搜尋關鍵字時改為全文檢索"""
+        self.current_page = 0
+        self.page_cursors = [None]
+
+        keyword = self.search_edit.text().strip()
+        if keyword:
+            self._search(keyword)
+        else:
+            self._load_page()
+
+    def _search(self, keyword: str):
+        """全文檢索結果依相關度排序，只顯示單頁，不提供分頁"""
+        params = MeetingSearchQuerySchema(q=keyword[:100])
+        self.run_request(
+            self.api_client.search_meetings,
+            params,
+            name="搜尋會議",
+            callback=self._on_search_loaded,
+        )
+
+    def _on_search_loaded(self, meetings: list[MeetingResponseSchema] | None):
+        self.meeting_list = {str(m.id): m for m in meetings or []}
+        self.next_cursor = None
+        self._update_list_data()
+
+    def _load_page(self):
+        """向後端請求目前頁面的資料（過濾與分頁皆由後端處理）"""
+        params = MeetingQuerySchema(
+            cursor=self.page_cursors[self.current_page],
+            limit=self.page_size,
+            upcoming_only=self.filter_chk.isChecked(),
+            sort_by="start_time",
+            order="desc",
+        )
         self.run_request(
-            self.api_client.get_all_meetings,
+            self.api_client.get_meetings,
+            params,
             name="獲得資料清單",
             callback=self._on_fetch_data_loaded,
         )
 
-    def _on_fetch_data_loaded(self, data_list: list[MeetingResponseSchema]):
+    def _on_fetch_data_loaded(self, page: MeetingPageSchema | None):
         """處理 API 回傳的資料結構"""
-        self.current_page = 0
-        if not data_list:
+        if not page:
             self.meeting_list = {}
+            self.next_cursor = None
             self._update_list_data()
             return
 
-        self.meeting_list = {str(m.id): m for m in data_list}
+        self.meeting_list = {str(m.id): m for m in page.items}
+        self.next_cursor = page.next_cursor
         self._update_list_data()
 
     def _update_list_data(self):
-        """顯示資料到 UI（含分頁）"""
+        """顯示當頁資料到 UI"""
         self.view_list.clear()
         now = datetime.now(tz=TAIPEI_TZ)
-        only_upcoming = self.filter_chk.isChecked()
 
-        # 收集所有符合過濾條件的項目
-        filtered_items = []
+        # 渲染當頁項目
         for m_id, meeting in self.meeting_list.items():
             correct_end_time = (
                 meeting.repeat_end_date.replace(tzinfo=TAIPEI_TZ)
                 if meeting.repeat
                 else meeting.end_time
             )
-
-            if only_upcoming:
-                is_started = meeting.start_time < now
-                is_expired = correct_end_time < now
-                if is_started and is_expired:
-                    continue
-
-            filtered_items.append((m_id, meeting, correct_end_time))
-
-        # 計算分頁
-        total = len(filtered_items)
-        total_pages = max(1, (total + self.page_size - 1) // self.page_size)
-        self.current_page = min(self.current_page, total_pages - 1)
-
-        start = self.current_page * self.page_size
-        page_items = filtered_items[start : start + self.page_size]
-
-        # 渲染當頁項目
-        for m_id, meeting, correct_end_time in page_items:
             postfix = "(Repeat)" if meeting.repeat else ""
             display_name = f"{meeting.meeting_name} {postfix}"
 
@@ -209,22 +241,26 @@ class MeetingManagerPage(BasePage):
             self.view_list.addItem(item)
 
         # 更新分頁控制
-        self.page_label.setText(f"第 {self.current_page + 1} / {total_pages} 頁")
+        self.page_label.setText(f"第 {self.current_page + 1} 頁")
         self.prev_btn.setEnabled(self.current_page > 0)
-        self.next_btn.setEnabled(self.current_page < total_pages - 1)
+        self.next_btn.setEnabled(self.next_cursor is not None)
 
     def _go_prev_page(self):
         if self.current_page > 0:
             self.current_page -= 1
-            self._update_list_data()
+            self._load_page()
 
     def _go_next_page(self):
+        if self.next_cursor is None:
+            return
+
+        del self.page_cursors[self.current_page + 1 :]
+        self.page_cursors.append(self.next_cursor)
         self.current_page += 1
-        self._update_list_data()
+        self._load_page()
 
     def _on_filter_changed(self):
-        self.current_page = 0
-        self._update_list_data()
+        self._refresh_list()
 
     def _handle_delete_request(self):
         """處理刪除會議請求"""
@@ -290,6 +326,12 @@ class MeetingFormWidget(QGroupBox):
         self.meeting_password = CustomLineEdit(placeholder="Optional", width=300)
         self.repeat = QCheckBox("Optional")
         self.repeat_unit = CustomLineEdit(placeholder="Optional", width=300)
+        self.repeat_rule = CustomLineEdit(
+            placeholder="Optional，例：FREQ=WEEKLY;BYDAY=MO,WE", width=300
+        )
+        self.repeat_exdates = CustomLineEdit(
+            placeholder="Optional，例：2026-10-20,2026-11-03", width=300
+        )
         self.repeat_end_date = fixed_width_height(QDateTimeEdit())
         self.repeat_end_date.setCalendarPopup(True)
         self.repeat_end_date.setDisplayFormat("yyyy/MM/dd")
@@ -346,6 +388,8 @@ class MeetingFormWidget(QGroupBox):
         right_l.addRow("會議密碼:", self.meeting_password)
         right_l.addRow("是否重複:", self.repeat)
         right_l.addRow("重複週期(天):", self.repeat_unit)
+        right_l.addRow("重複規則:", self.repeat_rule)
+        right_l.addRow("排除日期:", self.repeat_exdates)
         right_l.addRow("結束日期\n(Optional):", self.repeat_end_date)
 
         left_w, left_l = create_form_block()
@@ -422,6 +466,8 @@ class MeetingFormWidget(QGroupBox):
         # 週期性與布林值 (Pydantic 已經保證 data.repeat 是 bool)
         self.repeat.setChecked(data.repeat)
         self.repeat_unit.setText(str(data.repeat_unit or "0"))
+        self.repeat_rule.setText(data.repeat_rule or "")
+        self.repeat_exdates.setText(",".join(d.isoformat() for d in data.repeat_exdates))
 
         # 時間處理：現在 data.start_time 已經是 datetime 物件了
         if data.start_time:
@@ -495,6 +541,8 @@ class MeetingFormWidget(QGroupBox):
         self.creator_email.clear()
         self.repeat.setChecked(False)
         self.repeat_unit.clear()
+        self.repeat_rule.clear()
+        self.repeat_exdates.clear()
         self.repeat_end_date.setDateTime(QDateTime.currentDateTime())
 
         # 確保 DateTimeInputGroup 有 reset 方法，否則會報錯
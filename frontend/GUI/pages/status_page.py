@@ -1,4 +1,5 @@
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QHeaderView,
@@ -81,12 +82,37 @@ class StatusPage(BasePage):
         )
         self.load_scheduler_data()
 
-    def _update_ui_state(self, online: bool):
-        """更新 UI 視覺狀態"""
-        color = "#2ecc71" if online else "#e74c3c"
-        msg = "系統連線中" if online else "伺服器離線"
+    HEALTH_STATES = {
+        "ok": ("#2ecc71", "系統連線中"),
+        "degraded": ("#f1c40f", "系統連線中（部分功能異常）"),
+        "down": ("#e74c3c", "後端服務異常"),
+    }
+    CHECK_NAMES = {
+        "database": "資料庫",
+        "scheduler": "排程器",
+        "config_watcher": "設定監聽",
+        "obs_websocket": "OBS WebSocket",
+    }
+
+    def _update_ui_state(self, health: dict | None):
+        """更新 UI 視覺狀態，各子系統檢查結果顯示在 tooltip"""
+        if not health:
+            color, msg = "#e74c3c", "伺服器離線"
+            tooltip = ""
+        else:
+            color, msg = self.HEALTH_STATES.get(
+                health.get("status"), self.HEALTH_STATES["down"]
+            )
+            tooltip = "\n".join(
+                f"{'✓' if check.get('ok') else '✗'} "
+                f"{self.CHECK_NAMES.get(name, name)}: {check.get('detail', '')}"
+                for name, check in health.get("checks", {}).items()
+            )
+
         self.status_dot.setStyleSheet(f"color: {color}; font-size: 18px;")
         self.status_text.setText(msg)
+        self.status_text.setToolTip(tooltip)
+        self.status_dot.setToolTip(tooltip)
 
     def load_scheduler_data(self):
         """1. 發送非同步請求獲取排程資料"""
@@ -100,36 +126,64 @@ class StatusPage(BasePage):
         """2. 真正將資料填入表格的回呼函式"""
 
         self.job_table.setRowCount(0)
-        
+
         # 請求失敗 (None) 或空列表
         if jobs is None or not jobs:
             return
 
         self.job_table.setRowCount(len(jobs))
         for row, job in enumerate(jobs):
-            # 準備各個欄位的資料
-            display_data = [
-                str(job.get("id", "")),
-                str(job.get("name", "未命名任務")),
-                str(job.get("next_run_time", "已暫停")),  # 整合暫停邏輯
-                # str(job.get("trigger", "")),
-            ]
-
-            for col, text in enumerate(display_data):
-                item = QTableWidgetItem(text)
-
-                item.setFlags(item.flags() ^ Qt.ItemFlag.ItemIsEditable)
-
-                # 優化 2: 文字置中對齊
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # 優化 3: 如果是「已暫停」，文字顏色變灰
-                if text == "已暫停":
-                    from PyQt6.QtGui import QColor
-
-                    item.setForeground(QColor("gray"))
-
-                self.job_table.setItem(row, col, item)
+            self._set_job_row(row, job)
+
+    def _set_job_row(self, row: int, job: dict):
+        # 準備各個欄位的資料
+        display_data = [
+            str(job.get("id", "")),
+            str(job.get("name", "未命名任務")),
+            str(job.get("next_run_time", "已暫停")),  # 整合暫停邏輯
+            # str(job.get("trigger", "")),
+        ]
+
+        for col, text in enumerate(display_data):
+            item = QTableWidgetItem(text)
+
+            item.setFlags(item.flags() ^ Qt.ItemFlag.ItemIsEditable)
+
+            # 優化 2: 文字置中對齊
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+
+            # 優化 3: 如果是「已暫停」，文字顏色變灰
+            if text == "已暫停":
+                item.setForeground(QColor("gray"))
+
+            self.job_table.setItem(row, col, item)
+
+    def _find_job_row(self, job_id: str) -> int:
+        for row in range(self.job_table.rowCount()):
+            item = self.job_table.item(row, 0)
+            if item and item.text() == job_id:
+                return row
+        return -1
+
+    def handle_server_event(self, event: str, data: dict):
+        """依據後端推送的 Job 事件逐列更新表格，不重新載入整個列表"""
+        if event in ("job_added", "job_modified"):
+            row = self._find_job_row(str(data.get("id", "")))
+            if row < 0:
+                row = self.job_table.rowCount()
+                self.job_table.insertRow(row)
+            self._set_job_row(row, data)
+
+        elif event == "job_removed":
+            row = self._find_job_row(str(data.get("id", "")))
+            if row >= 0:
+                self.job_table.removeRow(row)
+
+        elif event == "all_jobs_removed":
+            self.job_table.setRowCount(0)
+
+        elif event == "resync":
+            self.load_scheduler_data()
 
     def showEvent(self, a0):
         """當頁面顯示時自動重新載入排程列表。
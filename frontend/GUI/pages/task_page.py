@@ -1,20 +1,27 @@
 import logging
 
-from PyQt6.QtCore import QDateTime, Qt
+from PyQt6.QtCore import QDateTime, Qt, QTimer
 from PyQt6.QtWidgets import (
     QComboBox,
     QDateTimeEdit,
+    QFileDialog,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
     QLabel,
+    QMessageBox,
     QPushButton,
     QTableWidget,
     QTableWidgetItem,
     QVBoxLayout,
 )
 
-from app.models.schemas import TaskQuerySchema, TaskResponseSchema
+from app.models.schemas import (
+    TaskExportQuerySchema,
+    TaskQuerySchema,
+    TaskResponseSchema,
+    TaskStatsQuerySchema,
+)
 from frontend.services import ApiClient
 
 from .base_page import BasePage
@@ -30,6 +37,18 @@ class TaskManagerPage(BasePage):
         self.date_width = 180
         self.header = ["ID", "會議名稱", "類型", "日期時間", "狀態"]
         self.n_header = len(self.header)
+        self.last_query: TaskQuerySchema | None = None
+        self.stats_query: TaskStatsQuerySchema | None = None
+
+        # 短時間內多筆任務新增/刪除時合併成一次重新查詢
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(500)
+
+        # 狀態變動只需重新統計，同樣合併短時間內的多筆事件
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setSingleShot(True)
+        self.stats_timer.setInterval(500)
 
         self._create_widgets()
         self._setup_layout()
@@ -50,6 +69,7 @@ class TaskManagerPage(BasePage):
 
         self.filter_btn = QPushButton("查詢")
         self.clear_btn = QPushButton("重置")
+        self.export_btn = QPushButton("匯出")
 
         # --- B. 表格區 ---
         self.result_table = QTableWidget()
@@ -84,6 +104,7 @@ class TaskManagerPage(BasePage):
         filter_layout.addStretch()
         filter_layout.addWidget(self.filter_btn)
         filter_layout.addWidget(self.clear_btn)
+        filter_layout.addWidget(self.export_btn)
         self.filter_group.setLayout(filter_layout)
 
         # 頁面組裝
@@ -99,6 +120,9 @@ class TaskManagerPage(BasePage):
         """負責訊號與槽的連結"""
         self.filter_btn.clicked.connect(self.on_filter_clicked)
         self.clear_btn.clicked.connect(self.on_clear_clicked)
+        self.export_btn.clicked.connect(self.on_export_clicked)
+        self.reload_timer.timeout.connect(self._load_tasks)
+        self.stats_timer.timeout.connect(self._load_stats)
 
     # --- 邏輯操作方法 ---
 
@@ -107,12 +131,12 @@ class TaskManagerPage(BasePage):
         self.start_date_edit.setDateTime(QDateTime.currentDateTime().addDays(-7))
         self.end_date_edit.setDateTime(QDateTime.currentDateTime())
         self.result_table.setRowCount(0)
-        self.update_summary(0)
+        self.last_query = None
+        self.stats_query = None
+        self._render_summary(None)
 
-    def on_filter_clicked(self):
-        """執行篩選並載入資料"""
-        # 1. 取得時間並封裝成 Schema
-        # 設定開始為 00:00:00，結束為 23:59:59
+    def _selected_range(self):
+        """設定開始為 00:00:00，結束為 23:59:59"""
         s_dt = (
             self.start_date_edit.dateTime()
             .toPyDateTime()
@@ -123,6 +147,12 @@ class TaskManagerPage(BasePage):
             .toPyDateTime()
             .replace(hour=23, minute=59, second=59)
         )
+        return s_dt, e_dt
+
+    def on_filter_clicked(self):
+        """執行篩選並載入資料"""
+        # 1. 取得時間並封裝成 Schema
+        s_dt, e_dt = self._selected_range()
 
         query_params = TaskQuerySchema(
             start_time_ge=s_dt,
@@ -133,13 +163,96 @@ class TaskManagerPage(BasePage):
             order="asc",
             status=None,
         )
+        self.last_query = query_params
+        self.stats_query = TaskStatsQuerySchema(start_time_ge=s_dt, end_time_le=e_dt)
+        self._load_tasks()
+
+    def on_export_clicked(self):
+        """將目前日期範圍內的所有任務串流存檔（不受表格 200 筆限制）"""
+        s_dt, e_dt = self._selected_range()
+        default_name = f"tasks_{s_dt:%Y%m%d}_{e_dt:%Y%m%d}.csv"
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "匯出任務",
+            default_name,
+            "CSV (*.csv);;NDJSON (*.ndjson)",
+        )
+        if not file_path:
+            return
+
+        export_format = "ndjson" if file_path.lower().endswith(".ndjson") else "csv"
+        params = TaskExportQuerySchema(
+            start_time_ge=s_dt, end_time_le=e_dt, format=export_format
+        )
+
+        self.run_request(
+            self.api_client.export_tasks,
+            params=params,
+            file_path=file_path,
+            name="匯出任務",
+            lock_widget=self.export_btn,
+            callback=self._on_export_finished,
+        )
+
+    def _on_export_finished(self, file_path: str | None):
+        if file_path:
+            QMessageBox.information(self, "匯出完成", f"已儲存至：\n{file_path}")
+
+    def _load_tasks(self):
+        if self.last_query is None:
+            return
 
         self.run_request(
             self.api_client.get_tasks,
-            params=query_params,  # 這裡傳入篩選參數
+            params=self.last_query,  # 這裡傳入篩選參數
             name="載入統計資料",
             callback=self._render_table,
         )
+        self._load_stats()
+
+    def _load_stats(self):
+        """統計由後端計算，表格只顯示前 200 筆時數字依然正確"""
+        if self.stats_query is None:
+            return
+
+        self.run_request(
+            self.api_client.get_task_stats,
+            params=self.stats_query,
+            name="載入任務統計",
+            callback=self._render_summary,
+        )
+
+    def handle_server_event(self, event: str, data: dict):
+        """任務狀態變動只更新對應列；新增/刪除則重新查詢目前條件"""
+        if self.last_query is None:
+            return
+
+        if event == "task_status":
+            self._apply_status_event(data.get("task_id"), data.get("status"))
+
+        elif event in ("task_created", "task_deleted", "resync"):
+            self.reload_timer.start()
+
+    def _apply_status_event(self, task_id, status: str | None):
+        if task_id is None or not status:
+            return
+
+        for row in range(self.result_table.rowCount()):
+            name_item = self.result_table.item(row, 1)
+            if not name_item or name_item.data(Qt.ItemDataRole.UserRole) != task_id:
+                continue
+
+            combo = self.result_table.cellWidget(row, 4)
+            if combo and combo.currentText() != status:
+                # 避免觸發 _on_status_changed 又送一次更新請求
+                combo.blockSignals(True)
+                combo.setCurrentText(status)
+                combo.blockSignals(False)
+                self._apply_combo_color(combo, status)
+            break
+
+        self.stats_timer.start()
 
     STATUS_OPTIONS = ["upcoming", "recording", "completed", "error", "failed"]
     STATUS_COLORS = {"failed": "#e74c3c", "error": "#e67e22"}
@@ -151,7 +264,6 @@ class TaskManagerPage(BasePage):
         self.result_table.setRowCount(0)
 
         if data_list is None:
-            self.update_summary(0)
             return
 
         self.result_table.setRowCount(len(data_list))
@@ -220,8 +332,6 @@ class TaskManagerPage(BasePage):
             )
             self.result_table.setCellWidget(row_idx, 4, combo)
 
-        self._update_summary_from_table()
-
     def _apply_combo_color(self, combo: QComboBox, status: str):
         color = self.STATUS_COLORS.get(status, "")
         base = "QComboBox { font-size: 15px;"
@@ -240,31 +350,31 @@ class TaskManagerPage(BasePage):
             task_id=task_id,
             status=new_status,
             name="更新任務狀態",
-            callback=lambda _: self._update_summary_from_table(),
+            callback=lambda _: self._load_stats(),
         )
 
-    def _update_summary_from_table(self):
-        from collections import Counter
+    def _render_summary(self, stats: dict | None):
+        if not stats:
+            self.status_label.setText("共 0 筆資料")
+            return
 
-        statuses = []
-        for row in range(self.result_table.rowCount()):
-            combo = self.result_table.cellWidget(row, 4)
-            if combo:
-                statuses.append(combo.currentText())
-        counter = Counter(statuses)
-        self.update_summary(len(statuses), counter)
-
-    def update_summary(self, total: int, counter=None):
-        if counter is None:
-            counter = {}
-        upcoming = counter.get("upcoming", 0)
-        recording = counter.get("recording", 0)
-        completed = counter.get("completed", 0)
-        error = counter.get("error", 0)
-        failed = counter.get("failed", 0)
-        finished = completed + error + failed
-        rate = f"{(completed + error) / finished * 100:.0f}%" if finished else "-"
+        overall = stats["overall"]
+        counts = overall["counts"]
+        rate = overall.get("success_rate")
+        rate_text = f"{rate * 100:.0f}%" if rate is not None else "-"
         self.status_label.setText(
-            f"共 {total} 筆 ｜ 待執行 {upcoming} ｜ 錄製中 {recording}"
-            f" ｜ 完成 {completed} ｜ 錯誤 {error} ｜ 失敗 {failed} ｜ 成功率 {rate}"
+            f"共 {overall['total']} 筆 ｜ 待執行 {counts.get('upcoming', 0)}"
+            f" ｜ 錄製中 {counts.get('recording', 0)}"
+            f" ｜ 完成 {counts.get('completed', 0)} ｜ 錯誤 {counts.get('error', 0)}"
+            f" ｜ 失敗 {counts.get('failed', 0)} ｜ 成功率 {rate_text}"
+            f" ｜ 錄製 {overall['recorded_minutes']} 分鐘"
+        )
+
+        # 各會議類型明細放在 tooltip，不佔版面
+        self.status_label.setToolTip(
+            "\n".join(
+                f"{bucket['key']}: {bucket['total']} 筆, "
+                f"錄製 {bucket['recorded_minutes']} 分鐘"
+                for bucket in stats.get("by_meeting_type", [])
+            )
         )
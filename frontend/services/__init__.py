@@ -1,3 +1,4 @@
 from .api_client import ApiClient, ApiWorker
+from .event_stream import EventStreamClient
 
-__all__ = ["ApiClient", "ApiWorker"]
\ No newline at end of file
+__all__ = ["ApiClient", "ApiWorker", "EventStreamClient"]
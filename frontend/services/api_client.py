@@ -1,12 +1,26 @@
 import logging
-from typing import Callable
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable
+from urllib.parse import urlencode
 
 import requests
 from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
 from app.core.scheduler import scheduler
-from app.models.schemas import MeetingCreateSchema, MeetingResponseSchema, TaskQuerySchema
+from app.models.schemas import (
+    MeetingCreateSchema,
+    MeetingListAdapter,
+    MeetingPageSchema,
+    MeetingQuerySchema,
+    MeetingResponseSchema,
+    MeetingSearchQuerySchema,
+    TaskExportQuerySchema,
+    TaskQuerySchema,
+    TaskStatsQuerySchema,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,29 +29,99 @@ class ApiClient:
     def __init__(self, base_url="http://127.0.0.1:8000"):
         self.base_url = base_url.rstrip("/")
         self.timeout = 10
+        self.idempotent_retries = 2
         self.meeting_router = f"{self.base_url}/meeting"
         self.task_router = f"{self.base_url}/tasks"
         self.schduler = scheduler
 
+        # 條件式 GET 快取：url -> (ETag, JSON)
+        self._etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._etag_cache_size = 64
+        self._etag_lock = threading.Lock()
+
+    def _get_json(self, url: str, params: dict | None = None):
+        """
+        帶 If-None-Match 的 GET，伺服器回 304 時直接使用快取中的資料
+        """
+        cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = requests.get(
+            url, params=params, headers=headers, timeout=self.timeout
+        )
+
+        if response.status_code == 304 and cached:
+            with self._etag_lock:
+                self._etag_cache.move_to_end(cache_key)
+            return cached[1]
+
+        response.raise_for_status()
+        data = response.json()
+
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, data)
+                self._etag_cache.move_to_end(cache_key)
+                while len(self._etag_cache) > self._etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+
+        return data
+
     # ----------- meeting page request -----------
-    def get_all_meetings(self):
+    def get_meetings(self, params: MeetingQuerySchema) -> MeetingPageSchema | None:
+        """
+        獲取單頁會議資料，下一頁請帶入回傳的 next_cursor
+        """
         try:
-            response = requests.get(self.meeting_router, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            return [MeetingResponseSchema.model_validate(item) for item in data]
+            query_dict = params.model_dump(mode="json", exclude_none=True)
+            data = self._get_json(f"{self.meeting_router}/", params=query_dict)
+            return MeetingPageSchema.model_validate(data)
+
+        except Exception as e:
+            self._handle_error(e)
+
+    def search_meetings(
+        self, params: MeetingSearchQuerySchema
+    ) -> list[MeetingResponseSchema] | None:
+        """
+        全文檢索會議，結果依相關度排序
+        """
+        try:
+            url = f"{self.meeting_router}/search"
+            data = self._get_json(url, params=params.model_dump(mode="json"))
+            return MeetingListAdapter.validate_python(data)
 
         except Exception as e:
             self._handle_error(e)
 
+    def _send_idempotent(self, method: str, url: str, payload: dict):
+        """
+        帶 Idempotency-Key 送出寫入請求，逾時或連線中斷時以同一個 key 重送：
+        伺服器若已處理完第一次請求，會直接回傳當時的結果而不會重複建立
+        """
+        headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+        for attempt in range(1, self.idempotent_retries + 2):
+            try:
+                response = requests.request(
+                    method, url, json=payload, headers=headers, timeout=self.timeout
+                )
+                break
+            except (ConnectionError, Timeout) as e:
+                if attempt > self.idempotent_retries:
+                    raise
+                logger.warning(f"{method} {url} 第 {attempt} 次失敗 ({e})，重送中...")
+
+        response.raise_for_status()
+        return response.json()
+
     def create_meeting(self, data: MeetingCreateSchema):
         try:
             payload = data.model_dump(mode="json")
-            response = requests.post(
-                self.meeting_router, json=payload, timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._send_idempotent("POST", self.meeting_router, payload)
 
         except Exception as e:
             self._handle_error(e)
@@ -46,9 +130,7 @@ class ApiClient:
         try:
             url = f"{self.meeting_router}/{meeting_id}"
             payload = data.model_dump(mode="json")
-            response = requests.patch(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            return self._send_idempotent("PATCH", url, payload)
 
         except Exception as e:
             self._handle_error(e)
@@ -66,14 +148,19 @@ class ApiClient:
             self._handle_error(e)
 
     # ----------- satus page -----------
-    def get_backend_status(self):
+    def get_backend_status(self) -> dict | None:
+        """
+        查詢 /health；後端回 503 (critical 子系統異常) 時仍回傳檢查內容供畫面顯示
+        """
         try:
-            response = requests.get(self.base_url, timeout=self.timeout)
-            response.raise_for_status()
-            return True
+            response = requests.get(f"{self.base_url}/health", timeout=self.timeout)
+            if response.status_code != 503:
+                response.raise_for_status()
+            return response.json()
 
         except Exception as e:
             self._handle_error(e)
+            return None
 
     def get_scheduler_data(self):
         try:
@@ -105,25 +192,56 @@ class ApiClient:
             
             # 將 Pydantic 模型轉換為字典，用於 requests 的 params 參數
             # exclude_none=True 可以避免將值為 None 的欄位傳給 API
-            query_dict = params.model_dump(exclude_none=True) if params else None
-            
-            response = requests.get(
-                url, 
-                params=query_dict,  # requests 會自動將字典轉為 ?key=value 格式
-                timeout=self.timeout
+            query_dict = (
+                params.model_dump(mode="json", exclude_none=True) if params else None
             )
-            
-            response.raise_for_status()
-            
+
             # 根據你的 BasePage 邏輯，這裡回傳 JSON 資料
             # 如果後端回傳的是 List[dict]，BasePage 的 callback 會收到這份資料
-            return response.json()
+            # 資料未變動時後端回 304，直接沿用上次的結果
+            return self._get_json(url, params=query_dict)
 
         except Exception as e:
             # 呼叫你定義的錯誤處理邏輯
             self._handle_error(e)
             return None # 確保發生錯誤時回傳 None，避免 callback 解析出錯
 
+    def get_task_stats(self, params: TaskStatsQuerySchema):
+        """
+        獲取任務統計（由後端 GROUP BY 計算，不受列表筆數上限影響）
+        """
+        try:
+            url = f"{self.task_router}/stats"
+            query_dict = params.model_dump(mode="json", exclude_none=True)
+            return self._get_json(url, params=query_dict)
+
+        except Exception as e:
+            self._handle_error(e)
+            return None
+
+    def export_tasks(self, params: TaskExportQuerySchema, file_path: str):
+        """
+        串流下載任務匯出檔並直接寫入磁碟，不會把整份資料載入記憶體
+        """
+        try:
+            url = f"{self.task_router}/export"
+            query_dict = params.model_dump(mode="json", exclude_none=True)
+
+            # 讀取逾時針對「兩個 chunk 之間」，長範圍匯出不會因總時間長而中斷
+            with requests.get(
+                url, params=query_dict, stream=True, timeout=(self.timeout, 60)
+            ) as response:
+                response.raise_for_status()
+                with open(file_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+
+            return file_path
+
+        except Exception as e:
+            self._handle_error(e)
+            return None
+
     def _handle_error(self, e: Exception):
         if isinstance(e, ConnectionError):
             msg = "無法連線至伺服器，請檢查後端是否啟動。"
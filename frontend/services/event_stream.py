@@ -0,0 +1,110 @@
+import json
+import logging
+
+import requests
+from PyQt6.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class EventStreamClient(QThread):
+    """
+    在背景線程訂閱後端 /events (SSE)，收到事件後以 signal 交給 GUI 線程處理。
+    斷線時自動重連，重連成功後送出 resync 讓頁面補齊斷線期間的變動。
+    """
+
+    event_received = pyqtSignal(str, dict)  # event name, data
+    connection_changed = pyqtSignal(bool)
+
+    def __init__(self, base_url: str, parent=None):
+        super().__init__(parent)
+        self.url = f"{base_url.rstrip('/')}/events"
+        self.retry_ms = 3000
+        self._response: requests.Response | None = None
+
+    def run(self):
+        first_connect = True
+
+        while not self.isInterruptionRequested():
+            try:
+                # read timeout 需大於後端的 heartbeat 間隔
+                with requests.get(self.url, stream=True, timeout=(5, 60)) as resp:
+                    resp.raise_for_status()
+                    self._response = resp
+                    self.connection_changed.emit(True)
+
+                    if not first_connect:
+                        self.event_received.emit("resync", {})
+                    first_connect = False
+
+                    self._consume(resp)
+
+            except Exception as e:
+                if not self.isInterruptionRequested():
+                    logger.debug(f"事件串流中斷: {e}")
+
+            finally:
+                self._response = None
+
+            if self.isInterruptionRequested():
+                break
+
+            self.connection_changed.emit(False)
+            self._sleep(self.retry_ms)
+
+    def stop(self):
+        self.requestInterruption()
+        resp = self._response
+        if resp is not None:
+            # 關閉連線讓阻塞中的讀取立即返回
+            resp.close()
+        self.wait(3000)
+
+    def _consume(self, resp: requests.Response):
+        event_name, data_lines = "message", []
+
+        for line in resp.iter_lines(decode_unicode=True):
+            if self.isInterruptionRequested():
+                return
+
+            if line is None:
+                continue
+
+            # 空行代表一個事件結束
+            if line == "":
+                if data_lines:
+                    self._emit(event_name, "\n".join(data_lines))
+                event_name, data_lines = "message", []
+                continue
+
+            # 註解行 (heartbeat)
+            if line.startswith(":"):
+                continue
+
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+
+            if field == "event":
+                event_name = value
+            elif field == "data":
+                data_lines.append(value)
+            elif field == "retry" and value.isdigit():
+                self.retry_ms = int(value)
+
+    def _emit(self, event_name: str, raw_data: str):
+        try:
+            data = json.loads(raw_data)
+        except json.JSONDecodeError:
+            logger.warning(f"無法解析事件資料: {raw_data}")
+            return
+
+        self.event_received.emit(event_name, data if isinstance(data, dict) else {})
+
+    def _sleep(self, ms: int):
+        """可被中斷的等待"""
+        step = 100
+        for _ in range(0, ms, step):
+            if self.isInterruptionRequested():
+                return
+            self.msleep(step)
@@ -40,6 +40,64 @@ class Config(BaseSettings):
         description="排程器使用的資料庫連線字串。",
     )
 
+    SCHEDULER_JOBSTORE_IN_MEETING_DB: bool = Field(
+        default=False,
+        description="將排程器 jobstore 放在會議 DB，任務與 Job 在同一個 transaction commit；"
+        "啟用時不使用 SCHEDULER_DB_URL。",
+    )
+
+    # SQLite Storage Profile (會議 DB 與排程器 DB 的每條連線都會套用)
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE"] = Field(
+        default="WAL",
+        description="SQLite journal mode；WAL 讓讀取不會被寫入阻擋。",
+    )
+
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous；WAL 下 NORMAL 不會損毀資料，只可能遺失最後一筆 commit。",
+    )
+
+    SQLITE_BUSY_TIMEOUT_IN_MS: int = Field(
+        default=5000,
+        description="資料庫被鎖定時等待的時間（毫秒），超過才拋出 database is locked。",
+    )
+
+    SQLITE_CACHE_SIZE_IN_KB: int = Field(
+        default=20480,
+        description="每條連線的 page cache 大小（KiB）。",
+    )
+
+    SQLITE_MMAP_SIZE_IN_MB: int = Field(
+        default=256,
+        description="以 memory-mapped I/O 讀取的資料庫大小上限（MiB），0 表示停用。",
+    )
+
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        description="每個 engine 常駐的連線數。",
+    )
+
+    DB_MAX_OVERFLOW: int = Field(
+        default=20,
+        description="尖峰時可額外建立的連線數（排程器最多 20 個 thread 同時執行）。",
+    )
+
+    DB_POOL_TIMEOUT_IN_SECOND: float = Field(
+        default=30,
+        description="連線池用盡時等待可用連線的時間（秒）。",
+    )
+
+    # Scheduler Leader Election (多 worker 時只有 leader 執行 Job)
+    SCHEDULER_LEASE_TTL_IN_SECOND: float = Field(
+        default=10,
+        description="排程器 leader lease 的有效時間（秒），leader 失效後最多這麼久會被接手。",
+    )
+
+    SCHEDULER_LEASE_RENEW_IN_SECOND: float = Field(
+        default=3,
+        description="leader 續約與檢查 jobstore 的間隔（秒），須小於 lease 有效時間。",
+    )
+
     # logging Configuration
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
@@ -75,6 +133,11 @@ class Config(BaseSettings):
         description="OBS中為ZOOM設定的場景名稱，最好先設定好所有參數",
     )
 
+    OBS_WEBSOCKET_PORT: int = Field(
+        default=4455,
+        description="OBS WebSocket 伺服器的連接埠。",
+    )
+
     WEBEX_APP_PATH: str = Field(
         default=r"C:\Users\linlab\AppData\Local\CiscoSparkLauncher\CiscoCollabHost.exe",
         description="Webex 的安裝路徑。",
@@ -123,6 +186,53 @@ class Config(BaseSettings):
         description="等待會議開始的超時時間（秒）。",
     )
 
+    SLOW_QUERY_THRESHOLD_IN_MS: float = Field(
+        default=200,
+        description="SQL 執行時間超過此值（毫秒）時記錄慢查詢日誌。",
+    )
+
+    HEALTH_CHECK_TTL_IN_SECOND: float = Field(
+        default=5,
+        description="/health 各項子系統檢查結果的快取時間（秒）。",
+    )
+
+    IDEMPOTENCY_TTL_IN_SECOND: float = Field(
+        default=3600,
+        description="Idempotency-Key 對應結果的保存時間（秒）。",
+    )
+
+    IDEMPOTENCY_CACHE_SIZE: int = Field(
+        default=1024,
+        description="Idempotency-Key 快取的最大筆數。",
+    )
+
+    MEETING_BULK_MAX_ITEMS: int = Field(
+        default=100,
+        description="POST /meeting/bulk 單次最多建立的會議數；整批在同一個 transaction 寫入，"
+        "過大的批次會長時間佔住 SQLite 寫入鎖，擋住其他寫入與 leader lease 續約。",
+    )
+
+    SNAPSHOT_CACHE_SIZE: int = Field(
+        default=512,
+        description="會議 / 任務快照快取各自的最大筆數。",
+    )
+
+    SNAPSHOT_CACHE_TTL_IN_SECOND: float = Field(
+        default=60,
+        description="會議 / 任務快照的保存時間（秒），寫入時會立即失效，TTL 只是保險。",
+    )
+
+    # Recurrence Configuration
+    RECURRENCE_HORIZON_IN_DAY: int = Field(
+        default=14,
+        description="重複會議只預先建立未來幾天內的任務與 Job，其餘由每日 rollover 逐步補上。",
+    )
+
+    RECURRENCE_ROLLOVER_HOUR: int = Field(
+        default=3,
+        description="每日延伸重複會議排程範圍的時間（時）。",
+    )
+
     # test configurtion
     RECORDING_DURATION_IN_MINUTE: int = Field(
         default=1, description="測試時的錄影設定時間"
@@ -139,7 +249,15 @@ _reload_callbacks: list[Callable[[set[str]], None]] = []
 _logger = logging.getLogger(__name__)
 
 # 需要重啟才能生效的欄位
-_RESTART_REQUIRED_FIELDS = {"MEETING_DB_URL", "SCHEDULER_DB_URL"}
+_RESTART_REQUIRED_FIELDS = {
+    "MEETING_DB_URL",
+    "SCHEDULER_DB_URL",
+    "SCHEDULER_JOBSTORE_IN_MEETING_DB",
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "DB_POOL_TIMEOUT_IN_SECOND",
+    "RECURRENCE_ROLLOVER_HOUR",
+}
 
 
 def register_reload_callback(callback: Callable[[set[str]], None]):
@@ -241,6 +359,11 @@ class ConfigWatcher:
         self._observer.start()
         _logger.info("ConfigWatcher 已啟動（使用 Watchdog）")
 
+    @property
+    def is_alive(self) -> bool:
+        """Watchdog observer 執行緒是否仍在運行"""
+        return self._observer is not None and self._observer.is_alive()
+
     def stop(self):
         """停止檔案監聽"""
         if self._observer is not None:
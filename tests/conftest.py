@@ -0,0 +1,50 @@
+"""
+測試共用設定
+
+shared.config 與 app.core.database 在 import 時就會讀取設定並建立 engine，
+因此必須在任何 app 模組被 import 之前，把資料庫指向暫存目錄並補齊必填欄位。
+"""
+
+import os
+import tempfile
+
+DATA_DIR = tempfile.mkdtemp(prefix="recording-meeting-test-")
+
+TEST_ENV = {
+    "MEETING_DB_URL": f"sqlite:///{DATA_DIR}/meeting.db",
+    "SCHEDULER_DB_URL": f"sqlite:///{DATA_DIR}/scheduler.db",
+    "ZOOM_SCENE_NAME": "ZOOM_APP",
+    "WEBEX_SCENE_NAME": "WEBEX_APP",
+    "DEFAULT_USER_EMAIL": "test@example.com",
+    "EMAIL_APP_PASSWORD": "",
+    "ADDRESSEES_EMAIL": "test@example.com",
+}
+
+os.environ.update(TEST_ENV)
+
+import asyncio  # noqa: E402
+
+import pytest  # noqa: E402
+
+import app.models  # noqa: E402, F401  註冊所有 ORM model
+from app.core.database import (  # noqa: E402
+    Base,
+    create_async_db_resources,
+    create_db_resources,
+)
+from app.core.migrations import run_migrations  # noqa: E402
+
+
+@pytest.fixture
+def meeting_db(tmp_path):
+    """以 initialize_db_schema 相同步驟建立的暫存會議 DB，回傳 (sync engine, async sessionmaker)"""
+    url = f"sqlite:///{tmp_path}/meeting.db"
+    engine, _ = create_db_resources(url, "Meeting")
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    async_engine, session_factory = create_async_db_resources(url, "Meeting")
+    yield engine, session_factory
+
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
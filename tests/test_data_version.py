@@ -0,0 +1,88 @@
+"""
+資料版本號標記檔的測試：bump 不在呼叫端寫檔，未變動的標記檔只 stat 不重新讀取
+"""
+
+import builtins
+import time
+
+import pytest
+
+from app.core.data_version import DataVersion
+
+EXTERNAL_TOKEN = "1-0-1"  # pid 0 不會是本行程
+
+
+@pytest.fixture
+def marker_path(tmp_path):
+    return str(tmp_path / "meeting.db.version")
+
+
+def _write(path: str, token: str):
+    with open(path, "w", encoding="ascii") as f:
+        f.write(token)
+
+
+def test_bump_is_visible_before_marker_is_written(marker_path):
+    version = DataVersion(marker_path)
+    version._pending.set = lambda: None  # 不讓背景 thread 寫入
+
+    token = version.bump()
+
+    assert version.value == token
+    version.flush()
+    with open(marker_path, encoding="ascii") as f:
+        assert f.read() == token
+    assert version.value == token
+
+
+def test_background_writer_flushes_latest_token(marker_path):
+    version = DataVersion(marker_path)
+    version.bump()
+    token = version.bump()
+
+    deadline = time.monotonic() + 5
+    while version._written != token and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with open(marker_path, encoding="ascii") as f:
+        assert f.read() == token
+
+
+def test_external_write_is_counted_once(marker_path):
+    version = DataVersion(marker_path)
+    assert version.external_changes() == 0
+
+    _write(marker_path, EXTERNAL_TOKEN)
+    assert version.external_changes() == 1
+    assert version.external_changes() == 1
+    assert version.value == EXTERNAL_TOKEN
+
+
+def test_external_write_before_local_bump_is_not_lost(marker_path):
+    version = DataVersion(marker_path)
+    version._pending.set = lambda: None
+
+    _write(marker_path, EXTERNAL_TOKEN)
+    token = version.bump()
+    version.flush()
+
+    assert version.value == token
+    assert version.external_changes() == 1
+
+
+def test_unchanged_marker_is_not_reopened(marker_path, monkeypatch):
+    _write(marker_path, EXTERNAL_TOKEN)
+    version = DataVersion(marker_path)
+    version.value
+
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    for _ in range(10):
+        version.external_changes()
+
+    assert opened == []
@@ -0,0 +1,77 @@
+"""
+API 啟動時間的回歸測試
+
+以 `python -X importtime -c "import app.main"` 在子行程中匯入 API，確認：
+- 桌面自動化套件與 app.recorder 不會在啟動時被載入（見 app.core.jobs）
+- 匯入的總時間不超過預算
+shared/log_config.yaml 不在版本庫中，子行程匯入前以空函式取代 setup_logger。
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# app.main 的累計匯入時間上限（秒），目前約 1 秒，主要是 fastapi 與 sqlalchemy
+IMPORT_TIME_BUDGET_IN_SECOND = 3.0
+
+# 只有 Job 執行時才需要的模組
+LAZY_MODULES = ("obsws_python", "pyautogui", "pyperclip", "pywinauto", "app.recorder")
+
+
+def _is_lazy_module(name: str) -> bool:
+    # pywin32 沒有共同的套件名稱，以 win32api、win32gui 等前綴辨識
+    if name.startswith("win32"):
+        return True
+    return any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES)
+
+
+# shared/log_config.yaml 是各部署自行提供的設定檔，不在版本庫中；
+# 匯入 app.main 前先換掉 setup_logger，其餘模組照常匯入
+IMPORT_APP_MAIN = (
+    "import shared.logger; shared.logger.setup_logger = lambda: None; import app.main"
+)
+
+
+def _import_app_main(tmp_path: Path) -> tuple[dict[str, int], int]:
+    """回傳 ({模組名稱: 累計匯入時間 (us)}, 所有頂層匯入的總時間 (us))"""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_APP_MAIN],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    timings: dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        timings[name.strip()] = int(cumulative)
+        # 縮排代表巢狀匯入，已計入上層的累計時間
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return timings, total
+
+
+def test_app_main_import_stays_lazy_and_within_budget(tmp_path):
+    timings, total_us = _import_app_main(tmp_path)
+
+    assert "app.main" in timings
+    eager = sorted(name for name in timings if _is_lazy_module(name))
+    assert not eager, f"啟動時不應載入：{', '.join(eager)}"
+
+    total = total_us / 1_000_000
+    assert total <= IMPORT_TIME_BUDGET_IN_SECOND, (
+        f"import app.main 花費 {total:.2f}s，超過預算 {IMPORT_TIME_BUDGET_IN_SECOND}s"
+    )
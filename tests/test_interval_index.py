@@ -0,0 +1,64 @@
+"""
+IntervalIndex 的半開區間 [start, end) 邊界測試
+"""
+
+from datetime import datetime, timedelta
+
+from app.services.interval_index import IntervalIndex
+from shared.config import TAIPEI_TZ
+
+BASE = datetime(2026, 1, 5, tzinfo=TAIPEI_TZ)
+
+
+def at(hour: float) -> datetime:
+    return BASE + timedelta(hours=hour)
+
+
+def test_touching_intervals_do_not_overlap():
+    index = IntervalIndex([(at(10), at(11), "A")])
+
+    assert index.find_overlap(at(11), at(12)) is None
+    assert index.find_overlap(at(9), at(10)) is None
+    assert index.find_overlap(at(10.5), at(11.5)) == "A"
+    assert index.find_overlap(at(9.5), at(10.5)) == "A"
+
+
+def test_long_early_interval_covers_later_query():
+    # 後面較短的區間不會遮蓋前綴中最大的 end
+    index = IntervalIndex(
+        [
+            (at(12), at(13), "B"),
+            (at(0), at(20), "long"),
+            (at(14), at(15), "C"),
+        ]
+    )
+
+    assert index.find_overlap(at(16), at(17)) == "long"
+    assert index.find_overlap(at(19.5), at(30)) == "long"
+    assert index.find_overlap(at(20), at(21)) is None
+
+
+def test_query_containing_loaded_interval_overlaps():
+    index = IntervalIndex([(at(10), at(11), "A")])
+
+    assert index.find_overlap(at(9), at(12)) == "A"
+    assert index.find_overlap(at(10), at(11)) == "A"
+
+
+def test_added_intervals_catch_batch_internal_overlap():
+    index = IntervalIndex([(at(0), at(1), "db")])
+    index.add(at(5), at(6), "second")
+    index.add(at(3), at(4), "first")
+
+    assert index.find_overlap(at(3.5), at(3.75)) == "first"
+    assert index.find_overlap(at(5.5), at(7)) == "second"
+    # 橫跨多個已加入區間時，插入位置前一個（end 最大）即可判斷
+    assert index.find_overlap(at(2), at(5.5)) == "second"
+    # 與前後都相接
+    assert index.find_overlap(at(4), at(5)) is None
+    assert index.find_overlap(at(6), at(7)) is None
+    assert index.find_overlap(at(1), at(3)) is None
+
+
+def test_empty_index_has_no_overlap():
+    assert IntervalIndex().find_overlap(at(0), at(1)) is None
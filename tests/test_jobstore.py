@@ -0,0 +1,117 @@
+"""
+CompactJobStore：Job 以具型別欄位與 JSON 儲存，讀回後與原本的 Job 等價
+"""
+
+import zoneinfo
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import create_engine
+
+from app.core.jobs import MONITOR_RECORDING, ROLLOVER_RECURRENCES, START_RECORDING
+from app.core.jobstore import CompactJobStore, _dump_trigger, _load_trigger
+from shared.config import TAIPEI_TZ
+
+UTC_PLUS_8 = timezone(timedelta(hours=8))
+
+
+@pytest.fixture
+def make_scheduler(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/scheduler.db")
+    schedulers = []
+
+    def make(tz) -> BackgroundScheduler:
+        scheduler = BackgroundScheduler(
+            jobstores={"default": CompactJobStore(engine)}, timezone=tz
+        )
+        scheduler.start(paused=True)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.shutdown(wait=False)
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "tz",
+    [TAIPEI_TZ, UTC_PLUS_8, timezone.utc, ZoneInfo("UTC")],
+    ids=["named", "fixed_offset", "utc", "zoneinfo_utc"],
+)
+@pytest.mark.parametrize(
+    "make_trigger",
+    [
+        lambda tz: CronTrigger(hour=3, timezone=tz),
+        lambda tz: IntervalTrigger(
+            minutes=5, start_date=datetime(2026, 1, 5, 10, tzinfo=tz), timezone=tz
+        ),
+    ],
+    ids=["cron", "interval"],
+)
+def test_trigger_round_trip(tz, make_trigger):
+    trigger = make_trigger(tz)
+    restored = _load_trigger(_dump_trigger(trigger))
+
+    now = datetime(2026, 1, 5, 12, tzinfo=TAIPEI_TZ)
+    assert restored.get_next_fire_time(None, now) == trigger.get_next_fire_time(
+        None, now
+    )
+    assert restored.timezone.utcoffset(now) == trigger.timezone.utcoffset(now)
+
+
+def test_keyless_zoneinfo_is_rejected():
+    """tzlocal 可能回傳以 from_file 建立、沒有 key 的 ZoneInfo"""
+    paths = [Path(root, "Asia", "Taipei") for root in zoneinfo.TZPATH]
+    path = next((p for p in paths if p.exists()), None)
+    if path is None:
+        pytest.skip("系統沒有 tz database 檔案")
+    with path.open("rb") as f:
+        tz = ZoneInfo.from_file(f)
+
+    with pytest.raises(ValueError):
+        _dump_trigger(CronTrigger(hour=3, timezone=tz))
+
+
+def test_jobs_on_fixed_offset_host_are_stored(make_scheduler):
+    """主機時區沒有名稱時，未指定 timezone 的 trigger 仍可寫入並讀回"""
+    scheduler = make_scheduler(UTC_PLUS_8)
+    scheduler.add_job(ROLLOVER_RECURRENCES, trigger="cron", hour=3, id="rollover")
+    scheduler.add_job(
+        MONITOR_RECORDING, trigger="interval", minutes=5, args=[7], id="task_monitor_7"
+    )
+    scheduler.add_job(
+        START_RECORDING,
+        trigger="date",
+        run_date=datetime(2030, 1, 1, 9, tzinfo=TAIPEI_TZ),
+        args=[7],
+        id="task_start_7",
+    )
+    expected = {job.id: job.next_run_time for job in scheduler.get_jobs()}
+
+    reloaded = make_scheduler(UTC_PLUS_8)
+    jobs = {job.id: job for job in reloaded.get_jobs()}
+
+    assert {job_id: job.next_run_time for job_id, job in jobs.items()} == expected
+    assert jobs["task_monitor_7"].args == (7,)
+    assert jobs["rollover"].trigger.timezone.utcoffset(None) == timedelta(hours=8)
+
+
+@pytest.mark.parametrize("owns_engine", [False, True], ids=["shared", "owned"])
+def test_shutdown_disposes_only_owned_engine(tmp_path, monkeypatch, owns_engine):
+    engine = create_engine(f"sqlite:///{tmp_path}/scheduler.db")
+    disposed = []
+    monkeypatch.setattr(engine, "dispose", lambda *args, **kwargs: disposed.append(1))
+
+    scheduler = BackgroundScheduler(
+        jobstores={"default": CompactJobStore(engine, owns_engine=owns_engine)}
+    )
+    scheduler.start(paused=True)
+    scheduler.shutdown(wait=False)
+
+    assert bool(disposed) == owns_engine
@@ -0,0 +1,219 @@
+"""
+API 延遲 benchmark：排程器以同步 engine 佔住 DB 寫入鎖時，多個 GUI client 同時輪詢
+/health 與 /meeting/ 的 p99
+
+比較兩種 /meeting/ 寫法（/health 相同）：
+- async：目前的 AsyncSession 路徑，等待 DB 時交還 event loop
+- blocking：user-001 之前的寫法，在 async handler 內直接使用同步 Session
+
+所有 client 與 app 共用同一個 event loop（與 uvicorn 單一 worker 相同），
+結果以 print 輸出（pytest -s 可見）。
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.controllers import health_controller, meeting_controller
+from app.core.database import (
+    Base,
+    create_async_db_resources,
+    create_db_resources,
+    get_async_db,
+)
+from app.core.health import HealthMonitor, check_obs_websocket, check_scheduler
+from app.core.migrations import run_migrations
+from app.core.responses import PydanticJSONResponse
+from app.models import MeetingORM
+from app.models.enums import LayoutType, MeetingType
+from app.models.schemas import MeetingPageSchema, MeetingQuerySchema
+from shared.config import TAIPEI_TZ, config
+
+ROUTES = ("/health", "/meeting/")
+MEETING_COUNT = 500
+GUI_CLIENTS = 8
+DURATION_IN_SECOND = 1.0
+
+# 排程器每次寫入佔住鎖的時間與兩次寫入的間隔
+WRITER_HOLD_IN_SECOND = 0.05
+WRITER_PAUSE_IN_SECOND = 0.01
+
+
+def _p99(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=100, method="inclusive")[98]
+
+
+def _seed(engine, count: int):
+    start = datetime(2026, 1, 5, 10, tzinfo=TAIPEI_TZ)
+    with Session(engine) as db:
+        db.add_all(
+            MeetingORM(
+                meeting_name=f"meeting {i}",
+                meeting_type=MeetingType.WEBEX,
+                meeting_layout=LayoutType.GRID,
+                creator_name="tester",
+                creator_email="tester@example.com",
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=50),
+                repeat=False,
+                repeat_end_date=start + timedelta(hours=i, minutes=50),
+            )
+            for i in range(count)
+        )
+        db.commit()
+
+
+def _hold_write_lock(engine, stop: threading.Event):
+    """模擬排程器 thread：反覆以 EXCLUSIVE transaction 佔住 DB"""
+    connection = engine.raw_connection()
+    try:
+        while not stop.is_set():
+            connection.execute("BEGIN EXCLUSIVE")
+            connection.execute(
+                "UPDATE meetings SET updated_at = updated_at WHERE id = 1"
+            )
+            time.sleep(WRITER_HOLD_IN_SECOND)
+            connection.commit()
+            time.sleep(WRITER_PAUSE_IN_SECOND)
+    finally:
+        connection.close()
+
+
+def _health_monitor(engine) -> HealthMonitor:
+    """
+    每次量測各自一份：HealthCheck 的 asyncio.Lock 綁定第一次使用的 event loop。
+    DB 檢查改連 benchmark DB，與 app.core.health 的檢查相同。
+    """
+
+    def check_database() -> tuple[bool, str]:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True, "可連線"
+
+    monitor = HealthMonitor()
+    monitor.register("database", check_database)
+    monitor.register("scheduler", check_scheduler)
+    monitor.register("obs_websocket", check_obs_websocket, critical=False)
+    return monitor
+
+
+def _blocking_meetings_router(session_local) -> FastAPI:
+    """user-001 之前的 /meeting/：async handler 內執行同步查詢，等待期間整個 loop 停住"""
+    app = FastAPI()
+
+    @app.get("/meeting/")
+    async def get_meetings(params: MeetingQuerySchema = Depends()):
+        with session_local() as db:
+            meetings = (
+                db.execute(
+                    select(MeetingORM)
+                    .order_by(MeetingORM.start_time, MeetingORM.id)
+                    .limit(params.limit)
+                )
+                .scalars()
+                .all()
+            )
+            page = MeetingPageSchema(items=meetings, next_cursor=None)
+        return PydanticJSONResponse(page)
+
+    return app
+
+
+async def _poll(app: FastAPI, latencies: dict[str, list[float]]):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # 暖機：建立連線池中的連線、編譯 SQL 快取，不計入延遲
+        await asyncio.gather(
+            *(client.get(path) for path in ROUTES for _ in range(GUI_CLIENTS))
+        )
+
+        async def gui_client():
+            deadline = time.monotonic() + DURATION_IN_SECOND
+            while time.monotonic() < deadline:
+                for path in ROUTES:
+                    started = time.perf_counter()
+                    response = await client.get(path)
+                    latencies[path].append(time.perf_counter() - started)
+                    assert response.status_code in (200, 503), response.text
+
+        await asyncio.gather(*(gui_client() for _ in range(GUI_CLIENTS)))
+
+
+@pytest.fixture(params=["WAL", "DELETE"])
+def journal_mode(request, monkeypatch):
+    monkeypatch.setattr(config, "SQLITE_JOURNAL_MODE", request.param)
+    return request.param
+
+
+@pytest.fixture
+def bench_db(tmp_path, journal_mode):
+    url = f"sqlite:///{tmp_path}/meeting.db"
+    engine, session_local = create_db_resources(url, "Meeting")
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    _seed(engine, MEETING_COUNT)
+
+    async_engine, session_factory = create_async_db_resources(url, "Meeting")
+    yield engine, session_local, session_factory
+
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
+
+
+def _build_app(path: str, session_local, session_factory) -> FastAPI:
+    if path == "blocking":
+        app = _blocking_meetings_router(session_local)
+    else:
+        app = FastAPI()
+        app.include_router(meeting_controller.router)
+
+        async def override_get_async_db():
+            async with session_factory() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+
+    app.include_router(health_controller.router)
+    return app
+
+
+def _measure(bench_db, path: str, monkeypatch) -> dict[str, float]:
+    engine, session_local, session_factory = bench_db
+    app = _build_app(path, session_local, session_factory)
+    monkeypatch.setattr(health_controller, "health_monitor", _health_monitor(engine))
+    latencies: dict[str, list[float]] = {path: [] for path in ROUTES}
+
+    stop = threading.Event()
+    writer = threading.Thread(target=_hold_write_lock, args=(engine, stop), daemon=True)
+    writer.start()
+    try:
+        asyncio.run(_poll(app, latencies))
+    finally:
+        stop.set()
+        writer.join()
+
+    return {route: _p99(values) for route, values in latencies.items()}
+
+
+def test_p99_latency_with_concurrent_writer(bench_db, journal_mode, monkeypatch):
+    async_p99 = _measure(bench_db, "async", monkeypatch)
+    blocking_p99 = _measure(bench_db, "blocking", monkeypatch)
+
+    for route in ROUTES:
+        print(
+            f"\n[{journal_mode}] {route} p99: "
+            f"async {async_p99[route] * 1000:.1f}ms, "
+            f"blocking {blocking_p99[route] * 1000:.1f}ms"
+        )
+
+    if journal_mode == "DELETE":
+        # 寫入鎖擋住讀取：同步查詢在 loop 上等待，/health 也跟著排隊
+        assert async_p99["/health"] < blocking_p99["/health"]
@@ -0,0 +1,115 @@
+"""
+排程器 leader lease 的測試：續約失敗時必須在 lease 到期前 pause 排程器
+"""
+
+import threading
+import time
+
+import pytest
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING
+
+from app.core.database import create_db_resources
+from app.core.leader import SchedulerLeader
+from shared.config import config
+
+LEASE_TTL_IN_SECOND = 1.0
+LEASE_RENEW_IN_SECOND = 0.2
+BUSY_TIMEOUT_IN_MS = 300
+
+
+@pytest.fixture
+def fast_lease(monkeypatch):
+    monkeypatch.setattr(config, "SCHEDULER_LEASE_TTL_IN_SECOND", LEASE_TTL_IN_SECOND)
+    monkeypatch.setattr(
+        config, "SCHEDULER_LEASE_RENEW_IN_SECOND", LEASE_RENEW_IN_SECOND
+    )
+    monkeypatch.setattr(config, "SQLITE_BUSY_TIMEOUT_IN_MS", BUSY_TIMEOUT_IN_MS)
+
+
+@pytest.fixture
+def leader(tmp_path, fast_lease):
+    engine, _ = create_db_resources(f"sqlite:///{tmp_path}/scheduler.db", "Scheduler")
+    scheduler = BackgroundScheduler(jobstores={"default": MemoryJobStore()})
+    scheduler.start(paused=True)
+    leader = SchedulerLeader(scheduler, engine)
+
+    yield leader
+
+    leader.stop()
+    scheduler.shutdown(wait=False)
+    engine.dispose()
+
+
+def _wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "等待逾時"
+        time.sleep(0.01)
+
+
+def _record_pause(leader: SchedulerLeader) -> list[float]:
+    paused_at: list[float] = []
+    real_pause = leader.scheduler.pause
+
+    def pause():
+        paused_at.append(time.monotonic())
+        real_pause()
+
+    leader.scheduler.pause = pause
+    return paused_at
+
+
+def _start_as_leader(leader: SchedulerLeader):
+    leader.start()
+    _wait_until(lambda: leader.is_leader)
+    assert leader.scheduler.state == STATE_RUNNING
+
+
+def test_renewal_error_pauses_before_lease_expires(leader):
+    _start_as_leader(leader)
+    paused_at = _record_pause(leader)
+
+    def fail():
+        raise RuntimeError("database is locked")
+
+    leader._try_acquire = fail
+    lease_deadline = leader._lease_deadline
+
+    _wait_until(lambda: paused_at)
+    assert paused_at[0] < lease_deadline
+    assert leader.scheduler.state == STATE_PAUSED
+    assert not leader.is_leader
+
+
+def test_blocked_renewal_pauses_before_lease_expires(leader):
+    """續約呼叫卡住超過 TTL（例如等待 DB 鎖）時，計時器仍會在到期前 pause"""
+    _start_as_leader(leader)
+    paused_at = _record_pause(leader)
+    release = threading.Event()
+
+    def block():
+        release.wait(LEASE_TTL_IN_SECOND * 2)
+        raise RuntimeError("database is locked")
+
+    leader._try_acquire = block
+    lease_deadline = leader._lease_deadline
+
+    try:
+        _wait_until(lambda: paused_at)
+        assert paused_at[0] < lease_deadline
+        assert leader.scheduler.state == STATE_PAUSED
+    finally:
+        release.set()
+
+
+def test_successful_renewal_keeps_leader_running(leader):
+    _start_as_leader(leader)
+    paused_at = _record_pause(leader)
+
+    time.sleep(LEASE_TTL_IN_SECOND * 2)
+
+    assert paused_at == []
+    assert leader.is_leader
+    assert leader.scheduler.state == STATE_RUNNING
@@ -0,0 +1,52 @@
+"""
+POST /meeting/bulk 的批次大小上限
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.controllers.dependencies import get_meeting_service
+from app.controllers.meeting_controller import router
+from app.core.exceptions import register_exception_handlers
+from app.models.schemas import MeetingBulkResponseSchema
+from shared.config import config
+
+
+class RecordingMeetingService:
+    def __init__(self):
+        self.batches = []
+
+    async def create_meetings_bulk(self, items):
+        self.batches.append(items)
+        return MeetingBulkResponseSchema(created=0, failed=len(items), results=[])
+
+
+@pytest.fixture
+def service():
+    return RecordingMeetingService()
+
+
+@pytest.fixture
+def client(service, monkeypatch):
+    monkeypatch.setattr(config, "MEETING_BULK_MAX_ITEMS", 3)
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(router)
+    app.dependency_overrides[get_meeting_service] = lambda: service
+    return TestClient(app)
+
+
+def test_bulk_at_limit_is_accepted(client, service):
+    response = client.post("/meeting/bulk", json=[{}] * 3)
+
+    assert response.status_code == 200
+    assert len(service.batches) == 1
+
+
+def test_bulk_over_limit_is_rejected_before_service(client, service):
+    response = client.post("/meeting/bulk", json=[{}] * 4)
+
+    assert response.status_code == 422
+    assert "3" in response.json()["detail"]
+    assert service.batches == []
@@ -0,0 +1,236 @@
+"""
+版本化 migration 與熱門查詢索引的測試
+
+從 baseline 版本（只有 create_all 的 meetings / tasks）的資料庫開始升級，
+再以 EXPLAIN QUERY PLAN 確認服務層實際送出的 SQL 都使用 migration 2 的索引。
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from app.core.database import create_async_db_resources, create_db_resources
+from app.core.migrations import MIGRATIONS, run_migrations
+from app.models.schemas import MeetingQuerySchema, TaskQuerySchema
+from app.services.meeting_service import MeetingService
+from app.services.task_service import TaskService
+from shared.config import TAIPEI_TZ
+
+# migration 系統加入前，create_all 在既有部署上建立的 schema
+BASELINE_SCHEMA = (
+    """
+    CREATE TABLE meetings (
+        id INTEGER NOT NULL,
+        meeting_name VARCHAR(100) NOT NULL,
+        meeting_type VARCHAR(5) NOT NULL,
+        meeting_url VARCHAR(200),
+        room_id VARCHAR(50),
+        meeting_password VARCHAR(50),
+        meeting_layout VARCHAR(17),
+        creator_name VARCHAR(100) NOT NULL,
+        creator_email VARCHAR(100) NOT NULL,
+        start_time DATETIME NOT NULL,
+        end_time DATETIME NOT NULL,
+        repeat BOOLEAN NOT NULL,
+        repeat_unit INTEGER,
+        repeat_end_date DATETIME,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX ix_meetings_id ON meetings (id)",
+    """
+    CREATE TABLE tasks (
+        id INTEGER NOT NULL,
+        status VARCHAR(9) NOT NULL,
+        start_time DATETIME NOT NULL,
+        end_time DATETIME NOT NULL,
+        duration_minutes INTEGER,
+        save_path VARCHAR(200),
+        meeting_id INTEGER NOT NULL,
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(meeting_id) REFERENCES meetings (id)
+    )
+    """,
+    "CREATE INDEX ix_tasks_id ON tasks (id)",
+    "CREATE INDEX ix_tasks_meeting_id ON tasks (meeting_id)",
+)
+
+ALL_VERSIONS = sorted(m.version for m in MIGRATIONS)
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path}/meeting.db"
+
+
+@pytest.fixture
+def baseline_engine(db_url):
+    engine, _ = create_db_resources(db_url, "Meeting")
+    with engine.begin() as conn:
+        for ddl in BASELINE_SCHEMA:
+            conn.execute(text(ddl))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def migrated_engine(baseline_engine):
+    run_migrations(baseline_engine)
+    return baseline_engine
+
+
+# ----- 升級與重複執行 -----
+
+
+def test_run_migrations_upgrades_baseline_schema(baseline_engine):
+    assert run_migrations(baseline_engine) == ALL_VERSIONS
+
+    inspector = inspect(baseline_engine)
+    task_indexes = {index["name"] for index in inspector.get_indexes("tasks")}
+    meeting_indexes = {index["name"] for index in inspector.get_indexes("meetings")}
+    meeting_columns = {column["name"] for column in inspector.get_columns("meetings")}
+
+    assert {
+        "ix_tasks_status_start_time_end_time",
+        "ix_tasks_start_time_end_time",
+    } <= task_indexes
+    assert {
+        "ix_meetings_start_time",
+        "ix_meetings_meeting_name",
+        "ix_meetings_repeat_end_time",
+        "ix_meetings_repeat_repeat_end_date",
+    } <= meeting_indexes
+    assert {"materialized_until", "repeat_rule", "repeat_exdates"} <= meeting_columns
+    assert "meetings_fts" in inspector.get_table_names()
+
+
+def test_run_migrations_twice_is_noop(migrated_engine):
+    assert run_migrations(migrated_engine) == []
+
+
+def test_migrations_can_be_reapplied(migrated_engine):
+    """另一個 worker 在版本號寫入前重跑 migration 內容時不會失敗"""
+    with migrated_engine.begin() as conn:
+        conn.execute(text("DELETE FROM schema_version"))
+
+    assert run_migrations(migrated_engine) == ALL_VERSIONS
+    assert run_migrations(migrated_engine) == []
+
+
+# ----- EXPLAIN QUERY PLAN -----
+
+
+def _capture_statements(db_url: str, call) -> list[tuple[str, tuple]]:
+    """以服務層的 async session 執行 call(session)，回傳送出的 SELECT 與參數"""
+    engine, session_factory = create_async_db_resources(db_url, "Meeting")
+    statements: list[tuple[str, tuple]] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, tuple(parameters)))
+
+    async def run():
+        async with session_factory() as session:
+            await call(session)
+        await engine.dispose()
+
+    asyncio.run(run())
+    assert statements
+    return statements
+
+
+def _query_plan(engine, statement: str, parameters: tuple) -> list[str]:
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+def _assert_uses_index(plan: list[str], table: str, index: str, ordered: bool = True):
+    """ordered：ORDER BY 也由索引完成，不需另外排序"""
+    assert any(
+        line.startswith((f"SEARCH {table} ", f"SCAN {table} "))
+        and line.split(" INDEX ", 1)[-1].split(" ")[0] == index
+        for line in plan
+    ), plan
+    assert f"SCAN {table}" not in plan, plan
+    if ordered:
+        assert not any("TEMP B-TREE" in line for line in plan), plan
+
+
+NOW = datetime.now(tz=TAIPEI_TZ)
+
+
+def test_overlap_check_uses_status_time_index(db_url, migrated_engine):
+    async def call(session):
+        await TaskService(session)._load_active_intervals(NOW, NOW + timedelta(days=14))
+
+    [(statement, parameters)] = _capture_statements(db_url, call)
+    plan = _query_plan(migrated_engine, statement, parameters)
+
+    # status IN (...) 是兩段索引範圍，合併後依 start_time 排序的成本與結果筆數成正比
+    _assert_uses_index(
+        plan, "tasks", "ix_tasks_status_start_time_end_time", ordered=False
+    )
+    assert any("COVERING INDEX" in line for line in plan), plan
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        TaskQuerySchema(),
+        TaskQuerySchema(start_time_ge=NOW),
+        TaskQuerySchema(start_time_ge=NOW, end_time_le=NOW + timedelta(days=7)),
+    ],
+    ids=["unfiltered", "start_time_ge", "time_range"],
+)
+def test_get_all_tasks_uses_start_time_index(db_url, migrated_engine, params):
+    async def call(session):
+        await TaskService(session).get_all_tasks(params)
+
+    [(statement, parameters)] = _capture_statements(db_url, call)
+    plan = _query_plan(migrated_engine, statement, parameters)
+
+    _assert_uses_index(plan, "tasks", "ix_tasks_start_time_end_time")
+    assert "SCAN meetings" not in plan, plan
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize(
+    ("sort_by", "index"),
+    [
+        ("start_time", "ix_meetings_start_time"),
+        ("meeting_name", "ix_meetings_meeting_name"),
+    ],
+)
+def test_get_meetings_sort_uses_index(db_url, migrated_engine, sort_by, index, order):
+    params = MeetingQuerySchema(sort_by=sort_by, order=order)
+
+    async def call(session):
+        await MeetingService(session, TaskService(session)).get_meetings(params)
+
+    [(statement, parameters)] = _capture_statements(db_url, call)
+    plan = _query_plan(migrated_engine, statement, parameters)
+
+    _assert_uses_index(plan, "meetings", index)
+
+
+def test_get_meetings_upcoming_only_uses_both_branch_indexes(db_url, migrated_engine):
+    params = MeetingQuerySchema(upcoming_only=True)
+
+    async def call(session):
+        await MeetingService(session, TaskService(session)).get_meetings(params)
+
+    [(statement, parameters)] = _capture_statements(db_url, call)
+    plan = _query_plan(migrated_engine, statement, parameters)
+
+    assert "MULTI-INDEX OR" in plan, plan
+    for index in ("ix_meetings_repeat_repeat_end_date", "ix_meetings_repeat_end_time"):
+        assert any(f"USING INDEX {index} " in line for line in plan), plan
+    assert "SCAN meetings" not in plan, plan
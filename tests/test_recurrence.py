@@ -0,0 +1,32 @@
+"""
+Recurrence.nth_occurrence 與逐一略過排除日期的結果一致
+"""
+
+import random
+from datetime import date, datetime
+
+import pytest
+
+from app.models.recurrence import Recurrence, RecurrenceRule
+from shared.config import TAIPEI_TZ
+
+START = datetime(2026, 1, 5, 10, tzinfo=TAIPEI_TZ)
+
+
+@pytest.mark.parametrize(
+    "rule",
+    ["FREQ=DAILY;INTERVAL=2", "FREQ=WEEKLY;BYDAY=MO,TH", "FREQ=MONTHLY;BYDAY=-1TU"],
+)
+def test_nth_occurrence_skips_exdates(rule):
+    rng = random.Random(rule)
+    plain = Recurrence(RecurrenceRule.parse(rule), START)
+    raw = [plain.nth_occurrence(i) for i in range(120)]
+
+    for _ in range(50):
+        exdates = rng.sample([o.date() for o in raw[:60]], rng.randint(0, 40))
+        # 不在時段上的日期不影響編號
+        exdates.append(date(2026, 1, 1))
+        recurrence = Recurrence(RecurrenceRule.parse(rule), START, exdates=exdates)
+
+        kept = [o for o in raw if o.date() not in exdates]
+        assert [recurrence.nth_occurrence(n) for n in range(50)] == kept[:50]
@@ -0,0 +1,214 @@
+"""
+PydanticJSONResponse 與原本 response_model + jsonable_encoder 的輸出一致
+（包含 CustomBaseModel json_encoders 的 TAIPEI_TZ 時間格式），
+以及 10k 筆列表兩種寫法的耗時比較
+"""
+
+import json
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.responses import PydanticJSONResponse
+from app.models.enums import LayoutType, MeetingType, TaskStatus
+from app.models.schemas import (
+    MeetingListAdapter,
+    MeetingPageSchema,
+    MeetingResponseSchema,
+    TaskListAdapter,
+    TaskResponseSchema,
+    TaskStatsBucketSchema,
+    TaskStatsSchema,
+)
+from shared.config import TAIPEI_TZ
+
+START = datetime(2026, 3, 2, 9, 30, tzinfo=TAIPEI_TZ)
+# DB 讀出的 created_at / updated_at 沒有時區；另有 UTC 時間確認會轉為 TAIPEI_TZ
+NAIVE = datetime(2026, 3, 1, 12, 0, 0, 123456)
+UTC = datetime(2026, 3, 1, 4, 0, tzinfo=timezone.utc)
+
+MEETINGS = [
+    MeetingResponseSchema(
+        id=i,
+        meeting_name=f'週會 {i} "quoted" \\ ✓',
+        meeting_type=MeetingType.WEBEX if i % 2 else MeetingType.ZOOM,
+        meeting_url=None if i % 3 else f"https://example.com/{i}",
+        room_id="123 456",
+        meeting_password="pw",
+        meeting_layout=LayoutType.GRID,
+        creator_name="王小明",
+        creator_email="owner@example.com",
+        start_time=START + timedelta(days=i),
+        end_time=START + timedelta(days=i, hours=1),
+        repeat=bool(i % 2),
+        repeat_unit=7 if i % 2 else None,
+        repeat_end_date=START + timedelta(days=90),
+        repeat_rule="FREQ=WEEKLY;BYDAY=MO,TH" if i % 2 else None,
+        repeat_exdates=[date(2026, 4, 6)] if i % 2 else [],
+        created_at=NAIVE,
+        updated_at=UTC,
+    )
+    for i in range(1, 6)
+]
+
+TASKS = [
+    TaskResponseSchema(
+        id=i,
+        meeting_id=i,
+        created_at=NAIVE,
+        updated_at=UTC,
+        status=list(TaskStatus)[i % len(TaskStatus)],
+        save_path=None if i % 2 else f"C:\\recordings\\會議_{i}.mp4",
+        meeting_name=meeting.meeting_name,
+        meeting_type=meeting.meeting_type,
+        start_time=meeting.start_time,
+        end_time=meeting.end_time,
+        creator_name=meeting.creator_name,
+        creator_email=meeting.creator_email,
+    )
+    for i, meeting in enumerate(MEETINGS, start=1)
+]
+
+BUCKET = TaskStatsBucketSchema(
+    key="all",
+    total=5,
+    counts={"completed": 3, "error": 1, "upcoming": 1},
+    success_rate=0.75,
+    recorded_minutes=180,
+)
+STATS = TaskStatsSchema(
+    overall=BUCKET, by_meeting_type=[BUCKET], by_day=[BUCKET], by_week=[]
+)
+PAGE = MeetingPageSchema(items=MEETINGS, next_cursor="abc")
+
+BULK_ROWS = 10_000
+BULK_MEETINGS = [
+    MEETINGS[i % len(MEETINGS)].model_copy(update={"id": i}) for i in range(BULK_ROWS)
+]
+
+app = FastAPI()
+
+
+@app.get("/old/meetings", response_model=List[MeetingResponseSchema])
+async def old_meetings():
+    return MEETINGS
+
+
+@app.get("/new/meetings")
+async def new_meetings():
+    return PydanticJSONResponse(MEETINGS, adapter=MeetingListAdapter)
+
+
+@app.get("/old/tasks", response_model=List[TaskResponseSchema])
+async def old_tasks():
+    return TASKS
+
+
+@app.get("/new/tasks")
+async def new_tasks():
+    return PydanticJSONResponse(TASKS, adapter=TaskListAdapter)
+
+
+@app.get("/old/page", response_model=MeetingPageSchema)
+async def old_page():
+    return PAGE
+
+
+@app.get("/new/page")
+async def new_page():
+    return PydanticJSONResponse(PAGE)
+
+
+@app.get("/old/stats", response_model=TaskStatsSchema)
+async def old_stats():
+    return STATS
+
+
+@app.get("/new/stats")
+async def new_stats():
+    return PydanticJSONResponse(STATS)
+
+
+@app.get("/old/bulk", response_model=List[MeetingResponseSchema])
+async def old_bulk():
+    return BULK_MEETINGS
+
+
+@app.get("/new/bulk")
+async def new_bulk():
+    return PydanticJSONResponse(BULK_MEETINGS, adapter=MeetingListAdapter)
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["meetings", "tasks", "page", "stats"])
+def test_pydantic_response_matches_response_model_output(path):
+    old = client.get(f"/old/{path}")
+    new = client.get(f"/new/{path}")
+
+    assert old.status_code == new.status_code == 200
+    assert new.headers["content-type"] == old.headers["content-type"]
+    assert new.json() == old.json()
+
+
+def test_datetimes_are_formatted_in_taipei_time():
+    task = client.get("/new/tasks").json()[0]
+
+    assert task["start_time"] == TASKS[0].start_time.isoformat()
+    assert task["updated_at"] == UTC.astimezone(TAIPEI_TZ).isoformat()
+    assert task["updated_at"].endswith("+08:00")
+
+
+def _best_of(render, runs: int = 5) -> tuple[float, bytes]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        body = render()
+        timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+
+def _get(path: str) -> bytes:
+    response = client.get(path)
+    assert response.status_code == 200
+    return response.content
+
+
+def test_bulk_list_timing_through_endpoints():
+    """
+    較新的 FastAPI 在預設 response class 下，response_model 也直接以 pydantic-core 輸出 JSON，
+    兩者應該同一量級；這裡確認 PydanticJSONResponse 不會比較慢
+    """
+    old_time, old_body = _best_of(lambda: _get("/old/bulk"))
+    new_time, new_body = _best_of(lambda: _get("/new/bulk"))
+
+    print(
+        f"\n{BULK_ROWS} 筆會議（endpoint）：response_model {old_time * 1000:.0f}ms，"
+        f"PydanticJSONResponse {new_time * 1000:.0f}ms"
+    )
+    assert json.loads(new_body) == json.loads(old_body)
+    assert new_time < old_time * 1.5
+
+
+def test_bulk_list_serializes_faster_than_jsonable_encoder():
+    """沒有走 pydantic-core 的舊路徑：jsonable_encoder 轉成 dict 後再 json.dumps"""
+    old_time, old_body = _best_of(
+        lambda: JSONResponse(jsonable_encoder(BULK_MEETINGS)).body
+    )
+    new_time, new_body = _best_of(
+        lambda: PydanticJSONResponse(BULK_MEETINGS, adapter=MeetingListAdapter).body
+    )
+
+    print(
+        f"\n{BULK_ROWS} 筆會議（序列化）：jsonable_encoder {old_time * 1000:.0f}ms，"
+        f"PydanticJSONResponse {new_time * 1000:.0f}ms（{old_time / new_time:.1f}x）"
+    )
+    assert json.loads(new_body) == json.loads(old_body)
+    assert new_time < old_time
@@ -0,0 +1,60 @@
+"""
+排程器啟動時註冊的固定 Job
+"""
+
+import pytest
+from apscheduler.events import EVENT_JOB_ADDED, EVENT_JOB_MODIFIED
+from apscheduler.jobstores.memory import MemoryJobStore
+
+import app.core.scheduler as scheduler_module
+from app.core.jobs import ROLLOVER_JOB_ID
+from app.core.scheduler import RecordingScheduler, schedule_recurrence_rollover
+from shared.config import TAIPEI_TZ, config
+
+
+@pytest.fixture
+def paused_scheduler(monkeypatch):
+    scheduler = RecordingScheduler(
+        jobstores={"default": MemoryJobStore()}, timezone="UTC"
+    )
+    scheduler.start(paused=True)
+    monkeypatch.setattr(scheduler_module, "scheduler", scheduler)
+    yield scheduler
+    scheduler.shutdown(wait=False)
+
+
+def test_rollover_runs_in_taipei_time(paused_scheduler):
+    schedule_recurrence_rollover()
+
+    job = paused_scheduler.get_job(ROLLOVER_JOB_ID)
+    assert job.trigger.timezone == TAIPEI_TZ
+    next_run = job.next_run_time.astimezone(TAIPEI_TZ)
+    assert (next_run.hour, next_run.minute) == (config.RECURRENCE_ROLLOVER_HOUR, 0)
+    assert job.misfire_grace_time is None
+    assert job.coalesce
+
+
+def test_rollover_is_not_rewritten_on_restart(paused_scheduler, monkeypatch):
+    events = []
+    paused_scheduler.add_listener(
+        lambda event: events.append(event.code), EVENT_JOB_ADDED | EVENT_JOB_MODIFIED
+    )
+
+    schedule_recurrence_rollover()
+    next_run = paused_scheduler.get_job(ROLLOVER_JOB_ID).next_run_time
+    schedule_recurrence_rollover()
+
+    assert events == [EVENT_JOB_ADDED]
+    assert paused_scheduler.get_job(ROLLOVER_JOB_ID).next_run_time == next_run
+
+    # 設定的時間變更後才改寫
+    monkeypatch.setattr(
+        config, "RECURRENCE_ROLLOVER_HOUR", (config.RECURRENCE_ROLLOVER_HOUR + 1) % 24
+    )
+    schedule_recurrence_rollover()
+
+    assert len(events) == 2
+    next_run = paused_scheduler.get_job(ROLLOVER_JOB_ID).next_run_time.astimezone(
+        TAIPEI_TZ
+    )
+    assert next_run.hour == config.RECURRENCE_ROLLOVER_HOUR
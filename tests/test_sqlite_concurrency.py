@@ -0,0 +1,126 @@
+"""
+SQLite storage profile 的併發寫入壓力測試
+
+排程器的 worker threads（同步 engine）與 API 的 async session 同時寫入同一個檔案 DB，
+在設定的 PRAGMA（WAL、busy_timeout）下不應出現 "database is locked"。
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models import MeetingORM, TaskORM
+from app.models.enums import MeetingType, TaskStatus
+from shared.config import TAIPEI_TZ
+
+# 與 scheduler 的 ThreadPoolExecutor(20) 相同
+SYNC_WRITERS = 20
+ASYNC_WRITERS = 10
+WRITES_PER_WRITER = 10
+
+# 每個寫入 transaction 在 commit 前佔住寫入鎖的時間，模擬較慢的 Job
+HOLD_IN_SECOND = 0.002
+
+START = datetime(2026, 1, 5, 10, tzinfo=TAIPEI_TZ)
+
+
+def _meeting(name: str) -> MeetingORM:
+    return MeetingORM(
+        meeting_name=name,
+        meeting_type=MeetingType.WEBEX,
+        creator_name="tester",
+        creator_email="tester@example.com",
+        start_time=START,
+        end_time=START + timedelta(hours=1),
+        repeat=False,
+        repeat_end_date=START + timedelta(hours=1),
+    )
+
+
+def _seed_tasks(engine, count: int) -> list[int]:
+    with Session(engine) as db:
+        meeting = _meeting("scheduled")
+        db.add(meeting)
+        db.flush()
+        tasks = [
+            TaskORM(
+                meeting_id=meeting.id,
+                status=TaskStatus.UPCOMING,
+                start_time=START + timedelta(days=i),
+                end_time=START + timedelta(days=i, hours=1),
+            )
+            for i in range(count)
+        ]
+        db.add_all(tasks)
+        db.commit()
+        return [task.id for task in tasks]
+
+
+def _sync_writer(engine, task_id: int, errors: list[Exception]):
+    """與 recorder 的 _set_task_status 相同：讀出最新狀態後更新"""
+    for i in range(WRITES_PER_WRITER):
+        try:
+            with Session(engine) as db:
+                task = db.get(TaskORM, task_id)
+                task.status = TaskStatus.RECORDING if i % 2 else TaskStatus.UPCOMING
+                db.flush()
+                time.sleep(HOLD_IN_SECOND)
+                db.commit()
+        except OperationalError as e:
+            errors.append(e)
+
+
+async def _async_writer(session_factory, writer: int, errors: list[Exception]):
+    for i in range(WRITES_PER_WRITER):
+        try:
+            async with session_factory() as session:
+                session.add(_meeting(f"api {writer}-{i}"))
+                await session.flush()
+                await asyncio.sleep(HOLD_IN_SECOND)
+                await session.commit()
+        except OperationalError as e:
+            errors.append(e)
+
+
+def test_sync_threads_and_async_writes_do_not_hit_locked(meeting_db):
+    engine, session_factory = meeting_db
+    task_ids = _seed_tasks(engine, SYNC_WRITERS)
+    errors: list[Exception] = []
+
+    threads = [
+        threading.Thread(target=_sync_writer, args=(engine, task_id, errors))
+        for task_id in task_ids
+    ]
+
+    async def run_api_writers():
+        await asyncio.gather(
+            *(_async_writer(session_factory, w, errors) for w in range(ASYNC_WRITERS))
+        )
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    asyncio.run(run_api_writers())
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    total = (SYNC_WRITERS + ASYNC_WRITERS) * WRITES_PER_WRITER
+    print(f"\n{total} 筆寫入交錯完成，耗時 {elapsed:.2f}s")
+
+    locked = [e for e in errors if "database is locked" in str(e)]
+    assert not locked, f"{len(locked)} 次 database is locked：{locked[0]}"
+    assert not errors, errors[0]
+
+    with Session(engine) as db:
+        api_meetings = db.scalar(
+            select(func.count())
+            .select_from(MeetingORM)
+            .where(MeetingORM.meeting_name.like("api %"))
+        )
+    assert api_meetings == ASYNC_WRITERS * WRITES_PER_WRITER
@@ -0,0 +1,200 @@
+"""
+TaskService：
+- 重疊檢查（單一範圍查詢 + IntervalIndex）
+- GET /tasks/scheduler/jobs 的查詢數與 Job 數量無關（jobstore 一次、會議 DB 一次）
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import TaskOverlapError
+from app.core.jobs import END_RECORDING, START_RECORDING
+from app.core.jobstore import CompactJobStore
+from app.core.scheduler import RecordingScheduler
+from app.models import MeetingORM, TaskORM
+from app.models.enums import MeetingType, TaskStatus
+from app.services.task_service import TaskService
+from shared.config import TAIPEI_TZ
+
+TOMORROW = (datetime.now(TAIPEI_TZ) + timedelta(days=1)).replace(
+    hour=10, minute=0, second=0, microsecond=0
+)
+
+
+def _meeting(
+    name: str, start: datetime, hours: float, repeat_days: int = 0
+) -> MeetingORM:
+    return MeetingORM(
+        meeting_name=name,
+        meeting_type=MeetingType.WEBEX,
+        creator_name="tester",
+        creator_email="tester@example.com",
+        start_time=start,
+        end_time=start + timedelta(hours=hours),
+        repeat=bool(repeat_days),
+        repeat_unit=1 if repeat_days else None,
+        repeat_end_date=start + timedelta(days=repeat_days) if repeat_days else None,
+    )
+
+
+def _plan(session_factory, meetings):
+    async def run():
+        async with session_factory() as session:
+            return await TaskService(session).plan_tasks_bulk(meetings)
+
+    return asyncio.run(run())
+
+
+def test_bulk_rejects_second_of_two_overlapping_occurrences(meeting_db):
+    _, session_factory = meeting_db
+    daily = _meeting("daily", TOMORROW, 1, repeat_days=2)
+    clash = _meeting("clash", TOMORROW + timedelta(days=1, minutes=30), 1)
+    touching = _meeting("touching", TOMORROW + timedelta(hours=1), 1)
+
+    results = _plan(session_factory, [daily, clash, touching])
+
+    assert results[0] == [
+        (TOMORROW + timedelta(days=d), TOMORROW + timedelta(days=d, hours=1))
+        for d in range(3)
+    ]
+    assert isinstance(results[1], TaskOverlapError)
+    assert "daily" in results[1].detail
+    assert results[2] == [(touching.start_time, touching.end_time)]
+
+
+def test_bulk_reports_overlap_with_existing_task(meeting_db):
+    engine, session_factory = meeting_db
+    existing = _meeting("existing", TOMORROW, 2)
+    with Session(engine) as db:
+        db.add(existing)
+        db.flush()
+        db.add(
+            TaskORM(
+                meeting_id=existing.id,
+                status=TaskStatus.UPCOMING,
+                start_time=existing.start_time,
+                end_time=existing.end_time,
+            )
+        )
+        db.commit()
+
+    results = _plan(
+        session_factory,
+        [
+            _meeting("inside", TOMORROW + timedelta(minutes=30), 0.5),
+            _meeting("after", TOMORROW + timedelta(hours=2), 1),
+        ],
+    )
+
+    assert isinstance(results[0], TaskOverlapError)
+    assert results[1] == [
+        (TOMORROW + timedelta(hours=2), TOMORROW + timedelta(hours=3))
+    ]
+
+
+# ----- GET /tasks/scheduler/jobs -----
+
+
+@pytest.fixture
+def jobstore_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/scheduler.db")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def paused_scheduler(jobstore_engine):
+    scheduler = RecordingScheduler(
+        jobstores={"default": CompactJobStore(jobstore_engine)},
+        timezone=TAIPEI_TZ,
+    )
+    scheduler.start(paused=True)
+    yield scheduler
+    scheduler.shutdown(wait=False)
+
+
+def _seed_scheduled_tasks(engine, scheduler, count: int):
+    with Session(engine) as db:
+        tasks = []
+        for i in range(count):
+            start = TOMORROW + timedelta(hours=i)
+            meeting = MeetingORM(
+                meeting_name=f"meeting {i}",
+                meeting_type=MeetingType.WEBEX,
+                creator_name="tester",
+                creator_email="tester@example.com",
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                repeat=False,
+            )
+            task = TaskORM(
+                meeting=meeting,
+                status=TaskStatus.UPCOMING,
+                start_time=meeting.start_time,
+                end_time=meeting.end_time,
+            )
+            db.add(task)
+            tasks.append(task)
+        db.commit()
+
+        scheduler.add_date_jobs(
+            [
+                {
+                    "func": func,
+                    "args": [task.id],
+                    "id": f"task_{kind}_{task.id}",
+                    "name": f"{kind} {task.id}",
+                    "run_date": run_date,
+                }
+                for task in tasks
+                for kind, func, run_date in (
+                    ("start", START_RECORDING, task.start_time),
+                    ("end", END_RECORDING, task.end_time),
+                )
+            ]
+        )
+
+
+def _list_jobs_counting_queries(session_factory, scheduler, engines):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", record)
+
+    async def run():
+        async with session_factory() as session:
+            service = TaskService(session)
+            service.scheduler = scheduler
+            return await service.get_scheduler_jobs()
+
+    try:
+        jobs = asyncio.run(run())
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", record)
+    return jobs, statements
+
+
+@pytest.mark.parametrize("count", [1, 50])
+def test_scheduler_jobs_query_count_is_constant(
+    meeting_db, jobstore_engine, paused_scheduler, count
+):
+    engine, session_factory = meeting_db
+    _seed_scheduled_tasks(engine, paused_scheduler, count)
+    async_engine = session_factory.kw["bind"]
+
+    jobs, statements = _list_jobs_counting_queries(
+        session_factory, paused_scheduler, [jobstore_engine, async_engine.sync_engine]
+    )
+
+    assert len(jobs) == 2 * count
+    assert {job["name"] for job in jobs} == {f"meeting {i}" for i in range(count)}
+    # jobstore 列表一次 + 任務 / 會議名稱的 IN 查詢一次
+    assert len(statements) == 2, statements